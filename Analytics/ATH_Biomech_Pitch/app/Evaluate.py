@@ -3,7 +3,6 @@ import pandas as pd
 import numpy as np
 import zipfile
 import io
-import joblib
 import matplotlib.pyplot as plt
 import seaborn as sns
 import scipy.stats as stats
@@ -17,6 +16,7 @@ from sklearn.metrics import (
     r2_score
 )
 from utils import config
+from app import structure
 
 # ------------------------------
 # 🔹 Paths
@@ -73,6 +73,21 @@ def generate_word_report(row, img_dir, model_name):
     buffer.seek(0)
     return buffer
 
+# ------------------------------
+# 🔁 Cross-Validation Predictions
+# ------------------------------
+def plot_cv_predictions(cv_preds, title):
+    fig, ax = plt.subplots()
+    for fold, fold_df in cv_preds.groupby("fold"):
+        ax.scatter(fold_df["y_true"], fold_df["y_pred"], alpha=0.5, s=12, label=f"Fold {fold}")
+    lims = [cv_preds["y_true"].min(), cv_preds["y_true"].max()]
+    ax.plot(lims, lims, "r--")
+    ax.set_xlabel("Actual")
+    ax.set_ylabel("Out-of-Fold Predicted")
+    ax.set_title(title)
+    ax.legend(fontsize="small")
+    return fig
+
 # ------------------------------
 # 🔷 Streamlit Page
 # ------------------------------
@@ -96,7 +111,7 @@ def show():
         """)
 
     try:
-        metrics_df = pd.read_csv(metrics_path)
+        metrics_df = structure.read_csv_cached(metrics_path)
         numeric_cols = [col for col in metrics_df.columns if "R2" in col or "RMSE" in col or "MAE" in col]
         metrics_df[numeric_cols] = metrics_df[numeric_cols].round(2)
 
@@ -179,6 +194,23 @@ def show():
                             key=f"word_{model_id}"
                         )
 
+        st.markdown("### 🔁 Cross-Validation (Out-of-Fold)")
+        st.caption("Predictions cached at training time: each training row scored by the fold model that never saw it.")
+
+        col1, col2 = st.columns(2)
+        for i, model_id in enumerate([model_1, model_2]):
+            technique, variant = model_id.split("_", 1)
+            cv_preds = structure.load_cv_predictions(technique, variant)
+            with (col1 if i == 0 else col2):
+                st.markdown(f"#### {model_id}")
+                if cv_preds.empty:
+                    st.info("No cached CV predictions — retrain this model on the Model Training page.")
+                    continue
+                cv_r2 = r2_score(cv_preds["y_true"], cv_preds["y_pred"])
+                cv_rmse = np.sqrt(mean_squared_error(cv_preds["y_true"], cv_preds["y_pred"]))
+                st.markdown(f"- CV R²: `{cv_r2:.3f}` | CV RMSE: `{cv_rmse:.2f}` | n = `{len(cv_preds)}`")
+                st.pyplot(plot_cv_predictions(cv_preds, f"{model_id} — Out-of-Fold"))
+
     except Exception as e:
         st.error(f"❌ Could not load evaluation data: {e}")
 
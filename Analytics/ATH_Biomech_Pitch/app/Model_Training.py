@@ -1,14 +1,16 @@
 import os
+import copy
 import time
 import pandas as pd
 import numpy as np
 import streamlit as st
 import joblib
 from sklearn.metrics import mean_squared_error, r2_score
-from sklearn.model_selection import cross_val_score, KFold
+from sklearn.model_selection import KFold
 
 from app import structure
 from utils import config
+from utils.helpers import fit_rf_warm_start
 
 # ----------------------------
 # 🔧 Paths
@@ -37,45 +39,71 @@ def get_variable_definitions():
 # ----------------------------
 # 🧐 Cross-Validation Helpers
 # ----------------------------
-def evaluate_cv_model(model, X, y, variant, technique):
-    cv = KFold(n_splits=5, shuffle=True, random_state=42)
-    r2_scores = cross_val_score(model, X, y, scoring="r2", cv=cv)
-    rmse_scores = np.sqrt(-1 * cross_val_score(model, X, y, scoring="neg_mean_squared_error", cv=cv))
+CV_FOLDS = 5
+
+def _take(X, idx):
+    return X.iloc[idx] if hasattr(X, "iloc") else X[idx]
+
+def _fresh(template):
+    # A new unfitted copy per fold; joblib only copies the template when it pickles it for a worker
+    from sklearn.base import BaseEstimator, clone
+    return clone(template) if isinstance(template, BaseEstimator) else copy.deepcopy(template)
+
+def _fit_fold(template, X, y, fold, train_idx, test_idx):
+    model = _fresh(template).fit(_take(X, train_idx), _take(y, train_idx))
+    return fold, test_idx, np.asarray(model.predict(_take(X, test_idx)), dtype=float)
+
+def run_cv(template, X, y, n_splits=CV_FOLDS, n_jobs=-1, index=None):
+    """
+    Fits each fold exactly once (folds in parallel) and scores R² and RMSE from the same
+    out-of-fold predictions. Returns (per-fold scores, out-of-fold predictions).
+    `index` labels the rows in train.csv; it defaults to X.index, so pass it when X is an array.
+    """
+    from joblib import Parallel, delayed
+
+    cv = KFold(n_splits=n_splits, shuffle=True, random_state=42)
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_fold)(template, X, y, fold, train_idx, test_idx)
+        for fold, (train_idx, test_idx) in enumerate(cv.split(X))
+    )
 
+    y_values = np.asarray(y, dtype=float)
+    if index is None:
+        if not hasattr(X, "index"):
+            raise ValueError("run_cv needs `index` when X has no index; out-of-fold rows are joined back on it")
+        index = X.index
+    row_ids = np.asarray(index)
+    scores, frames = [], []
+    for fold, test_idx, preds in results:
+        y_test = y_values[test_idx]
+        scores.append({"fold": fold, "r2": r2_score(y_test, preds), "rmse": np.sqrt(mean_squared_error(y_test, preds))})
+        frames.append(pd.DataFrame({"row": row_ids[test_idx], "fold": fold, "y_true": y_test, "y_pred": preds}))
+
+    predictions = pd.concat(frames, ignore_index=True).sort_values("row", ignore_index=True)
+    return pd.DataFrame(scores), predictions
+
+def save_cv_run(scores, predictions, variant, technique):
     structure.save_cv_results(
         variant=variant,
         technique=technique,
-        r2=np.mean(r2_scores),
-        r2_std=np.std(r2_scores),
-        rmse=np.mean(rmse_scores),
-        rmse_std=np.std(rmse_scores),
+        r2=scores["r2"].mean(),
+        r2_std=scores["r2"].std(ddof=0),
+        rmse=scores["rmse"].mean(),
+        rmse_std=scores["rmse"].std(ddof=0),
     )
+    structure.save_cv_predictions(technique, variant, predictions)
 
-def evaluate_gam_cv(X, y, variant, technique, model, features):
-    from pygam import LinearGAM
-
-    r2_scores = []
-    rmse_scores = []
+def evaluate_cv_model(model, X, y, variant, technique):
+    from sklearn.base import clone
 
-    kf = KFold(n_splits=5, shuffle=True, random_state=42)
-    for train_idx, test_idx in kf.split(X):
-        X_train, X_test = X[train_idx], X[test_idx]
-        y_train, y_test = y[train_idx], y[test_idx]
+    scores, predictions = run_cv(clone(model), X, y)
+    save_cv_run(scores, predictions, variant, technique)
 
-        model_cv = LinearGAM(model.terms).fit(X_train, y_train)
-        preds = model_cv.predict(X_test)
+def evaluate_gam_cv(X, y, variant, technique, model, features, index):
+    from pygam import LinearGAM
 
-        r2_scores.append(r2_score(y_test, preds))
-        rmse_scores.append(np.sqrt(mean_squared_error(y_test, preds)))
-
-    structure.save_cv_results(
-        variant=variant,
-        technique=technique,
-        r2=np.mean(r2_scores),
-        r2_std=np.std(r2_scores),
-        rmse=np.mean(rmse_scores),
-        rmse_std=np.std(rmse_scores),
-    )
+    scores, predictions = run_cv(LinearGAM(model.terms), X, y, index=index)
+    save_cv_run(scores, predictions, variant, technique)
 
     summary_df = pd.DataFrame({
         "Feature": features,
@@ -85,7 +113,7 @@ def evaluate_gam_cv(X, y, variant, technique, model, features):
     info_path = structure.get_model_path(technique, variant, f"{variant}_summary.csv")
     summary_df.to_csv(info_path, index=False)
 
-def train_and_save_model(variant, technique):
+def train_and_save_model(variant, technique, rf_warm_start=True):
     from sklearn.ensemble import RandomForestRegressor
     from sklearn.linear_model import ElasticNetCV
     from sklearn.pipeline import Pipeline
@@ -93,7 +121,7 @@ def train_and_save_model(variant, technique):
     from sklearn.neural_network import MLPRegressor
     from pygam import LinearGAM, s
 
-    df = pd.read_csv(DATA_PATH)
+    df = structure.read_csv_cached(DATA_PATH)
     features = structure.get_model_features(variant)
 
     # Filter + one-hot encode
@@ -103,9 +131,27 @@ def train_and_save_model(variant, technique):
     y = df.loc[X.index, "pitch_speed_mph"]
 
     start_time = time.time()
-    model, r2, rmse = None, None, None
+    model, r2, rmse, rf_info = None, None, None, None
 
-    if technique == "rf":
+    if technique == "rf" and rf_warm_start:
+        # All cores, trees added until OOB R² converges; OOB scores replace the 5-fold refits
+        model, rf_info = fit_rf_warm_start(X, y)
+        y_pred = model.predict(X)
+        structure.save_cv_results(
+            variant=variant,
+            technique=technique,
+            r2=rf_info["oob_r2"],
+            r2_std=np.nan,
+            rmse=rf_info["oob_rmse"],
+            rmse_std=np.nan,
+            method="oob",
+            trees=rf_info["trees"],
+        )
+        structure.save_cv_predictions(technique, variant, pd.DataFrame({
+            "row": X.index, "fold": "oob", "y_true": y.to_numpy(), "y_pred": model.oob_prediction_
+        }))
+
+    elif technique == "rf":
         model = RandomForestRegressor(n_estimators=1000, random_state=42)
         model.fit(X, y)
         y_pred = model.predict(X)
@@ -127,7 +173,7 @@ def train_and_save_model(variant, technique):
             terms += s(i)
         model = LinearGAM(terms).fit(X.values, y.values)
         y_pred = model.predict(X)
-        evaluate_gam_cv(X.values, y.values, variant, technique, model, features)
+        evaluate_gam_cv(X.values, y.values, variant, technique, model, features, index=X.index)
 
     elif technique == "mlp":
         mlp = MLPRegressor(hidden_layer_sizes=(64, 32), max_iter=1000, random_state=42)
@@ -141,7 +187,7 @@ def train_and_save_model(variant, technique):
 
     else:
         st.error("❌ Unsupported technique.")
-        return None, None, None, None
+        return None, None, None, None, None
 
     r2 = r2_score(y, y_pred)
     rmse = np.sqrt(mean_squared_error(y, y_pred))
@@ -156,20 +202,24 @@ def train_and_save_model(variant, technique):
     encoded_features_path = structure.get_model_path(technique, variant, f"{variant}_encoded_features.pkl")
     joblib.dump(X.columns.tolist(), encoded_features_path)
 
-    return model, r2, rmse, duration
+    # Evaluate/Predict must not serve the previous model or its predictions
+    structure.clear_artifact_cache()
 
-def train_all_models():
+    return model, r2, rmse, duration, rf_info
+
+def train_all_models(rf_warm_start=True):
     results = []
     for variant in structure.list_model_variants():
         for technique in structure.list_techniques():
             try:
-                model, r2, rmse, duration = train_and_save_model(variant, technique)
+                model, r2, rmse, duration, rf_info = train_and_save_model(variant, technique, rf_warm_start)
                 results.append({
                     "Model Variant": variant,
                     "Technique": technique,
                     "R²": round(r2, 3),
                     "RMSE": round(rmse, 2),
-                    "Train Time (s)": round(duration, 2)
+                    "Train Time (s)": round(duration, 2),
+                    "Trees": rf_info["trees"] if rf_info else None
                 })
             except Exception as e:
                 results.append({
@@ -225,28 +275,44 @@ def show():
             st.markdown(f"- **{var}**: {desc}")
 
     try:
-        cv_summary = pd.read_csv(os.path.join(structure.MODEL_PATH, "cv_summary.csv"))
+        cv_summary = structure.read_csv_cached(os.path.join(structure.MODEL_PATH, "cv_summary.csv"))
         recent = cv_summary[
             (cv_summary["model_variant"] == model_variant) &
             (cv_summary["technique"] == technique)
         ]
         if not recent.empty:
             st.markdown("### 📊 Last Cross-Validation Summary")
-            st.dataframe(recent[["r2_mean", "r2_std", "rmse_mean", "rmse_std"]], use_container_width=True)
+            cols = [c for c in ["method", "trees", "r2_mean", "r2_std", "rmse_mean", "rmse_std"] if c in recent.columns]
+            st.dataframe(recent[cols], use_container_width=True)
     except Exception:
         pass
 
     st.markdown("---")
 
+    rf_warm_start = st.checkbox(
+        "⚡ Fast Random Forest (all cores, warm start until out-of-bag R² converges, OOB in place of 5-fold CV)",
+        value=True
+    )
+
     if st.button("🚀 Train Selected Model"):
         with st.spinner("Training in progress..."):
-            model, r2, rmse, duration = train_and_save_model(model_variant, technique)
+            model, r2, rmse, duration, rf_info = train_and_save_model(model_variant, technique, rf_warm_start)
 
         if model:
             st.success("✅ Model training complete.")
             st.markdown(f"- ⏱️ Training time: `{duration:.2f}` sec")
             st.markdown(f"- 📈 R²: `{r2:.3f}`")
             st.markdown(f"- 📉 RMSE: `{rmse:.2f}`")
+            if rf_info:
+                st.markdown(f"- 🌲 Trees used: `{rf_info['trees']}` of `{rf_info['max_trees']}` "
+                            f"(OOB R²: `{rf_info['oob_r2']:.3f}`, OOB RMSE: `{rf_info['oob_rmse']:.2f}`)")
+                st.markdown(f"- ⚡ Est. time saved vs. the fixed {rf_info['max_trees']}-tree forest + two 5-fold "
+                            f"cross_val_score passes: `{rf_info['time_saved_s']:.1f}` sec "
+                            f"(~`{rf_info['baseline_est_s']:.1f}` sec before)")
+                st.caption(f"Extrapolated, not measured: the per-tree build time of the first "
+                           f"{config.RF_WARM_START['initial_trees']} trees scaled up to the single-threaded fixed forest "
+                           f"fit once plus the {rf_info['baseline_cv_refits']} CV refits the old evaluation ran.")
+                st.line_chart(pd.DataFrame(rf_info["history"]).set_index("trees")["oob_r2"])
             st.toast(f"{technique.upper()} model for {model_variant} saved!", icon="💾")
         else:
             st.error("❌ Training failed.")
@@ -256,7 +322,7 @@ def show():
 
     if st.button("Train All Variants and Techniques"):
         with st.spinner("Training all models... this may take a few minutes."):
-            summary_df = train_all_models()
+            summary_df = train_all_models(rf_warm_start)
 
         st.success("✅ All models trained.")
 
@@ -1,7 +1,6 @@
 import os
 import pandas as pd
 import numpy as np
-import joblib
 import streamlit as st
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -13,6 +12,7 @@ from app import structure
 # 🔧 Paths and Setup
 # ----------------------------
 TEST_PATH = os.path.join(config.DATA_PATH, "test.csv")
+TRAIN_PATH = os.path.join(config.DATA_PATH, "train.csv")
 MODEL_BASE = os.path.join(config.OUTPUT_PATH, "models")
 DEFAULT_TECHNIQUE = "rf"
 DEFAULT_VARIANT = "full_model"
@@ -77,6 +77,21 @@ def plot_boxplot_by_group(df, group_col):
 # ----------------------------
 # 🔮 Prediction Logic
 # ----------------------------
+@structure.cache_derived
+def _predict_test(variant, technique, model_path, encoded_file, stamps):
+    # stamps (mtime, size of model, features and test.csv) key the cache; a retrained model misses it
+    df = structure.read_csv_cached(TEST_PATH)
+    features = structure.get_model_features(variant)
+    df = df.dropna(subset=features + ["pitch_speed_mph"])
+    X = pd.get_dummies(df[features])
+    encoded_features = structure.load_artifact(encoded_file)
+    X = X.reindex(columns=encoded_features, fill_value=0).astype(float)
+    y = df["pitch_speed_mph"]
+    model = structure.load_artifact(model_path)
+    preds = model.predict(X)
+
+    return df.assign(preds=preds), r2_score(y, preds)
+
 def make_prediction(variant, technique):
     model_path = os.path.join(MODEL_BASE, technique, f"{variant}.joblib")
     encoded_file = os.path.join(MODEL_BASE, technique, f"{variant}_encoded_features.pkl")
@@ -85,17 +100,20 @@ def make_prediction(variant, technique):
         st.error(f"Missing model or encoded features for {technique} - {variant}")
         return None
 
-    df = pd.read_csv(TEST_PATH)
-    features = structure.get_model_features(variant)
-    df = df.dropna(subset=features + ["pitch_speed_mph"])
-    X = pd.get_dummies(df[features])
-    encoded_features = joblib.load(encoded_file)
-    X = X.reindex(columns=encoded_features, fill_value=0).astype(float)
-    y = df["pitch_speed_mph"]
-    model = joblib.load(model_path)
-    preds = model.predict(X)
+    stamps = tuple(structure.file_stamp(p) for p in (model_path, encoded_file, TEST_PATH))
+    return _predict_test(variant, technique, model_path, encoded_file, stamps)
 
-    return df.assign(preds=preds), r2_score(y, preds)
+def load_cv_prediction(variant, technique):
+    """
+    Out-of-fold predictions cached by Model Training, joined back onto train.csv; no model is loaded or rerun.
+    """
+    cv_preds = structure.load_cv_predictions(technique, variant)
+    if cv_preds.empty:
+        st.error(f"No cached cross-validation predictions for {technique} - {variant}. Train the model first.")
+        return None
+
+    df = structure.read_csv_cached(TRAIN_PATH).loc[cv_preds["row"]]
+    return df.assign(preds=cv_preds["y_pred"].to_numpy()), r2_score(cv_preds["y_true"], cv_preds["y_pred"])
 
 # ----------------------------
 # 🧠 Streamlit Page
@@ -131,7 +149,11 @@ def show():
     st.caption("Choose which group to evaluate prediction accuracy by. All plots reflect per-group performance.")
 
     group_col = st.radio("Group By", ["p_throws", "playing_level"], horizontal=True)
-    result = make_prediction(model_variant, technique)
+    source = st.radio("Predictions", ["Held-out test set", "Cross-validation (out-of-fold, train)"], horizontal=True)
+    if source == "Held-out test set":
+        result = make_prediction(model_variant, technique)
+    else:
+        result = load_cv_prediction(model_variant, technique)
 
     if result:
         df, global_r2 = result
@@ -1,7 +1,11 @@
 # structure.py
 
 import os
+import joblib
 import pandas as pd
+import streamlit as st
+
+from utils import config
 
 # ----------------------------
 # 🔹 Project Paths
@@ -13,15 +17,61 @@ EDA_PATH = os.path.join(OUTPUT_PATH, "eda_data")
 MODEL_PATH = os.path.join(OUTPUT_PATH, "models")
 PLOT_PATH = os.path.join(EDA_PATH, "plots")
 
+# ----------------------------
+# 🔹 Artifact Cache
+# ----------------------------
+# Models and CSVs are cached per (path, mtime, size), so a rerun that only changed a widget
+# reuses them and a file rewritten on disk is reloaded. max_entries bounds memory; retraining
+# calls clear_artifact_cache() to drop these caches (and only these) at once.
+MAX_CACHED_MODELS = 16
+MAX_CACHED_FRAMES = 32
+
+def file_stamp(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+@st.cache_resource(max_entries=MAX_CACHED_MODELS, show_spinner=False)
+def _load_joblib(path, stamp):
+    return joblib.load(path)
+
+@st.cache_data(max_entries=MAX_CACHED_FRAMES, show_spinner=False)
+def _read_csv(path, stamp):
+    return pd.read_csv(path)
+
+def load_artifact(path):
+    """
+    joblib.load through the cache. The object is shared across reruns and sessions; don't mutate it.
+    """
+    return _load_joblib(path, file_stamp(path))
+
+def read_csv_cached(path):
+    return _read_csv(path, file_stamp(path))
+
+_derived_caches = []
+
+def cache_derived(func):
+    """
+    st.cache_data for results computed from artifacts (e.g. predictions); cleared with them.
+    """
+    cached = st.cache_data(max_entries=MAX_CACHED_FRAMES, show_spinner=False)(func)
+    _derived_caches.append(cached)
+    return cached
+
+def clear_artifact_cache():
+    _load_joblib.clear()
+    _read_csv.clear()
+    for cached in _derived_caches:
+        cached.clear()
+
 # ----------------------------
 # 🔹 Load Core Datasets
 # ----------------------------
 def load_cleaned_data():
-    return pd.read_csv(os.path.join(DATA_DIR, "pitch_data_cleaned.csv"))
+    return read_csv_cached(os.path.join(DATA_DIR, "pitch_data_cleaned.csv"))
 
 def load_model_metrics():
     path = os.path.join(MODEL_PATH, "model_metrics.csv")
-    df = pd.read_csv(path)
+    df = read_csv_cached(path)
     if "Val_R2" in df.columns and "model_variant" not in df.columns:
         df = df.rename(columns={
             "Model": "model_variant",
@@ -37,26 +87,26 @@ def load_model_metrics():
 # 🔹 Feature Selection Files
 # ----------------------------
 def load_feature_scores():
-    df = pd.read_csv(os.path.join(EDA_PATH, "feature_scores.csv"))
+    df = read_csv_cached(os.path.join(EDA_PATH, "feature_scores.csv"))
     df.columns = [col.lower().strip() for col in df.columns]
     return df
 
 def load_selected_features():
-    return pd.read_csv(os.path.join(EDA_PATH, "selected_features.csv"))
+    return read_csv_cached(os.path.join(EDA_PATH, "selected_features.csv"))
 
 def load_vif():
-    return pd.read_csv(os.path.join(EDA_PATH, "vif_results.csv"))
+    return read_csv_cached(os.path.join(EDA_PATH, "vif_results.csv"))
 
 # ----------------------------
 # 🔹 Diagnostics
 # ----------------------------
 def load_normality_summary():
-    df = pd.read_csv(os.path.join(EDA_PATH, "normality_summary.csv"))
+    df = read_csv_cached(os.path.join(EDA_PATH, "normality_summary.csv"))
     df.columns = [col.lower().strip() for col in df.columns]
     return df
 
 def load_outlier_counts():
-    df = pd.read_csv(os.path.join(EDA_PATH, "outlier_counts.csv"))
+    df = read_csv_cached(os.path.join(EDA_PATH, "outlier_counts.csv"))
     if list(df.columns) == ["index", 0]:
         df.columns = ["variable", "outlier_count"]
     if "variable" not in df.columns:
@@ -84,37 +134,10 @@ def get_eda_plot(var_name, kind="histogram"):
 # 🔹 Model Variant & Feature Mapping (Whitelist)
 # ----------------------------
 def list_model_variants():
-    return ["force_model", "upper_body_model", "lower_body_model", "full_model"]
+    return list(config.MODEL_INPUTS)
 
 def get_model_features(model_variant):
-    model_inputs = {
-        "force_model": ["lead_grf_z_max"],
-        "upper_body_model": [
-            "max_shoulder_internal_rotational_velo",
-            "max_shoulder_external_rotation",
-            "max_shoulder_horizontal_abduction",
-            "elbow_transfer_fp_br"
-        ],
-        "lower_body_model": [
-            "max_torso_rotational_velo",
-            "max_rotation_hip_shoulder_separation",
-            "pelvis_anterior_tilt_fp",
-            "max_cog_velo_x",
-            "lead_knee_extension_from_fp_to_br",
-            "lead_knee_transfer_fp_br",
-            "rear_hip_generation_pkh_fp"
-        ],
-        "full_model": [
-            "lead_grf_z_max",
-            "max_shoulder_internal_rotational_velo", "max_shoulder_external_rotation",
-            "max_shoulder_horizontal_abduction", "elbow_transfer_fp_br",
-            "max_torso_rotational_velo", "max_rotation_hip_shoulder_separation",
-            "pelvis_anterior_tilt_fp", "max_cog_velo_x",
-            "lead_knee_extension_from_fp_to_br", "lead_knee_transfer_fp_br",
-            "rear_hip_generation_pkh_fp"
-        ]
-    }
-    return model_inputs[model_variant]
+    return config.MODEL_INPUTS[model_variant]
 
 # ----------------------------
 # 🔹 Available Techniques
@@ -132,7 +155,7 @@ def get_model_path(technique, variant, filename=None):
 # ----------------------------
 # ✅ Save Cross-Validation Results
 # ----------------------------
-def save_cv_results(variant, technique, r2, r2_std, rmse, rmse_std):
+def save_cv_results(variant, technique, r2, r2_std, rmse, rmse_std, method="5-fold", trees=None):
     path = os.path.join(MODEL_PATH, "cv_summary.csv")
     new_row = pd.DataFrame([{
         "model_variant": variant,
@@ -140,7 +163,9 @@ def save_cv_results(variant, technique, r2, r2_std, rmse, rmse_std):
         "r2_mean": r2,
         "r2_std": r2_std,
         "rmse_mean": rmse,
-        "rmse_std": rmse_std
+        "rmse_std": rmse_std,
+        "method": method,
+        "trees": trees
     }])
     if os.path.exists(path):
         existing = pd.read_csv(path)
@@ -150,13 +175,30 @@ def save_cv_results(variant, technique, r2, r2_std, rmse, rmse_std):
         df = new_row
     df.to_csv(path, index=False)
 
+# ----------------------------
+# ✅ Cached Cross-Validation Predictions
+# ----------------------------
+# One row per training row: its out-of-fold prediction, the fold it was held out in ("oob" for
+# Random Forest out-of-bag) and `row`, its index in train.csv for joining group columns back on.
+def save_cv_predictions(technique, variant, predictions):
+    path = get_model_path(technique, variant, f"{variant}_cv_predictions.csv")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    predictions.to_csv(path, index=False)
+
+def load_cv_predictions(technique, variant):
+    path = get_model_path(technique, variant, f"{variant}_cv_predictions.csv")
+    if os.path.exists(path):
+        return read_csv_cached(path)
+    else:
+        return pd.DataFrame()
+
 # ----------------------------
 # ✅ Load Model Metadata/Importance
 # ----------------------------
 def load_model_info(technique, variant, info_type="importance"):
     path = os.path.join(MODEL_PATH, technique, f"{variant}_{info_type}.csv")
     if os.path.exists(path):
-        return pd.read_csv(path)
+        return read_csv_cached(path)
     else:
         return pd.DataFrame()
 
@@ -1,10 +1,19 @@
 import os
+import argparse
 import pandas as pd
 import numpy as np
 import joblib
 from sklearn.metrics import r2_score
 from utils import config
 
+# ------------------------------
+# 🔹 Options
+# ------------------------------
+parser = argparse.ArgumentParser(description="Score the test set with every trained model, globally and by group.")
+parser.add_argument("--grouped_output", choices=["parquet", "csv"], default="parquet",
+                    help="parquet: one file for all groups and models; csv: the legacy per-group CSV tree")
+args = parser.parse_args()
+
 # ------------------------------
 # 🔹 Load Test Data
 # ------------------------------
@@ -17,6 +26,7 @@ base_path = os.path.join(config.OUTPUT_PATH, "predictions")
 global_by_model_path = os.path.join(base_path, "global", "by_model")
 metrics_path = os.path.join(base_path, "global", "metrics")
 grouped_base_path = os.path.join(base_path, "grouped")
+grouped_file = os.path.join(grouped_base_path, "grouped_predictions.parquet")
 
 for p in [global_by_model_path, metrics_path, grouped_base_path]:
     os.makedirs(p, exist_ok=True)
@@ -33,6 +43,7 @@ group_vars = ["user", "playing_level", "p_throws"]
 # ------------------------------
 metrics = []
 pred_df = data_test.copy()
+pred_cols = []  # (model_name, technique, column) for every model that predicted
 
 # ------------------------------
 # 🔹 Predict + Save Helper
@@ -45,6 +56,7 @@ def predict_model(model_name, technique, model, features):
         preds = model.predict(X)
         colname = f"{model_name}_{technique}_pred"
         pred_df[colname] = preds
+        pred_cols.append((model_name, technique, colname))
         r2 = r2_score(pred_df["pitch_speed_mph"], preds)
         metrics.append({
             "Model": model_name,
@@ -83,36 +95,81 @@ for technique in techniques:
         # Global predictions
         predict_model(model_name, technique, model, features)
 
-        # Group-wise predictions
-        for group_col in group_vars:
-            if group_col not in pred_df.columns:
-                print(f"⚠️ Skipping group by '{group_col}' — column not found.")
-                continue
-
-            for group_val in pred_df[group_col].dropna().unique():
-                group_data = pred_df[pred_df[group_col] == group_val].copy()
-                if hasattr(model, "feature_names_in_"):
-                    try:
-                        group_data_X = group_data[model.feature_names_in_]
-                    except KeyError:
-                        continue
-                else:
-                    group_data_X = group_data[features]
-
-                try:
-                    group_data[f"{model_name}_{technique}_pred"] = model.predict(group_data_X)
-                    out_dir = os.path.join(grouped_base_path, group_col, str(group_val), model_name)
-                    os.makedirs(out_dir, exist_ok=True)
-                    out_file = os.path.join(out_dir, f"{technique}_predictions.csv")
-                    group_data.to_csv(out_file, index=False)
-                except Exception as e:
-                    print(f"❌ Error predicting group {group_val} — {model_name} ({technique}): {e}")
+# ------------------------------
+# 🔹 Group-Wise Predictions
+# ------------------------------
+def group_labels(keys):
+    """
+    One string label per group key, shared by the Parquet file, the CSV tree and group_scores.csv.
+    Whole-number float keys (integer IDs upcast by missing values) print as "123", not "123.0".
+    """
+    keys = pd.Series(keys)
+    if pd.api.types.is_float_dtype(keys) and (keys.dropna() % 1 == 0).all():
+        keys = keys.astype("Int64")
+    return keys.astype(str)
+
+# Each model predicted the whole test set once above; every group is a slice of those columns.
+group_frames, group_metrics = [], []
+for group_col in group_vars:
+    if group_col not in pred_df.columns:
+        print(f"⚠️ Skipping group by '{group_col}' — column not found.")
+        continue
+
+    keys = pred_df[group_col]
+    present = keys.notna()
+    group_frames.append(pred_df.loc[present].assign(group_col=group_col, group_value=group_labels(keys[present])))
+
+    # R²/RMSE for every group × model from one groupby over the prediction columns
+    y = pred_df["pitch_speed_mph"]
+    cols = [c for _, _, c in pred_cols]
+    sse = pred_df[cols].sub(y, axis=0).pow(2).groupby(keys).sum()
+    sst = (y - y.groupby(keys).transform("mean")).pow(2).groupby(keys).sum()
+    sst = sst.where(sst > 0)  # R² is undefined for single-pitch / constant-velocity groups
+    n = keys.groupby(keys).size()
+    for model_name, technique, colname in pred_cols:
+        group_metrics.append(pd.DataFrame({
+            "group_col": group_col,
+            "group_value": group_labels(sse.index.to_series()).to_numpy(),
+            "Model": model_name,
+            "Technique": technique,
+            "n": n.to_numpy(),
+            "R2": (1 - sse[colname] / sst).to_numpy(),
+            "RMSE": np.sqrt(sse[colname] / n).to_numpy()
+        }))
+
+if group_frames and args.grouped_output == "parquet":
+    # One file partitioned into one row group per group_col (sorted by group_value inside it), so
+    # pd.read_parquet(grouped_file, filters=[("group_col", "==", "user")]) reads only that row group
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    grouped_df = pd.concat(group_frames, ignore_index=True)
+    schema = pa.Schema.from_pandas(grouped_df, preserve_index=False)
+    with pq.ParquetWriter(grouped_file, schema) as writer:
+        for frame in group_frames:
+            frame = frame.sort_values("group_value", kind="stable")
+            writer.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False),
+                               row_group_size=max(len(frame), 1))
+    print(f"📦 {len(group_frames)} groupings, {grouped_df.groupby('group_col')['group_value'].nunique().sum()} groups "
+          f"× {len(pred_cols)} models → {grouped_file}")
+elif group_frames:
+    for frame in group_frames:
+        group_col = frame["group_col"].iloc[0]
+        for group_val, group_data in frame.groupby("group_value", sort=False):
+            group_data = group_data.drop(columns=["group_col", "group_value"])
+            for model_name, technique, colname in pred_cols:
+                out_dir = os.path.join(grouped_base_path, group_col, str(group_val), model_name)
+                os.makedirs(out_dir, exist_ok=True)
+                group_data.drop(columns=[c for _, _, c in pred_cols if c != colname]).to_csv(
+                    os.path.join(out_dir, f"{technique}_predictions.csv"), index=False)
 
 # ------------------------------
 # 🔹 Save Combined Output
 # ------------------------------
 pred_df.to_csv(os.path.join(global_by_model_path, "all_predictions.csv"), index=False)
 pd.DataFrame(metrics).to_csv(os.path.join(metrics_path, "model_r2_scores.csv"), index=False)
+if group_metrics:
+    pd.concat(group_metrics, ignore_index=True).to_csv(os.path.join(metrics_path, "group_scores.csv"), index=False)
 
 print("🎯 Subgroup and global predictions complete.")
 
@@ -0,0 +1,281 @@
+import os
+import json
+import time
+import hashlib
+import argparse
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+import joblib
+import sklearn
+from sklearn.metrics import mean_squared_error, r2_score
+
+from utils import config
+from utils.helpers import fit_rf_warm_start
+
+# ------------------------------
+# 🔹 Paths
+# ------------------------------
+DATA_FILE = os.path.join(config.DATA_PATH, "train.csv")
+MODELS_DIR = os.path.join(config.OUTPUT_PATH, "models")
+TELEMETRY_FILE = os.path.join(MODELS_DIR, "training_telemetry.csv")
+
+TECHNIQUES = ["rf", "elasticnet", "gam", "mlp"]
+
+# Slowest techniques first so long fits don't end up alone at the tail of the pool
+SCHEDULE_ORDER = {"rf": 0, "mlp": 1, "gam": 2, "elasticnet": 3}
+
+# ------------------------------
+# 🔹 Shared Training Data
+# ------------------------------
+# The parent reads train.csv once and copies every numeric column into one shared-memory block.
+# Workers attach to it by name; jobs only carry column indices, never the data itself.
+_shared = {}
+
+def share_frame(df, columns):
+    values = df[columns].to_numpy(dtype=np.float64)
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)[:] = values
+    return shm, values.shape
+
+def _attach_shared(name, shape, columns):
+    shm = shared_memory.SharedMemory(name=name)
+    _shared["shm"] = shm  # keep the handle alive for the life of the worker
+    _shared["values"] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    _shared["columns"] = {col: i for i, col in enumerate(columns)}
+
+def _shared_xy(features):
+    values, columns = _shared["values"], _shared["columns"]
+    X = pd.DataFrame(values[:, [columns[f] for f in features]], columns=features)
+    y = pd.Series(values[:, columns[config.TARGET]], name=config.TARGET)
+    return X, y
+
+# ------------------------------
+# 🔹 Skip-If-Unchanged Cache
+# ------------------------------
+def job_key(df, technique, variant, rf_mode="warm_start"):
+    """
+    Hash of the exact training data a job sees plus its hyperparameters and sklearn version.
+    """
+    features = config.MODEL_INPUTS[variant]
+    settings = [technique, features, config.TECHNIQUE_PARAMS[technique], sklearn.__version__]
+    if technique == "rf":
+        settings += [rf_mode, config.RF_WARM_START if rf_mode == "warm_start" else None]
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(df[features + [config.TARGET]].to_numpy(dtype=np.float64)).tobytes())
+    digest.update(json.dumps(settings, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+def _stamp_path(technique, variant):
+    return os.path.join(MODELS_DIR, technique, f"{variant}_train_key.json")
+
+def is_cached(technique, variant, key):
+    try:
+        with open(_stamp_path(technique, variant), encoding="utf-8") as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return stamp.get("key") == key and os.path.exists(os.path.join(MODELS_DIR, technique, f"{variant}.joblib"))
+
+def write_stamp(technique, variant, key):
+    with open(_stamp_path(technique, variant), "w", encoding="utf-8") as f:
+        json.dump({"key": key, "trained_at": time.strftime("%Y-%m-%d %H:%M:%S")}, f)
+
+# ------------------------------
+# 🔹 Fit + Save (one technique × variant)
+# ------------------------------
+def fit_technique(technique, X, y, n_jobs=1, rf_mode="warm_start"):
+    """
+    Fits one technique and returns (model to save, model used for in-sample predictions, X it expects, info).
+    info holds the trees used and out-of-bag scores for a warm-started RF, otherwise it is empty.
+    """
+    params = config.TECHNIQUE_PARAMS[technique]
+
+    if technique == "rf":
+        if rf_mode == "warm_start":
+            model, info = fit_rf_warm_start(X, y, n_jobs=n_jobs)
+            return model, model, X, info
+        from sklearn.ensemble import RandomForestRegressor
+        model = RandomForestRegressor(n_jobs=n_jobs, **params).fit(X, y)
+        return model, model, X, {"trees": model.n_estimators}
+
+    if technique in ("elasticnet", "mlp"):
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.pipeline import Pipeline
+        if technique == "elasticnet":
+            from sklearn.linear_model import ElasticNetCV as Estimator
+        else:
+            from sklearn.neural_network import MLPRegressor as Estimator
+        scaler = StandardScaler()
+        X_scaled = scaler.fit_transform(X)
+        estimator = Estimator(**params).fit(X_scaled, y)
+        return Pipeline([("scaler", scaler), (technique, estimator)]), estimator, X_scaled, {}
+
+    if technique == "gam":
+        from pygam import LinearGAM, s
+        terms = s(0)
+        for i in range(1, X.shape[1]):
+            terms += s(i)
+        model = LinearGAM(terms, **params).fit(X.values, y)
+        return model, model, X.values, {}
+
+    raise ValueError(f"Unsupported technique: {technique}")
+
+def save_artifacts(technique, variant, features, model):
+    """
+    Same files the per-technique train_*.py scripts have always written.
+    """
+    model_dir = os.path.join(MODELS_DIR, technique)
+    os.makedirs(model_dir, exist_ok=True)
+    joblib.dump(model, os.path.join(model_dir, f"{variant}.joblib"))
+
+    if technique == "rf":
+        pd.DataFrame({
+            "Feature": features,
+            "Importance": model.feature_importances_
+        }).sort_values(by="Importance", ascending=False).to_csv(
+            os.path.join(model_dir, f"{variant}_importance.csv"), index=False)
+        return
+
+    # Feature list for later evaluation
+    pd.DataFrame({"Feature": features}).to_csv(os.path.join(model_dir, f"{variant}_importance.csv"), index=False)
+
+    if technique == "elasticnet":
+        pd.DataFrame({
+            "Feature": features,
+            "Coefficient": model.named_steps["elasticnet"].coef_
+        }).sort_values(by="Coefficient", key=abs, ascending=False).to_csv(
+            os.path.join(model_dir, f"{variant}_coefficients.csv"), index=False)
+    elif technique == "gam":
+        pd.DataFrame({
+            "Feature": features,
+            "Lambda": model.lam,
+            "EDOF": model.statistics_["edof"]
+        }).to_csv(os.path.join(model_dir, f"{variant}_summary.csv"), index=False)
+    elif technique == "mlp":
+        # MLP does not expose interpretable coefficients
+        pd.DataFrame({
+            "Feature": features,
+            "Weight_Info": ["[hidden]" for _ in features]
+        }).to_csv(os.path.join(model_dir, f"{variant}_info.csv"), index=False)
+
+def run_job(technique, variant, key, n_jobs=1, rf_mode="warm_start", trace_memory=False):
+    """
+    Worker entry point: trains one technique × variant from shared memory and reports telemetry.
+    n_jobs is this job's share of the cores, so a threaded RF doesn't oversubscribe the pool.
+    trace_memory records peak Python allocations with tracemalloc; tracing slows allocation-heavy
+    fits (pyGAM, MLP) a lot, so the timings of traced jobs are flagged and not comparable.
+    """
+    features = config.MODEL_INPUTS[variant]
+    if trace_memory:
+        tracemalloc.start()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        X, y = _shared_xy(features)
+        model, fitted, X_fit, info = fit_technique(technique, X, y, n_jobs, rf_mode)
+        y_pred = fitted.predict(X_fit)
+        save_artifacts(technique, variant, features, model)
+        write_stamp(technique, variant, key)
+        status, error = "trained", ""
+        r2, rmse = r2_score(y, y_pred), float(np.sqrt(mean_squared_error(y, y_pred)))
+    except Exception as e:
+        status, error, r2, rmse, info = "error", f"{type(e).__name__}: {e}", None, None, {}
+    wall_s, cpu_s = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "technique": technique,
+        "variant": variant,
+        "status": status,
+        "r2": r2,
+        "rmse": rmse,
+        "trees": info.get("trees"),
+        "oob_r2": info.get("oob_r2"),
+        "oob_rmse": info.get("oob_rmse"),
+        "wall_s": round(wall_s, 3),
+        "cpu_s": round(cpu_s, 3),
+        "memory_traced": trace_memory,
+        "peak_mem_mb": round(peak / 1024 ** 2, 2) if peak is not None else None,
+        "pid": os.getpid(),
+        "error": error,
+    }
+
+# ------------------------------
+# 🔹 Orchestrator
+# ------------------------------
+def train_all(techniques=TECHNIQUES, variants=None, max_workers=None, force=False, rf_mode="warm_start",
+              trace_memory=False):
+    variants = variants or list(config.MODEL_INPUTS)
+    df = pd.read_csv(DATA_FILE)
+    run_start = time.perf_counter()
+
+    rows, jobs = [], []
+    for technique in sorted(techniques, key=SCHEDULE_ORDER.get):
+        for variant in variants:
+            features = config.MODEL_INPUTS[variant]
+            missing = [f for f in features if f not in df.columns]
+            if missing:
+                print(f"⚠️ Skipping {variant} ({technique}) — missing: {missing}")
+                continue
+            key = job_key(df, technique, variant, rf_mode)
+            if not force and is_cached(technique, variant, key):
+                print(f"⏭️ {variant} ({technique}) unchanged — skipped")
+                rows.append({"technique": technique, "variant": variant, "status": "cached"})
+                continue
+            jobs.append((technique, variant, key, rf_mode))
+
+    if jobs:
+        columns = sorted({f for _, v, _, _ in jobs for f in config.MODEL_INPUTS[v]} | {config.TARGET})
+        shm, shape = share_frame(df, columns)
+        workers = max_workers or os.cpu_count() or 1
+        n_jobs = max(1, (os.cpu_count() or 1) // min(workers, len(jobs)))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach_shared,
+                                     initargs=(shm.name, shape, columns)) as pool:
+                futures = [pool.submit(run_job, technique, variant, key, n_jobs, mode, trace_memory)
+                           for technique, variant, key, mode in jobs]
+                for future in as_completed(futures):
+                    row = future.result()
+                    rows.append(row)
+                    memory = f", {row['peak_mem_mb']:.1f} MB peak (traced)" if row["memory_traced"] else ""
+                    if row["status"] == "trained" and row["oob_r2"] is not None:
+                        print(f"✅ {row['variant']} ({row['technique']}) — OOB R²: {row['oob_r2']:.3f} | "
+                              f"OOB RMSE: {row['oob_rmse']:.2f} | {row['trees']} trees | {row['wall_s']:.1f}s wall{memory}")
+                    elif row["status"] == "trained":
+                        print(f"✅ {row['variant']} ({row['technique']}) — R²: {row['r2']:.3f} | RMSE: {row['rmse']:.2f} "
+                              f"| {row['wall_s']:.1f}s wall{memory}")
+                    else:
+                        print(f"❌ {row['variant']} ({row['technique']}) — {row['error']}")
+        finally:
+            shm.close()
+            shm.unlink()
+
+    telemetry = pd.DataFrame(rows)
+    telemetry["run_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    os.makedirs(MODELS_DIR, exist_ok=True)
+    telemetry.to_csv(TELEMETRY_FILE, index=False)
+
+    elapsed = time.perf_counter() - run_start
+    serial = telemetry.get("wall_s", pd.Series(dtype=float)).sum()
+    print(f"🎯 {len(jobs)} fits in {elapsed:.1f}s (sum of job times {serial:.1f}s), "
+          f"{len(rows) - len(jobs)} unchanged — telemetry in {TELEMETRY_FILE}")
+    return telemetry
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train every technique × model variant in parallel.")
+    parser.add_argument("--techniques", nargs="+", choices=TECHNIQUES, default=TECHNIQUES)
+    parser.add_argument("--variants", nargs="+", choices=list(config.MODEL_INPUTS))
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Retrain even if data and hyperparameters are unchanged")
+    parser.add_argument("--rf_mode", choices=["warm_start", "fixed"], default="warm_start",
+                        help="RF: grow trees until OOB R² converges, or fit all n_estimators at once")
+    parser.add_argument("--trace_memory", "--trace-memory", action="store_true",
+                        help="Record peak memory per job with tracemalloc (slows fits; timings are flagged)")
+    args = parser.parse_args()
+
+    train_all(args.techniques, args.variants, args.workers, args.force, args.rf_mode, args.trace_memory)
@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+# Same imports the app and pipeline use: `from utils import config`, `from app import structure`
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_DIR)
+
+@pytest.fixture
+def in_tmp_dir(tmp_path, monkeypatch):
+    # utils.config creates its folders on import; keep them out of the checkout
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
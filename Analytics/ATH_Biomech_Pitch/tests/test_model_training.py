@@ -0,0 +1,100 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import ElasticNet, Ridge
+from sklearn.metrics import mean_squared_error, r2_score
+from sklearn.model_selection import KFold, cross_val_predict, cross_val_score
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+TRAIN_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "train.csv")
+
+@pytest.fixture
+def training(in_tmp_dir):
+    from app import Model_Training
+    from utils import config
+
+    data = pd.read_csv(TRAIN_PATH)
+    X = data[config.MODEL_INPUTS["upper_body_model"]]
+    y = data[config.TARGET]
+    return Model_Training, X, y
+
+class MeanModel:
+    """
+    Not a sklearn estimator, so run_cv has to deepcopy it per fold.
+    """
+
+    def fit(self, X, y):
+        self.mean_ = float(np.mean(y))
+        return self
+
+    def predict(self, X):
+        return np.full(len(X), self.mean_)
+
+@pytest.mark.parametrize("model", [
+    Ridge(alpha=1.0),
+    make_pipeline(StandardScaler(), ElasticNet(alpha=0.1, l1_ratio=0.5, max_iter=5000)),
+])
+def test_run_cv_matches_cross_val_score(training, model):
+    Model_Training, X, y = training
+    cv = KFold(n_splits=Model_Training.CV_FOLDS, shuffle=True, random_state=42)
+
+    # evaluate_cv_model before single-pass CV: two cross_val_score runs, population std
+    r2_scores = cross_val_score(model, X, y, scoring="r2", cv=cv)
+    rmse_scores = np.sqrt(-1 * cross_val_score(model, X, y, scoring="neg_mean_squared_error", cv=cv))
+
+    scores, predictions = Model_Training.run_cv(model, X, y, n_jobs=1)
+
+    np.testing.assert_allclose(scores["r2"], r2_scores)
+    np.testing.assert_allclose(scores["rmse"], rmse_scores)
+    assert scores["r2"].mean() == pytest.approx(np.mean(r2_scores))
+    assert scores["r2"].std(ddof=0) == pytest.approx(np.std(r2_scores))
+    assert scores["rmse"].mean() == pytest.approx(np.mean(rmse_scores))
+    assert scores["rmse"].std(ddof=0) == pytest.approx(np.std(rmse_scores))
+
+    # Out-of-fold predictions are the same rows cross_val_predict gives
+    np.testing.assert_allclose(predictions["y_pred"], cross_val_predict(model, X, y, cv=cv))
+    np.testing.assert_array_equal(predictions["row"], X.index)
+
+def test_run_cv_parallel_and_array_inputs(training):
+    Model_Training, X, y = training
+    serial, serial_preds = Model_Training.run_cv(MeanModel(), X, y, n_jobs=1)
+
+    # Arrays carry no index, so row ids come from `index`
+    with pytest.raises(ValueError):
+        Model_Training.run_cv(MeanModel(), X.to_numpy(), y.to_numpy())
+    parallel, parallel_preds = Model_Training.run_cv(MeanModel(), X.to_numpy(), y.to_numpy(), n_jobs=2, index=X.index)
+
+    pd.testing.assert_frame_equal(parallel, serial)
+    pd.testing.assert_frame_equal(parallel_preds, serial_preds)
+
+def test_run_cv_matches_manual_gam_loop(training):
+    pygam = pytest.importorskip("pygam")
+    Model_Training, X, y = training
+    X_values, y_values = X.to_numpy(), y.to_numpy()
+
+    terms = pygam.s(0)
+    for i in range(1, X_values.shape[1]):
+        terms += pygam.s(i)
+    model = pygam.LinearGAM(terms).fit(X_values, y_values)
+
+    # evaluate_gam_cv before single-pass CV: a fresh LinearGAM(model.terms) per KFold split
+    r2_scores, rmse_scores, oof = [], [], np.empty(len(y_values))
+    cv = KFold(n_splits=Model_Training.CV_FOLDS, shuffle=True, random_state=42)
+    for train_idx, test_idx in cv.split(X_values):
+        preds = pygam.LinearGAM(model.terms).fit(X_values[train_idx], y_values[train_idx]).predict(X_values[test_idx])
+        r2_scores.append(r2_score(y_values[test_idx], preds))
+        rmse_scores.append(np.sqrt(mean_squared_error(y_values[test_idx], preds)))
+        oof[test_idx] = preds
+
+    # What evaluate_gam_cv now runs: the template is deep-copied per fold
+    scores, predictions = Model_Training.run_cv(pygam.LinearGAM(model.terms), X_values, y_values, index=X.index)
+
+    np.testing.assert_allclose(scores["r2"], r2_scores)
+    np.testing.assert_allclose(scores["rmse"], rmse_scores)
+    assert scores["r2"].std(ddof=0) == pytest.approx(np.std(r2_scores))
+    assert scores["rmse"].std(ddof=0) == pytest.approx(np.std(rmse_scores))
+    np.testing.assert_allclose(predictions["y_pred"], oof)
+    np.testing.assert_array_equal(predictions["row"], X.index)
@@ -0,0 +1,125 @@
+import os
+import subprocess
+import sys
+
+import joblib
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import ElasticNet
+from sklearn.metrics import r2_score
+
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+GROUP_VARS = ["user", "playing_level", "p_throws"]
+TARGET = "pitch_speed_mph"
+
+# Runs pipeline/predict.py against a scratch data/output folder instead of config.ROOT_DIR
+RUNNER = """
+import runpy, sys
+from utils import config
+config.DATA_PATH, config.OUTPUT_PATH = sys.argv[1], sys.argv[2]
+sys.argv = ["predict.py"] + sys.argv[3:]
+runpy.run_module("pipeline.predict", run_name="__main__")
+"""
+
+def label(value):
+    # group_labels(): whole-number float keys are written without ".0"
+    return str(int(value)) if isinstance(value, float) and value.is_integer() else str(value)
+
+def train_models(root):
+    from utils import config
+
+    train = pd.read_csv(os.path.join(PROJECT_DIR, "data", "train.csv"))
+    models = {}
+    for technique, make_model in [
+        ("rf", lambda: RandomForestRegressor(n_estimators=20, max_depth=4, random_state=42)),
+        ("elasticnet", lambda: ElasticNet(alpha=0.1, max_iter=5000)),
+    ]:
+        model_dir = root / "outputs" / "models" / technique
+        model_dir.mkdir(parents=True)
+        for model_name in ["force_model", "upper_body_model"]:
+            features = config.MODEL_INPUTS[model_name]
+            model = make_model().fit(train[features], train[TARGET])
+            joblib.dump(model, model_dir / f"{model_name}.joblib")
+            pd.DataFrame({"Feature": features}).to_csv(model_dir / f"{model_name}_importance.csv", index=False)
+            models[(model_name, technique)] = (model, features)
+    return models
+
+def run_predict(root, *args):
+    env = {**os.environ, "PYTHONPATH": PROJECT_DIR}
+    subprocess.run([sys.executable, "-c", RUNNER, str(root / "data"), str(root / "outputs"), *args],
+                   cwd=root, env=env, check=True, capture_output=True)
+    return root / "outputs" / "predictions"
+
+def test_grouped_predictions_match_per_group_predict(in_tmp_dir):
+    root = in_tmp_dir
+    (root / "data").mkdir()
+    test = pd.read_csv(os.path.join(PROJECT_DIR, "data", "test.csv"))
+    test.to_csv(root / "data" / "test.csv", index=False)
+    models = train_models(root)
+
+    out = run_predict(root, "--grouped_output", "parquet")
+    grouped = pd.read_parquet(out / "grouped" / "grouped_predictions.parquet")
+    group_scores = pd.read_csv(out / "global" / "metrics" / "group_scores.csv", dtype={"group_value": str})
+    assert sorted(grouped["group_col"].unique()) == sorted(GROUP_VARS)
+
+    # predict.py before grouped scoring: model.predict on every group slice separately
+    for group_col in GROUP_VARS:
+        for group_val in test[group_col].dropna().unique():
+            group_data = test[test[group_col] == group_val]
+            rows = grouped[(grouped["group_col"] == group_col) & (grouped["group_value"] == label(group_val))]
+            assert len(rows) == len(group_data)
+
+            for (model_name, technique), (model, features) in models.items():
+                colname = f"{model_name}_{technique}_pred"
+                preds = model.predict(group_data[features])
+                np.testing.assert_allclose(rows[colname].to_numpy(), preds)
+
+                score = group_scores[
+                    (group_scores["group_col"] == group_col) & (group_scores["group_value"] == label(group_val))
+                    & (group_scores["Model"] == model_name) & (group_scores["Technique"] == technique)
+                ]
+                assert score["n"].item() == len(group_data)
+                # R² is left blank where r2_score would fall back on a single or constant-velocity group
+                if len(group_data) > 1 and group_data[TARGET].nunique() > 1:
+                    assert score["R2"].item() == pytest.approx(r2_score(group_data[TARGET], preds))
+                else:
+                    assert np.isnan(score["R2"].item())
+
+def test_csv_tree_matches_parquet(in_tmp_dir):
+    root = in_tmp_dir
+    (root / "data").mkdir()
+    pd.read_csv(os.path.join(PROJECT_DIR, "data", "test.csv")).to_csv(root / "data" / "test.csv", index=False)
+    train_models(root)
+
+    out = run_predict(root, "--grouped_output", "csv")
+    grouped = pd.read_parquet(run_predict(root, "--grouped_output", "parquet") / "grouped" / "grouped_predictions.parquet")
+
+    rows = grouped[(grouped["group_col"] == "playing_level")]
+    for group_val, expected in rows.groupby("group_value"):
+        legacy = pd.read_csv(out / "grouped" / "playing_level" / group_val / "force_model" / "rf_predictions.csv")
+        pdt.assert_series_equal(
+            legacy["force_model_rf_pred"].reset_index(drop=True),
+            expected["force_model_rf_pred"].reset_index(drop=True),
+        )
+
+def test_numeric_group_keys_are_labelled_alike(in_tmp_dir):
+    # One missing user makes the column float; labels must still be "123" everywhere, not "123.0"
+    root = in_tmp_dir
+    (root / "data").mkdir()
+    test = pd.read_csv(os.path.join(PROJECT_DIR, "data", "test.csv"))
+    test.loc[0, "user"] = np.nan
+    test.to_csv(root / "data" / "test.csv", index=False)
+    train_models(root)
+
+    out = run_predict(root, "--grouped_output", "csv")
+    csv_labels = {p.name for p in (out / "grouped" / "user").iterdir()}
+    grouped = pd.read_parquet(run_predict(root, "--grouped_output", "parquet") / "grouped" / "grouped_predictions.parquet")
+    parquet_labels = set(grouped.loc[grouped["group_col"] == "user", "group_value"])
+    group_scores = pd.read_csv(out / "global" / "metrics" / "group_scores.csv", dtype={"group_value": str})
+    score_labels = set(group_scores.loc[group_scores["group_col"] == "user", "group_value"])
+
+    expected = {str(int(u)) for u in test["user"].dropna()}
+    assert csv_labels == parquet_labels == score_labels == expected
@@ -25,6 +25,55 @@ NUM_ITER = 2000
 NUM_WARMUP = 1000
 HS_GLOBAL_SCALE = 0.1  # For reference, if we use PyMC or similar later
 
+# ==============================
+# 🔹 Model Variants (feature sets)
+# ==============================
+TARGET = "pitch_speed_mph"
+
+MODEL_INPUTS = {
+    "force_model": [
+        "lead_grf_z_max"
+    ],
+    "upper_body_model": [
+        "max_shoulder_internal_rotational_velo",
+        "max_shoulder_external_rotation",
+        "max_shoulder_horizontal_abduction",
+        "elbow_transfer_fp_br"
+    ],
+    "lower_body_model": [
+        "max_torso_rotational_velo",
+        "max_rotation_hip_shoulder_separation",
+        "pelvis_anterior_tilt_fp",
+        "max_cog_velo_x",
+        "lead_knee_extension_from_fp_to_br",
+        "lead_knee_transfer_fp_br",
+        "rear_hip_generation_pkh_fp"
+    ],
+    "full_model": [
+        "lead_grf_z_max",
+        "max_shoulder_internal_rotational_velo", "max_shoulder_external_rotation",
+        "max_shoulder_horizontal_abduction", "elbow_transfer_fp_br",
+        "max_torso_rotational_velo", "max_rotation_hip_shoulder_separation",
+        "pelvis_anterior_tilt_fp", "max_cog_velo_x",
+        "lead_knee_extension_from_fp_to_br", "lead_knee_transfer_fp_br",
+        "rear_hip_generation_pkh_fp"
+    ]
+}
+
+# ==============================
+# 🔹 Technique Hyperparameters
+# ==============================
+TECHNIQUE_PARAMS = {
+    "rf": {"n_estimators": 1000, "random_state": 42},
+    "elasticnet": {"cv": 5, "random_state": 42},
+    "gam": {},  # one spline term per feature, pyGAM defaults
+    "mlp": {"hidden_layer_sizes": (64, 32), "max_iter": 1000, "activation": "relu", "solver": "adam", "random_state": 42},
+}
+
+# Random Forest warm start: grow `step` trees at a time (up to n_estimators above) until
+# out-of-bag R² improves by less than `tol` for `patience` consecutive steps
+RF_WARM_START = {"initial_trees": 100, "step": 50, "tol": 0.001, "patience": 2}
+
 # ==============================
 # 🔹 File Paths
 # ==============================
@@ -40,6 +40,76 @@ def impute_missing_values(df):
 
     return df
 
+# 🔹 Random Forest with Warm Start + Out-of-Bag Scoring
+def fit_rf_warm_start(X, y, n_jobs=-1, params=None, settings=None):
+    """
+    Grows a RandomForestRegressor in steps with warm_start, scoring each step on its out-of-bag
+    predictions, and stops once OOB R² has converged or n_estimators is reached. The OOB scores
+    stand in for 5-fold CV, so no extra refits are needed.
+    Returns (model, info) with trees used, OOB R²/RMSE, per-step history and timing.
+    """
+    import time
+    import warnings
+    import numpy as np
+    from sklearn.ensemble import RandomForestRegressor
+
+    params = dict(params if params is not None else config.TECHNIQUE_PARAMS["rf"])
+    settings = settings or config.RF_WARM_START
+    max_trees = params.pop("n_estimators", 1000)
+    n_trees = min(settings["initial_trees"], max_trees)
+
+    model = RandomForestRegressor(n_estimators=n_trees, warm_start=True, oob_score=False, n_jobs=n_jobs, **params)
+    y_values = np.asarray(y, dtype=float)
+    wall_start = time.perf_counter()
+    history, stalled = [], 0
+
+    # The first batch is grown without OOB scoring so its CPU time is pure tree building; every later
+    # fit also re-scores all existing trees out-of-bag, which says nothing about the fixed forest's cost
+    cpu_start = time.process_time()
+    model.fit(X, y_values)
+    cpu_per_tree = (time.process_time() - cpu_start) / n_trees
+
+    # Same n_estimators with oob_score on: no new trees, just the OOB pass over the first batch
+    model.set_params(oob_score=True)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        model.fit(X, y_values)
+
+    while True:
+        oob_rmse = float(np.sqrt(np.mean((y_values - model.oob_prediction_) ** 2)))
+        history.append({"trees": n_trees, "oob_r2": float(model.oob_score_), "oob_rmse": oob_rmse})
+
+        if len(history) > 1:
+            gain = history[-1]["oob_r2"] - history[-2]["oob_r2"]
+            stalled = stalled + 1 if gain < settings["tol"] else 0
+        if stalled >= settings["patience"] or n_trees >= max_trees:
+            break
+
+        n_trees = min(n_trees + settings["step"], max_trees)
+        model.set_params(n_estimators=n_trees)
+        model.fit(X, y_values)
+
+    model.set_params(warm_start=False)
+    wall_s = time.perf_counter() - wall_start
+
+    # Extrapolated, not measured: the pre-warm-start cost at the per-tree build cost of the first
+    # batch. That code fit max_trees single-threaded once on all rows, then evaluate_cv_model ran
+    # cross_val_score twice (R² and MSE), i.e. 2 x 5 refits on 80% of the rows
+    cv_refits = 2 * 5
+    baseline_s = cpu_per_tree * max_trees * (1 + cv_refits * 0.8)
+    info = {
+        "trees": n_trees,
+        "max_trees": max_trees,
+        "oob_r2": history[-1]["oob_r2"],
+        "oob_rmse": history[-1]["oob_rmse"],
+        "history": history,
+        "wall_s": wall_s,
+        "baseline_est_s": baseline_s,
+        "baseline_cv_refits": cv_refits,
+        "time_saved_s": max(baseline_s - wall_s, 0.0),
+    }
+    return model, info
+
 # 🔹 Test Block
 if __name__ == "__main__":
     if config is not None:
@@ -2,16 +2,22 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import os
+from scripts.feature_store import load_features
 
 # --- File paths ---
-DATA_PATH = r"C:\Repos\NBA_Shot\data\cleaned_shots.csv"
 PLOT_DIR = r"C:\Repos\NBA_Shot\output\plots"
 DIST_BUCKET_PATH = r"C:\Repos\NBA_Shot\output\make_pct_by_dist_bucket.csv"
 
-# --- Cache CSV loads ---
+# Only the columns this page displays are read from the feature store
+PAGE_COLUMNS = [
+    "PLAYER_NAME", "SHOT_MADE", "PTS_TYPE", "SHOT_DIST", "CLOSE_DEF_DIST", "TOUCH_TIME",
+    "DRIBBLES", "SHOT_CLOCK", "SHOOTER_HEIGHT", "DEFENDER_HEIGHT", "HEIGHT_DIFFERENTIAL"
+]
+
+# --- Cache data loads ---
 @st.cache_data
 def load_cleaned_data():
-    return pd.read_csv(DATA_PATH)
+    return load_features(PAGE_COLUMNS)
 
 @st.cache_data
 def load_dist_bucket():
@@ -0,0 +1,149 @@
+# models/feature_pipeline.py
+
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from model_config import FEATURES, BUNDLE_DIR, MODEL_DIR, read_split_manifest, save_model, load_model
+
+# --- Interaction Terms ---
+# name -> (left, right). Several names are the same product under the label each model was trained with.
+INTERACTIONS = {
+    "SCxTT": ("SHOT_CLOCK", "TOUCH_TIME"),
+    "CDxHD": ("CLOSE_DEF_DIST", "HEIGHT_DIFFERENTIAL"),
+    "CLOCK_TOUCH": ("SHOT_CLOCK", "TOUCH_TIME"),
+    "HEIGHT_CLOSE": ("HEIGHT_DIFFERENTIAL", "CLOSE_DEF_DIST"),
+    "DIST_x_CLOSE_DEF": ("SHOT_DIST", "CLOSE_DEF_DIST"),
+    "DIST_x_DEF": ("SHOT_DIST", "CLOSE_DEF_DIST"),
+}
+
+# --- Distance Bins ---
+# Same as pd.cut(SHOT_DIST, DIST_BINS, labels=DIST_LABELS) + get_dummies(drop_first=True):
+# right-closed bins, "0-5" is the dropped baseline, out-of-range distances get all zeros
+DIST_BINS = [0, 5, 10, 15, 20, 25, 100]
+DIST_LABELS = ["0-5", "5-10", "10-15", "15-20", "20-25", "25+"]
+DIST_DUMMIES = [f"DIST_BIN_{label}" for label in DIST_LABELS[1:]]
+
+# --- Feature Sets Per Model ---
+FEATURE_SETS = {
+    "logreg": ["SHOT_DIST", "SHOT_CLOCK", "HEIGHT_DIFFERENTIAL", "SCxTT", "CDxHD"],
+    "rf_v1": ["SHOT_DIST", "SHOT_CLOCK", "HEIGHT_DIFFERENTIAL", "CLOCK_TOUCH", "HEIGHT_CLOSE"],
+    "rf_v3": ["SHOT_DIST", "SHOT_CLOCK", "CLOSE_DEF_DIST", "TOUCH_TIME", "HEIGHT_DIFFERENTIAL", "CLOCK_TOUCH", "HEIGHT_CLOSE"],
+    "xgb_v1": ["SHOT_DIST", "CLOSE_DEF_DIST", "TOUCH_TIME", "SHOT_CLOCK", "HEIGHT_DIFFERENTIAL", "DIST_x_CLOSE_DEF"],
+    "xgb_v2": FEATURES + ["DIST_x_DEF"] + DIST_DUMMIES,
+}
+FEATURE_SETS["rf_v2"] = FEATURE_SETS["rf_v1"]
+
+PIPELINE_FILE = "feature_pipeline.pkl"
+
+class ShotFeaturePipeline(BaseEstimator, TransformerMixin):
+    """
+    Builds every interaction and DIST_BIN dummy from the split's base columns in one NumPy pass.
+    fit() freezes the input and output schema; transform() returns a DataFrame with
+    feature_names_out_ columns (or just `columns`), so sklearn/XGBoost name checks still pass.
+    """
+
+    def fit(self, X, y=None):
+        missing = sorted({c for pair in INTERACTIONS.values() for c in pair} - set(X.columns))
+        if missing:
+            raise ValueError(f"Missing base columns for feature pipeline: {missing}")
+        self.feature_names_in_ = np.array(X.columns, dtype=object)
+        self.feature_names_out_ = list(X.columns) + list(INTERACTIONS) + DIST_DUMMIES
+        return self
+
+    def dist_bin_codes(self, X):
+        """
+        Bin index per row (0 = "0-5" ... 5 = "25+"), -1 where pd.cut would give NaN.
+        """
+        dist = X["SHOT_DIST"].to_numpy(dtype=float)
+        codes = np.searchsorted(DIST_BINS, dist, side="left") - 1
+        codes[(dist <= DIST_BINS[0]) | (dist > DIST_BINS[-1]) | np.isnan(dist)] = -1
+        return codes
+
+    def transform(self, X, columns=None):
+        inputs = list(self.feature_names_in_)
+        base = X[inputs].to_numpy(dtype=float)
+        position = {name: i for i, name in enumerate(inputs)}
+
+        # Each distinct product is computed once, then written under every alias
+        products = {}
+        for left, right in INTERACTIONS.values():
+            key = tuple(sorted((left, right)))
+            if key not in products:
+                products[key] = base[:, position[left]] * base[:, position[right]]
+
+        codes = self.dist_bin_codes(X)
+        out = np.empty((len(base), len(self.feature_names_out_)), dtype=float)
+        out[:, :len(inputs)] = base
+        for i, (left, right) in enumerate(INTERACTIONS.values(), start=len(inputs)):
+            out[:, i] = products[tuple(sorted((left, right)))]
+        out[:, -len(DIST_DUMMIES):] = codes[:, None] == np.arange(1, len(DIST_LABELS))
+
+        frame = pd.DataFrame(out, columns=self.feature_names_out_, index=X.index)
+        return frame if columns is None else frame[columns]
+
+    def get_feature_names_out(self, input_features=None):
+        return np.array(self.feature_names_out_, dtype=object)
+
+    def signature(self):
+        """
+        Hash of the schema and feature definitions; changes whenever transform output would.
+        """
+        spec = [list(self.feature_names_in_), INTERACTIONS, DIST_BINS, DIST_LABELS]
+        return hashlib.sha256(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+
+# --- Fit / Reuse ---
+def get_pipeline(X_train=None, refit=False):
+    """
+    Loads the saved pipeline from models/trained, or fits it on X_train and saves it,
+    so training, evaluation and scoring all transform with the same object.
+    """
+    if os.path.exists(os.path.join(MODEL_DIR, PIPELINE_FILE)) and not refit:
+        pipeline = load_model(PIPELINE_FILE)
+        if X_train is None or list(pipeline.feature_names_in_) == list(X_train.columns):
+            return pipeline
+    if X_train is None:
+        raise FileNotFoundError(f"{PIPELINE_FILE} not found; pass X_train to fit it")
+    pipeline = ShotFeaturePipeline().fit(X_train)
+    save_model(pipeline, PIPELINE_FILE)
+    return pipeline
+
+# --- Per-Split Cache ---
+def engineered_splits(X_splits, pipeline, bundle_dir=BUNDLE_DIR):
+    """
+    X_splits: {"train": X_train, ...} from load_split_data. Returns the engineered frames,
+    cached as .npy next to the split bundle and reused while the bundle and pipeline are unchanged.
+    """
+    split_manifest = read_split_manifest(bundle_dir)
+    cache_key = hashlib.sha256(
+        (json.dumps(split_manifest, sort_keys=True) + pipeline.signature()).encode("utf-8")
+    ).hexdigest()
+    manifest_path = os.path.join(bundle_dir, "features.json")
+
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = {}
+
+    # Splits already cached under this key; a new key starts the cache over
+    cached_splits = set(cached.get("splits", [])) if cached.get("key") == cache_key else set()
+
+    frames = {}
+    for name, X in X_splits.items():
+        path = os.path.join(bundle_dir, f"features_{name}.npy")
+        if split_manifest is not None and name in cached_splits and os.path.exists(path):
+            values = np.load(path, mmap_mode="r")
+            frames[name] = pd.DataFrame(np.asarray(values), columns=pipeline.feature_names_out_, index=X.index)
+        else:
+            frames[name] = pipeline.transform(X)
+            if split_manifest is not None:
+                np.save(path, frames[name].to_numpy())
+                cached_splits.add(name)
+
+    if split_manifest is not None:
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump({"key": cache_key, "splits": sorted(cached_splits), "columns": pipeline.feature_names_out_}, f, indent=2)
+    return frames
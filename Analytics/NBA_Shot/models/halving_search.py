@@ -0,0 +1,112 @@
+# models/halving_search.py
+
+import os
+import json
+import time
+import math
+import hashlib
+import itertools
+
+# --- Search Space ---
+def grid_configs(param_grid):
+    """
+    Every combination of a GridSearchCV-style param_grid, as a list of dicts (stable order).
+    """
+    keys = sorted(param_grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(param_grid[k] for k in keys))]
+
+def config_key(params):
+    return hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:12]
+
+def rung_budgets(min_budget, max_budget, eta):
+    """
+    Budgets min_budget, min_budget*eta, ... capped at max_budget (the last rung is always max_budget).
+    """
+    budgets = [min_budget]
+    while budgets[-1] * eta < max_budget:
+        budgets.append(budgets[-1] * eta)
+    if budgets[-1] < max_budget:
+        budgets.append(max_budget)
+    return budgets
+
+# --- Trial Ledger ---
+# One JSON line per finished trial. `data_key` ties a trial to the data/features it was scored on,
+# so a ledger from an older split is ignored instead of mixed in.
+
+def load_ledger(path, data_key):
+    trials = {}
+    if not os.path.exists(path):
+        return trials
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                trial = json.loads(line)
+            except ValueError:
+                continue  # partial line from an interrupted write
+            if trial.get("data_key") == data_key:
+                trials[(trial["config"], trial["budget"])] = trial
+    return trials
+
+def append_ledger(path, trial):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(trial, default=str) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+# --- Successive Halving ---
+def successive_halving(configs, fit_trial, ledger_path, data_key, min_budget, max_budget, eta=3, log=print):
+    """
+    Scores every config at min_budget, keeps the best 1/eta, multiplies the budget by eta and repeats
+    until max_budget. fit_trial(params, budget) -> {"score": lower-is-better, ...extra fields}.
+    Finished trials are read back from the ledger, so an interrupted search resumes where it stopped.
+    Returns (best_trial, all_trials_this_search).
+    """
+    done = load_ledger(ledger_path, data_key)
+    by_key = {config_key(p): p for p in configs}
+    survivors = list(by_key)
+    trials = []
+
+    budgets = rung_budgets(min_budget, max_budget, eta)
+    for rung, budget in enumerate(budgets):
+        log(f"🪜 Rung {rung + 1}/{len(budgets)}: {len(survivors)} configs at budget {budget}")
+        rung_trials = []
+        for key in survivors:
+            trial = done.get((key, budget))
+            if trial is None:
+                start = time.perf_counter()
+                result = fit_trial(by_key[key], budget)
+                trial = {
+                    "data_key": data_key,
+                    "config": key,
+                    "params": by_key[key],
+                    "rung": rung,
+                    "budget": budget,
+                    **result,
+                    "seconds": round(time.perf_counter() - start, 3),
+                    "finished_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                }
+                append_ledger(ledger_path, trial)
+            rung_trials.append(trial)
+
+        rung_trials.sort(key=lambda t: t["score"])
+        trials.extend(rung_trials)
+        log(f"   best score {rung_trials[0]['score']:.5f} ({rung_trials[0]['params']})")
+        if rung < len(budgets) - 1:
+            survivors = [t["config"] for t in rung_trials[:max(1, math.ceil(len(rung_trials) / eta))]]
+
+    best = min((t for t in trials if t["budget"] == budgets[-1]), key=lambda t: t["score"])
+    return best, trials
+
+# --- Report ---
+def update_report(path, row, key="search"):
+    """
+    Upserts one row (by `key`) into a small CSV report so runs of different modes sit side by side.
+    """
+    import pandas as pd
+    report = pd.read_csv(path) if os.path.exists(path) else pd.DataFrame(columns=list(row))
+    report = report[report[key] != row[key]]
+    report = pd.concat([report, pd.DataFrame([row])], ignore_index=True)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    report.to_csv(path, index=False)
+    return report
@@ -1,11 +1,19 @@
 import os
+import sys
+import json
+import hashlib
+import numpy as np
 import pandas as pd
 from sklearn.model_selection import train_test_split
 
+# Enable script imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scripts.feature_store import load_features, SOURCE_PATH
+
 # --- Paths ---
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__)))
-DATA_PATH = os.path.join(BASE_DIR, "..", "data", "cleaned_shots.csv")
 SPLIT_DIR = os.path.join(BASE_DIR, "data")
+BUNDLE_DIR = os.path.join(SPLIT_DIR, "splits")
 MODEL_DIR = os.path.join(BASE_DIR, "trained")
 
 os.makedirs(SPLIT_DIR, exist_ok=True)
@@ -24,6 +32,12 @@ META_COLS = [
 ]
 
 TARGET = "SHOT_MADE"
+ID_COL = "SHOT_EVENT_ID"
+SPLITS = ["train", "val", "test"]
+
+# Every column stored in the split bundle, once each (META_COLS overlap FEATURES)
+BUNDLE_COLUMNS = list(dict.fromkeys(FEATURES + [ID_COL, TARGET] + META_COLS))
+BUNDLE_VERSION = 1
 
 # --- Hyperparameters ---
 RF_PARAMS = {
@@ -41,55 +55,136 @@ LOGREG_PARAMS = {
     "random_state": 42
 }
 
-# --- Split & Save ---
-def prepare_data(test_size=0.2, val_size=0.15, stratify=True, seed=42):
-    df = pd.read_csv(DATA_PATH)
+# --- Split Bundle ---
+# Splits live in models/data/splits/ as one .npy per column over all rows, plus one
+# index array per split and a manifest.json (columns, dtypes, sizes, source hash).
+# Columns are memory-mapped on load, so no text is parsed and no row is stored twice.
+
+def _file_sha256(paths):
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def _file_signature(paths):
+    return [[os.path.basename(p), os.path.getsize(p), os.stat(p).st_mtime_ns] for p in paths]
+
+def _legacy_csv_paths():
+    return [os.path.join(SPLIT_DIR, f"{kind}_{name}.csv") for name in SPLITS for kind in ("X", "y")]
+
+def write_split_bundle(df, indices, source, bundle_dir=BUNDLE_DIR):
+    """
+    Saves df[BUNDLE_COLUMNS] column-by-column plus the row indices of each split.
+    `source` describes where the rows came from and is stored in the manifest.
+    """
+    os.makedirs(bundle_dir, exist_ok=True)
+    columns = {}
+    for col in BUNDLE_COLUMNS:
+        values = df[col].to_numpy()
+        if values.dtype == object or not np.issubdtype(values.dtype, np.number):
+            values = values.astype(str)  # fixed-width unicode, still memory-mappable
+        np.save(os.path.join(bundle_dir, f"col_{col}.npy"), values)
+        columns[col] = values.dtype.str
+
+    for name in SPLITS:
+        np.save(os.path.join(bundle_dir, f"idx_{name}.npy"), np.asarray(indices[name], dtype=np.int32))
+
+    manifest = {
+        "version": BUNDLE_VERSION,
+        "rows": len(df),
+        "columns": columns,
+        "splits": {name: len(indices[name]) for name in SPLITS},
+        "source": source,
+    }
+    # Manifest last: a bundle without one is treated as missing
+    with open(os.path.join(bundle_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def read_split_manifest(bundle_dir=BUNDLE_DIR):
+    try:
+        with open(os.path.join(bundle_dir, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != BUNDLE_VERSION or list(manifest.get("columns", {})) != BUNDLE_COLUMNS:
+        return None
+    return manifest
+
+def import_split_csvs(bundle_dir=BUNDLE_DIR):
+    """
+    One-time conversion of the six X_/y_ CSVs into a bundle, for splits made before it existed.
+    """
+    frames, indices, offset = [], {}, 0
+    for name in SPLITS:
+        X = pd.read_csv(os.path.join(SPLIT_DIR, f"X_{name}.csv"))
+        y_df = pd.read_csv(os.path.join(SPLIT_DIR, f"y_{name}.csv"), usecols=[TARGET])
+        X[TARGET] = y_df[TARGET].to_numpy()
+        frames.append(X)
+        indices[name] = np.arange(offset, offset + len(X))
+        offset += len(X)
+
+    paths = _legacy_csv_paths()
+    source = {"kind": "split_csv", "sha256": _file_sha256(paths), "files": _file_signature(paths)}
+    manifest = write_split_bundle(pd.concat(frames, ignore_index=True), indices, source, bundle_dir)
+    print(f"📦 Imported split CSVs into {bundle_dir}")
+    return manifest
 
-    # --- Derived Binary Flags ---
-    df["HAS_HEIGHT_ADVANTAGE"] = (df["HEIGHT_DIFFERENTIAL"] >= 5).astype(int)
-    df["LOW_CLOCK"] = (df["SHOT_CLOCK"] <= 5).astype(int)
-    df["LONG_TOUCH"] = (df["TOUCH_TIME"] >= 10).astype(int)
-    df["HIGH_DRIBBLE"] = (df["DRIBBLES"] >= 5).astype(int)
+# --- Split & Save ---
+def prepare_data(test_size=0.2, val_size=0.15, stratify=True, seed=42, bundle_dir=BUNDLE_DIR):
+    # Derived flags come pre-materialized from the feature store; only needed columns are read
+    df = load_features(BUNDLE_COLUMNS)
 
     # --- Ensure target is numeric ---
     df["SHOT_MADE"] = df["SHOT_MADE"].astype(int)
 
-    # --- Define input + metadata ---
-    X_full = df[FEATURES + ["SHOT_EVENT_ID"]]
-    y_full = df[[TARGET] + META_COLS]  # This becomes the "meta" payload in model_eval
+    # Split row positions rather than copies of the data; same shuffles as splitting the frames
+    rows = np.arange(len(df))
 
     # Step 1: Train+Val vs Test
-    strat = y_full[TARGET] if stratify else None
-    X_temp, X_test, y_temp, y_test = train_test_split(
-        X_full, y_full, test_size=test_size, stratify=strat, random_state=seed
+    strat = df[TARGET] if stratify else None
+    temp_idx, test_idx = train_test_split(
+        rows, test_size=test_size, stratify=strat, random_state=seed
     )
 
     # Step 2: Train vs Val
     val_ratio = val_size / (1 - test_size)
-    strat_temp = y_temp[TARGET] if stratify else None
-    X_train, X_val, y_train, y_val = train_test_split(
-        X_temp, y_temp, test_size=val_ratio, stratify=strat_temp, random_state=seed
+    strat_temp = df[TARGET].iloc[temp_idx] if stratify else None
+    train_idx, val_idx = train_test_split(
+        temp_idx, test_size=val_ratio, stratify=strat_temp, random_state=seed
     )
 
-    # Save features and enriched y (with meta)
-    for name, X, y in [
-        ("train", X_train, y_train),
-        ("val", X_val, y_val),
-        ("test", X_test, y_test)
-    ]:
-        X.to_csv(os.path.join(SPLIT_DIR, f"X_{name}.csv"), index=False)
-        y.to_csv(os.path.join(SPLIT_DIR, f"y_{name}.csv"), index=False)
+    source = {
+        "kind": "cleaned_shots",
+        "sha256": _file_sha256([SOURCE_PATH]),
+        "params": {"test_size": test_size, "val_size": val_size, "stratify": stratify, "seed": seed},
+    }
+    write_split_bundle(df, {"train": train_idx, "val": val_idx, "test": test_idx}, source, bundle_dir)
 
-    print("✅ Splits saved with SHOT_EVENT_ID + all diagnostics in y_*.csv")
+    print(f"✅ Splits saved to {bundle_dir} with SHOT_EVENT_ID + all diagnostics")
 
 # --- Load Split Data ---
-def load_split_data():
+def load_split_data(bundle_dir=BUNDLE_DIR):
+    manifest = read_split_manifest(bundle_dir)
+    legacy = _legacy_csv_paths()
+    stale_import = (
+        manifest is not None and manifest["source"]["kind"] == "split_csv"
+        and all(os.path.exists(p) for p in legacy)
+        and manifest["source"]["files"] != _file_signature(legacy)
+    )
+    if manifest is None or stale_import:
+        import_split_csvs(bundle_dir)
+
+    columns = {col: np.load(os.path.join(bundle_dir, f"col_{col}.npy"), mmap_mode="r") for col in BUNDLE_COLUMNS}
+
     def load_set(name):
-        X = pd.read_csv(os.path.join(SPLIT_DIR, f"X_{name}.csv"))
-        y_df = pd.read_csv(os.path.join(SPLIT_DIR, f"y_{name}.csv"))
-        y = y_df[TARGET].values.ravel()
-        meta = y_df[META_COLS]
-        return X.drop(columns=["SHOT_EVENT_ID"]), y, meta
+        idx = np.load(os.path.join(bundle_dir, f"idx_{name}.npy"))
+        X = pd.DataFrame({col: columns[col][idx] for col in FEATURES})
+        y = columns[TARGET][idx]
+        meta = pd.DataFrame({col: columns[col][idx] for col in META_COLS})
+        return X, y, meta
 
     X_train, y_train, meta_train = load_set("train")
     X_val, y_val, meta_val = load_set("val")
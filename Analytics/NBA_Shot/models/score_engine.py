@@ -0,0 +1,168 @@
+# models/score_engine.py
+
+import os
+import time
+import argparse
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from model_config import FEATURES, TARGET, META_COLS, MODEL_DIR, load_model, load_split_data
+from feature_pipeline import get_pipeline, FEATURE_SETS
+from scripts.feature_store import add_derived_flags
+
+# --- Model Catalogue ---
+# prefix -> (label, pickle, feature set); prefixes become the {prefix}_prob / {prefix}_pred columns
+MODEL_SPECS = OrderedDict([
+    ("logreg_v1", ("Logistic Regression (v1)", "logreg_model.pkl", "logreg")),
+    ("logreg_v2", ("Logistic Regression (v2)", "logreg_model_v2.pkl", "logreg")),
+    ("rf_v1", ("Random Forest (v1)", "rf_model.pkl", "rf_v1")),
+    ("rf_v2", ("Random Forest (v2)", "rf_model_v2.pkl", "rf_v2")),
+    ("rf_v3", ("Random Forest (v3)", "rf_model_v3.pkl", "rf_v3")),
+    ("xgb_v1", ("XGBoost (v1)", "xgb_model.pkl", "xgb_v1")),
+    ("xgb_v2", ("XGBoost (v2)", "xgb_model_v2.pkl", "xgb_v2")),
+])
+
+BUDGET_MB = 512         # models kept in memory at once, measured by pickle size on disk
+CHUNK_ROWS = 100_000
+MAX_WORKERS = 4
+
+# --- Lazy Model Registry ---
+class ModelRegistry:
+    """
+    Loads models on first use and keeps the most recently used ones within budget_mb.
+    Pickle size on disk stands in for memory footprint. The model just requested is
+    never evicted, even if it alone exceeds the budget.
+    """
+
+    def __init__(self, budget_mb=BUDGET_MB, specs=MODEL_SPECS):
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self.specs = specs
+        self.models = OrderedDict()   # prefix -> (model, size)
+        self.lock = threading.Lock()
+        self.load_locks = {prefix: threading.Lock() for prefix in specs}
+        self.stats = {"loads": 0, "hits": 0, "evictions": 0}
+
+    def get(self, prefix):
+        with self.lock:
+            if prefix in self.models:
+                self.models.move_to_end(prefix)
+                self.stats["hits"] += 1
+                return self.models[prefix][0]
+
+        # One loader per model; other threads asking for it wait instead of loading twice
+        with self.load_locks[prefix]:
+            with self.lock:
+                if prefix in self.models:
+                    self.models.move_to_end(prefix)
+                    self.stats["hits"] += 1
+                    return self.models[prefix][0]
+
+            filename = self.specs[prefix][1]
+            model = load_model(filename)
+            size = os.path.getsize(os.path.join(MODEL_DIR, filename))
+
+            with self.lock:
+                self.models[prefix] = (model, size)
+                self.stats["loads"] += 1
+                while len(self.models) > 1 and self.resident_bytes() > self.budget_bytes:
+                    self.models.popitem(last=False)
+                    self.stats["evictions"] += 1
+            return model
+
+    def resident_bytes(self):
+        return sum(size for _, size in self.models.values())
+
+    def feature_names(self, prefix, model):
+        # Fitted sklearn/XGBoost models remember their training columns; fall back to the catalogue
+        names = getattr(model, "feature_names_in_", None)
+        return list(names) if names is not None else FEATURE_SETS[self.specs[prefix][2]]
+
+# --- Scoring ---
+def _score_model(registry, prefix, features):
+    model = registry.get(prefix)
+    probs = model.predict_proba(features[registry.feature_names(prefix, model)])[:, 1]
+    # Binary predict() is argmax of predict_proba, so no second pass over the trees
+    preds = model.classes_[(probs > 0.5).astype(int)]
+    return prefix, probs, preds
+
+def score_frame(df, registry, pipeline, prefixes=None, pool=None):
+    """
+    Scores one frame of shots with every model in `prefixes`. df needs FEATURES; META_COLS and
+    SHOT_MADE are carried into the output (as y_true) when present. The features are built once
+    and shared by all models, which run concurrently on `pool`.
+    """
+    prefixes = list(prefixes or registry.specs)
+    features = pipeline.transform(df[FEATURES])
+
+    out = df[[c for c in META_COLS if c in df.columns]].copy()
+    if TARGET in df.columns:
+        out["y_true"] = df[TARGET].astype(int).to_numpy()
+
+    if pool is None:
+        results = [_score_model(registry, prefix, features) for prefix in prefixes]
+    else:
+        results = list(pool.map(lambda prefix: _score_model(registry, prefix, features), prefixes))
+
+    scores = {}
+    for prefix, probs, preds in results:
+        scores[f"{prefix}_prob"] = probs
+        scores[f"{prefix}_pred"] = preds
+    return pd.concat([out, pd.DataFrame(scores, index=out.index)], axis=1)
+
+def _iter_chunks(path, chunk_rows):
+    if path.endswith((".feather", ".arrow")):
+        import pyarrow.ipc as ipc
+        reader = ipc.open_file(path)
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i).to_pandas()
+    elif path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_rows)
+
+def score_file(input_path, output_path, prefixes=None, chunk_rows=CHUNK_ROWS,
+               max_workers=MAX_WORKERS, budget_mb=BUDGET_MB, pipeline=None):
+    """
+    Streams a shot file (CSV, Parquet or Feather) through every model chunk by chunk and appends
+    the scored rows to output_path, so memory stays bounded by one chunk. Returns rows scored.
+    """
+    if pipeline is None:
+        try:
+            pipeline = get_pipeline()
+        except FileNotFoundError:
+            pipeline = get_pipeline(load_split_data()[0])
+    registry = ModelRegistry(budget_mb)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = output_path + ".tmp"
+    total, start = 0, time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool, open(tmp_path, "w", newline="") as out:
+        for i, chunk in enumerate(_iter_chunks(input_path, chunk_rows)):
+            if "HAS_HEIGHT_ADVANTAGE" not in chunk.columns:
+                # Raw cleaned_shots rows: derive the flags the same way the feature store does
+                chunk = add_derived_flags(chunk)
+            scored = score_frame(chunk, registry, pipeline, prefixes, pool)
+            scored.to_csv(out, index=False, header=(i == 0))
+            total += len(scored)
+            print(f"🏀 Chunk {i + 1}: {len(scored):,} rows scored ({total:,} total)")
+    os.replace(tmp_path, output_path)
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ Scored {total:,} shots in {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} rows/s) → {output_path}")
+    print(f"📦 Registry: {registry.stats}")
+    return total
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score a shot file with the trained NBA_Shot models.")
+    parser.add_argument("--input", required=True, help="CSV, Parquet or Feather file with the model FEATURES")
+    parser.add_argument("--output", default="output/model_test_predictions.csv", help="Scored CSV path")
+    parser.add_argument("--models", nargs="+", choices=list(MODEL_SPECS), help="Subset of model prefixes (default: all)")
+    parser.add_argument("--chunk_rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Models scored concurrently per chunk")
+    parser.add_argument("--budget_mb", type=float, default=BUDGET_MB, help="Memory budget for loaded models")
+    args = parser.parse_args()
+
+    score_file(args.input, args.output, args.models, args.chunk_rows, args.workers, args.budget_mb)
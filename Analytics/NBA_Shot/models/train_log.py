@@ -5,19 +5,16 @@ from sklearn.pipeline import Pipeline
 from sklearn.model_selection import GridSearchCV
 from sklearn.metrics import log_loss, accuracy_score
 from model_config import load_split_data, save_model
+from feature_pipeline import get_pipeline, engineered_splits, FEATURE_SETS
 
 # --- Load Data ---
 X_train, X_val, X_test, y_train, y_val, y_test, meta_train, meta_val, meta_test = load_split_data()
 
-# --- Selected Features + Manual Interactions ---
-def engineer_features(df):
-    df = df.copy()
-    df["SCxTT"] = df["SHOT_CLOCK"] * df["TOUCH_TIME"]
-    df["CDxHD"] = df["CLOSE_DEF_DIST"] * df["HEIGHT_DIFFERENTIAL"]
-    return df[["SHOT_DIST", "SHOT_CLOCK", "HEIGHT_DIFFERENTIAL", "SCxTT", "CDxHD"]]
-
-X_train_fe = engineer_features(X_train)
-X_val_fe   = engineer_features(X_val)
+# --- Shared Feature Pipeline ---
+pipeline_fe = get_pipeline(X_train)
+X_fe = engineered_splits({"train": X_train, "val": X_val}, pipeline_fe)
+X_train_fe = X_fe["train"][FEATURE_SETS["logreg"]]
+X_val_fe   = X_fe["val"][FEATURE_SETS["logreg"]]
 
 # --- Define Pipeline ---
 pipeline = Pipeline([
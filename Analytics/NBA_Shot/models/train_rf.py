@@ -5,25 +5,19 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import GridSearchCV
 from sklearn.metrics import log_loss, accuracy_score
 from model_config import load_split_data, save_model
+from feature_pipeline import get_pipeline, engineered_splits, FEATURE_SETS
 
 # --- Load Data ---
 X_train, X_val, X_test, y_train, y_val, y_test, meta_train, meta_val, meta_test = load_split_data()
 
-# --- Feature Engineering ---
-for df in [X_train, X_val, X_test]:
-    df["CLOCK_TOUCH"] = df["SHOT_CLOCK"] * df["TOUCH_TIME"]
-    df["HEIGHT_CLOSE"] = df["HEIGHT_DIFFERENTIAL"] * df["CLOSE_DEF_DIST"]
+# --- Feature Engineering (shared pipeline, cached per split) ---
+pipeline_fe = get_pipeline(X_train)
+X_train, X_val, X_test = engineered_splits({"train": X_train, "val": X_val, "test": X_test}, pipeline_fe).values()
 
 # --- Selected Features (refined from VIF + MI + RF importance) ---
-selected_features = [
-    "SHOT_DIST",
-    "SHOT_CLOCK",
-    "CLOSE_DEF_DIST",
-    "TOUCH_TIME",               # Using TOUCH_TIME over DRIBBLES
-    "HEIGHT_DIFFERENTIAL",
-    "CLOCK_TOUCH",              # Interaction
-    "HEIGHT_CLOSE"              # Interaction
-]
+# SHOT_DIST, SHOT_CLOCK, CLOSE_DEF_DIST, TOUCH_TIME (over DRIBBLES), HEIGHT_DIFFERENTIAL
+# + interactions CLOCK_TOUCH, HEIGHT_CLOSE
+selected_features = FEATURE_SETS["rf_v3"]
 
 # --- Define Full Grid ---
 param_grid = {
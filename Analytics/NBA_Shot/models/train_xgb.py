@@ -6,18 +6,16 @@ from xgboost import XGBClassifier
 from sklearn.model_selection import GridSearchCV
 from sklearn.metrics import log_loss, accuracy_score
 from model_config import load_split_data, save_model
+from feature_pipeline import get_pipeline, engineered_splits, FEATURE_SETS
 
 # --- Load Data ---
 X_train, X_val, X_test, y_train, y_val, y_test, meta_train, meta_val, meta_test = load_split_data()
 
-# --- Feature Engineering ---
-for df in [X_train, X_val, X_test]:
-    df["DIST_x_CLOSE_DEF"] = df["SHOT_DIST"] * df["CLOSE_DEF_DIST"]
+# --- Feature Engineering (shared pipeline, cached per split) ---
+pipeline_fe = get_pipeline(X_train)
+X_train, X_val, X_test = engineered_splits({"train": X_train, "val": X_val, "test": X_test}, pipeline_fe).values()
 
-selected_features = [
-    "SHOT_DIST", "CLOSE_DEF_DIST", "TOUCH_TIME", "SHOT_CLOCK", "HEIGHT_DIFFERENTIAL",
-    "DIST_x_CLOSE_DEF"
-]
+selected_features = FEATURE_SETS["xgb_v1"]
 
 # --- Define Param Grid ---
 param_grid = {
@@ -1,41 +1,46 @@
 import pandas as pd
 import numpy as np
 import os
+import json
+import time
+import hashlib
+import argparse
 from xgboost import XGBClassifier
 from sklearn.model_selection import GridSearchCV
 from sklearn.metrics import log_loss, accuracy_score
 from sklearn.utils.class_weight import compute_sample_weight
-from model_config import load_split_data, save_model
+from model_config import load_split_data, save_model, read_split_manifest
+from feature_pipeline import get_pipeline, engineered_splits, FEATURE_SETS
+from halving_search import grid_configs, successive_halving, update_report
 import warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="xgboost")
 
+# --- Tuning Mode ---
+parser = argparse.ArgumentParser(description="Tune and train XGBoost v2.")
+parser.add_argument("--search", choices=["halving", "grid"], default="halving",
+                    help="halving: successive halving on boosting rounds with early stopping on the validation split; "
+                         "grid: the original 5-fold GridSearchCV")
+parser.add_argument("--min_rounds", type=int, default=50, help="Boosting rounds in the first halving rung")
+parser.add_argument("--max_rounds", type=int, default=1350, help="Boosting rounds in the last halving rung")
+parser.add_argument("--eta", type=int, default=3, help="Keep the best 1/eta configs per rung")
+parser.add_argument("--early_stopping", type=int, default=30, help="Stop a trial after this many rounds without val improvement")
+parser.add_argument("--ledger", default="output/xgb_v2_trials.jsonl", help="Trial ledger; an interrupted search resumes from it")
+args = parser.parse_args()
+
+REPORT_PATH = "output/xgb_v2_tuning_report.csv"
+os.makedirs("output", exist_ok=True)
 
 # --- Load data ---
 X_train, X_val, X_test, y_train, y_val, y_test, meta_train, meta_val, meta_test = load_split_data()
 
-# --- Feature Engineering ---
-bins = [0, 5, 10, 15, 20, 25, 100]
-labels = ["0-5", "5-10", "10-15", "15-20", "20-25", "25+"]
-
-for df in [X_train, X_val, X_test]:
-    # Add DIST_BIN as categorical
-    df["DIST_BIN"] = pd.cut(df["SHOT_DIST"], bins=bins, labels=labels)
-
-    # Add interaction term
-    df["DIST_x_DEF"] = df["SHOT_DIST"] * df["CLOSE_DEF_DIST"]
-
-# --- One-hot encode DIST_BIN ---
-X_train = pd.get_dummies(X_train, columns=["DIST_BIN"], drop_first=True)
-X_val = pd.get_dummies(X_val, columns=["DIST_BIN"], drop_first=True)
-X_test = pd.get_dummies(X_test, columns=["DIST_BIN"], drop_first=True)
-
-# --- Ensure column alignment across all sets ---
-X_val = X_val.reindex(columns=X_train.columns, fill_value=0)
-X_test = X_test.reindex(columns=X_train.columns, fill_value=0)
+# --- Feature Engineering (shared pipeline: DIST_x_DEF + DIST_BIN one-hot, cached per split) ---
+pipeline_fe = get_pipeline(X_train)
+splits_fe = engineered_splits({"train": X_train, "val": X_val, "test": X_test}, pipeline_fe)
+X_train, X_val, X_test = (splits_fe[name][FEATURE_SETS["xgb_v2"]] for name in ["train", "val", "test"])
 
 # --- Sample Weights from DIST_BIN ---
-dist_bins_train = pd.cut(X_train["SHOT_DIST"], bins=bins, labels=labels)
-sample_weights = compute_sample_weight(class_weight="balanced", y=dist_bins_train.astype(str))
+dist_bins_train = pipeline_fe.dist_bin_codes(X_train)
+sample_weights = compute_sample_weight(class_weight="balanced", y=dist_bins_train)
 
 # --- Hyperparameter Grid ---
 param_grid = {
@@ -47,39 +52,114 @@ param_grid = {
     "min_child_weight": [1, 10]
 }
 
-# --- Initialize and Search ---
-xgb = XGBClassifier(
-    objective="binary:logistic",
-    use_label_encoder=False,
-    eval_metric="logloss",
-    random_state=42
-)
-
-search = GridSearchCV(
-    estimator=xgb,
-    param_grid=param_grid,
-    scoring="neg_log_loss",
-    cv=5,
-    verbose=1,
-    n_jobs=-1
-)
-
-search.fit(X_train, y_train, sample_weight=sample_weights)
+search_start = time.perf_counter()
+
+if args.search == "grid":
+    # --- Initialize and Search ---
+    xgb = XGBClassifier(
+        objective="binary:logistic",
+        use_label_encoder=False,
+        eval_metric="logloss",
+        random_state=42
+    )
+
+    search = GridSearchCV(
+        estimator=xgb,
+        param_grid=param_grid,
+        scoring="neg_log_loss",
+        cv=5,
+        verbose=1,
+        n_jobs=-1
+    )
+
+    search.fit(X_train, y_train, sample_weight=sample_weights)
+
+    best_model = search.best_estimator_
+    best_params = search.best_params_
+    n_configs = len(search.cv_results_["params"])
+    n_fits = n_configs * 5 + 1
+    compute_seconds = None
+    selected_on = "train (5-fold CV)"
+
+else:
+    # --- Successive Halving on Boosting Rounds ---
+    # n_estimators becomes the budget; every other grid axis defines a config
+    halving_grid = {k: v for k, v in param_grid.items() if k != "n_estimators"}
+    configs = grid_configs(halving_grid)
+
+    # Trials are only reused while the split bundle, features and weights are unchanged
+    data_key = hashlib.sha1(json.dumps([
+        read_split_manifest(), pipeline_fe.signature(), list(X_train.columns), args.early_stopping
+    ], sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+    def fit_trial(params, rounds):
+        model = XGBClassifier(
+            objective="binary:logistic",
+            eval_metric="logloss",
+            n_estimators=rounds,
+            early_stopping_rounds=args.early_stopping,
+            random_state=42,
+            **params
+        )
+        model.fit(X_train, y_train, sample_weight=sample_weights, eval_set=[(X_val, y_val)], verbose=False)
+        return {"score": float(model.best_score), "best_iteration": int(model.best_iteration)}
+
+    best_trial, trials = successive_halving(
+        configs, fit_trial, args.ledger, data_key,
+        min_budget=args.min_rounds, max_budget=args.max_rounds, eta=args.eta
+    )
+
+    # --- Refit Best Config at Its Early-Stopped Size ---
+    best_params = {**best_trial["params"], "n_estimators": best_trial["best_iteration"] + 1}
+    best_model = XGBClassifier(objective="binary:logistic", eval_metric="logloss", random_state=42, **best_params)
+    best_model.fit(X_train, y_train, sample_weight=sample_weights)
+
+    n_configs = len(configs)
+    n_fits = len(trials) + 1
+    # Includes trials finished in earlier, interrupted runs
+    compute_seconds = sum(t["seconds"] for t in trials)
+    # val drove early stopping and config choice, so val scores are optimistic for this mode
+    selected_on = "val (early stopping + selection)"
+
+search_seconds = time.perf_counter() - search_start
+compute_seconds = search_seconds if compute_seconds is None else compute_seconds
 
 # --- Evaluate Best Model ---
-best_model = search.best_estimator_
-best_params = search.best_params_
-
 y_val_probs = best_model.predict_proba(X_val)[:, 1]
 y_val_preds = best_model.predict(X_val)
 
 val_loss = log_loss(y_val, y_val_probs)
 val_acc = accuracy_score(y_val, y_val_preds)
 
-print("\n✅ XGBoost (v2) Grid Search Complete")
-print(f"Best Params: {best_params}")
+# Neither search mode sees the test split, so it is the fair ground for comparing them
+y_test_probs = best_model.predict_proba(X_test)[:, 1]
+test_loss = log_loss(y_test, y_test_probs)
+test_acc = accuracy_score(y_test, best_model.predict(X_test))
+
+print(f"\n✅ XGBoost (v2) {'Grid Search' if args.search == 'grid' else 'Successive Halving'} Complete")
+print(f"Best Params: {best_params} (selected on {selected_on})")
 print(f"Log Loss (val): {val_loss:.4f}")
 print(f"Accuracy  (val): {val_acc:.4f}")
+print(f"Log Loss (test): {test_loss:.4f}")
+print(f"Accuracy  (test): {test_acc:.4f}")
+
+# --- Tuning Report: wall clock vs held-out test log loss, one row per search mode ---
+report = update_report(REPORT_PATH, {
+    "search": args.search,
+    "configs": n_configs,
+    "fits": n_fits,
+    "wall_clock_s": round(search_seconds, 1),
+    "trial_compute_s": round(compute_seconds, 1),
+    "selected_on": selected_on,
+    "test_log_loss": round(test_loss, 5),
+    "test_accuracy": round(test_acc, 4),
+    "val_log_loss": round(val_loss, 5),
+    "val_accuracy": round(val_acc, 4),
+    "best_params": json.dumps(best_params, sort_keys=True),
+    "run_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+})
+print(f"\n📋 Tuning report ({REPORT_PATH}):")
+print(report[["search", "configs", "fits", "wall_clock_s", "test_log_loss", "selected_on"]].to_string(index=False))
 
 # --- Save Model ---
 save_model(best_model, "xgb_model_v2.pkl")
@@ -88,4 +168,3 @@ save_model(best_model, "xgb_model_v2.pkl")
 importances = pd.Series(best_model.feature_importances_, index=X_train.columns)
 importances.sort_values(ascending=False).to_csv("output/xgb_v2_feature_importance.csv")
 print("📊 Feature importances saved to output/xgb_v2_feature_importance.csv")
-
@@ -21,6 +21,9 @@ NBAStatsHTTP.headers = {
 # Add root path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from scripts.etl_logger import log_message
+from scripts.nba_cache import install_cache
+
+install_cache()  # serve repeat nba_api calls from data/cache/nba_api
 
 # Output directory
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
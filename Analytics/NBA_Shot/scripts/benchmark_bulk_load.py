@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+import argparse
+
+# Add project root to sys.path for absolute imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.db_connect import get_connection, get_sqlite_connection, bulk_load, BULK_STRATEGIES
+from scripts.benchmark_transform import make_synthetic_shots
+from scripts.load_shots import transform_frame, to_rows, SHOT_COLUMNS
+
+BENCH_TABLE = "bench_player_shot_logs"
+
+def prepare_table(conn, strategy):
+    cursor = conn.cursor()
+    if strategy == "sqlite":
+        cursor.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+    else:
+        # Same column types as player_shot_logs, no keys or indexes
+        cursor.execute(f"IF OBJECT_ID('{BENCH_TABLE}', 'U') IS NOT NULL DROP TABLE {BENCH_TABLE}")
+        cursor.execute(f"SELECT TOP 0 {', '.join(SHOT_COLUMNS)} INTO {BENCH_TABLE} FROM player_shot_logs")
+    conn.commit()
+    cursor.close()
+
+def drop_table(conn, strategy):
+    cursor = conn.cursor()
+    if strategy == "sqlite":
+        cursor.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+    else:
+        cursor.execute(f"IF OBJECT_ID('{BENCH_TABLE}', 'U') IS NOT NULL DROP TABLE {BENCH_TABLE}")
+    conn.commit()
+    cursor.close()
+
+def run_strategy(strategy, rows, batch_size):
+    conn = get_sqlite_connection("NBA_Shots_bench") if strategy == "sqlite" else get_connection()
+    try:
+        prepare_table(conn, strategy)
+        start = time.perf_counter()
+        loaded = bulk_load(conn, BENCH_TABLE, SHOT_COLUMNS, rows, strategy=strategy, batch_size=batch_size)
+        elapsed = time.perf_counter() - start
+        drop_table(conn, strategy)
+    finally:
+        conn.close()
+    return loaded, elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rows/sec for each bulk load strategy on synthetic shot logs.")
+    parser.add_argument("--rows", type=int, default=200_000, help="Synthetic rows to load per strategy")
+    parser.add_argument("--batch_size", type=int, default=10000, help="Rows per committed batch")
+    parser.add_argument("--strategies", nargs="+", choices=list(BULK_STRATEGIES), default=["sqlite"],
+                        help="Strategies to run (SQL Server strategies need a reachable server)")
+    args = parser.parse_args()
+
+    rows = to_rows(transform_frame(make_synthetic_shots(args.rows)))
+    print(f"🧪 Prepared {len(rows):,} shot rows")
+
+    results = []
+    for strategy in args.strategies:
+        try:
+            loaded, elapsed = run_strategy(strategy, rows, args.batch_size)
+            results.append((strategy, loaded, elapsed))
+            print(f"✅ {strategy:<17} {loaded:>10,} rows in {elapsed:7.2f}s | {loaded / elapsed:>12,.0f} rows/sec")
+        except Exception as e:
+            print(f"❌ {strategy:<17} failed: {e}")
+
+    if results:
+        best = max(results, key=lambda r: r[1] / r[2])
+        print(f"🏆 Fastest: {best[0]} ({best[1] / best[2]:,.0f} rows/sec)")
@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+# Add project root to sys.path for absolute imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.load_shots import transform_frame
+
+# --- Synthetic shot log in the raw shot_logs.csv layout
+def make_synthetic_shots(n_rows, seed=42):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2014-10-28", "2015-03-04").strftime("%b %d, %Y").to_numpy()
+    minutes = rng.integers(0, 12, n_rows)
+    seconds = rng.integers(0, 60, n_rows)
+    clock = pd.Series(minutes.astype(str)) + ":" + pd.Series(seconds).astype(str).str.zfill(2)
+
+    # Sprinkle in a few malformed clocks so the fallback path is exercised
+    clock[rng.random(n_rows) < 0.001] = ""
+    clock[rng.random(n_rows) < 0.001] = None
+
+    shot_clock = rng.uniform(0, 24, n_rows).round(1).astype(object)
+    shot_clock[rng.random(n_rows) < 0.04] = None
+
+    return pd.DataFrame({
+        "GAME_ID": rng.integers(21400001, 21400908, n_rows),
+        "MATCHUP": dates[rng.integers(0, len(dates), n_rows)] + " - CHA @ BKN",
+        "LOCATION": rng.choice(["H", "A"], n_rows),
+        "W": rng.choice(["W", "L"], n_rows),
+        "FINAL_MARGIN": rng.integers(-40, 40, n_rows),
+        "SHOT_NUMBER": rng.integers(1, 30, n_rows),
+        "PERIOD": rng.choice([1, 2, 3, 4, 5, 6], n_rows, p=[0.245, 0.245, 0.245, 0.245, 0.015, 0.005]),
+        "GAME_CLOCK": clock,
+        "SHOT_CLOCK": shot_clock,
+        "DRIBBLES": rng.integers(0, 20, n_rows),
+        "TOUCH_TIME": rng.uniform(0, 20, n_rows).round(1),
+        "SHOT_DIST": rng.uniform(0, 40, n_rows).round(1),
+        "PTS_TYPE": rng.choice([2, 3], n_rows),
+        "SHOT_RESULT": rng.choice(["made", "missed"], n_rows),
+        "CLOSEST_DEFENDER": "Anderson, Alan",
+        "CLOSEST_DEFENDER_PLAYER_ID": rng.integers(1, 205000, n_rows),
+        "CLOSE_DEF_DIST": rng.uniform(0, 30, n_rows).round(1),
+        "FGM": rng.integers(0, 2, n_rows),
+        "PTS": rng.choice([0, 2, 3], n_rows),
+        "player_name": "brian roberts",
+        "player_id": rng.integers(1, 205000, n_rows),
+    })
+
+def time_transform(raw, vectorized):
+    start = time.perf_counter()
+    out = transform_frame(raw.copy(), vectorized=vectorized)
+    return out, time.perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare row-wise and vectorized shot log transforms.")
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Synthetic rows to generate")
+    args = parser.parse_args()
+
+    raw = make_synthetic_shots(args.rows)
+    print(f"🧪 Generated {len(raw):,} synthetic shot rows")
+
+    fast_df, fast_secs = time_transform(raw, vectorized=True)
+    print(f"⚡ Vectorized transform: {fast_secs:.2f}s")
+
+    slow_df, slow_secs = time_transform(raw, vectorized=False)
+    print(f"🐢 Row-wise transform:   {slow_secs:.2f}s")
+
+    pd.testing.assert_frame_equal(fast_df, slow_df)
+    print(f"✅ Outputs identical | Speedup: {slow_secs / fast_secs:.1f}x")
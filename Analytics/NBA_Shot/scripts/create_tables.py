@@ -61,10 +61,17 @@ def create_tables():
             POSITION VARCHAR(30),
             TEAM_ID BIGINT,
             TEAM_NAME VARCHAR(100),
+            ROW_HASH CHAR(40),
             FOREIGN KEY (TEAM_ID) REFERENCES team_info(TEAM_ID)
         );
         """)
 
+        # Key/hash index column for incremental loads (existing databases)
+        cursor.execute("""
+        IF COL_LENGTH('player_info', 'ROW_HASH') IS NULL
+        ALTER TABLE player_info ADD ROW_HASH CHAR(40);
+        """)
+
         # --- PLAYER GAME LOGS ---
         cursor.execute("""
         IF OBJECT_ID('player_game_logs', 'U') IS NULL
@@ -6,15 +6,19 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy.stats import skew, kurtosis
 import os
+import sys
+
+# Enable script imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scripts.feature_store import load_features
 
 # --- File paths ---
-INPUT_PATH = r"C:\Repos\NBA_Shot\data\cleaned_shots.csv"
 OUTPUT_DIR = r"C:\Repos\NBA_Shot\output"
 PLOT_DIR = os.path.join(OUTPUT_DIR, "plots")
 os.makedirs(PLOT_DIR, exist_ok=True)
 
 # --- Load Data ---
-df = pd.read_csv(INPUT_PATH)
+df = load_features()
 df['SHOT_MADE'] = df['SHOT_MADE'].astype(bool)
 
 # --- Dataset Overview ---
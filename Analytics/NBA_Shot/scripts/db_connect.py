@@ -1,15 +1,30 @@
 # scripts/db_connect.py
 
-import pyodbc
 import os
+import csv
+import uuid
+import hashlib
+import sqlite3
+import datetime
+from collections import Counter
 
 SERVER_NAME = "RAMSEY_BOLTON\\SQLEXPRESS"
 DRIVER = "ODBC Driver 17 for SQL Server"
 
+# "sqlserver" (default) or "sqlite" for local runs without an ODBC server
+DB_BACKEND = os.environ.get("NBA_DB_BACKEND", "sqlserver").lower()
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+BULK_STAGE_DIR = os.path.join(DATA_DIR, "bulk_stage")
+BULK_BATCH_SIZE = 10000
+
 def get_connection(database="NBA_Shots"):
     """
     Connect to the specified database (default: NBA_Shots).
     """
+    if DB_BACKEND == "sqlite":
+        return get_sqlite_connection(database)
+
+    import pyodbc
     conn_str = (
         f"DRIVER={{{DRIVER}}};"
         f"SERVER={SERVER_NAME};"
@@ -24,3 +39,191 @@ def get_master_connection():
     """
     return get_connection("master")
 
+def get_sqlite_connection(database="NBA_Shots"):
+    """
+    Connect to a local SQLite file under data/ (e.g. data/NBA_Shots.db).
+    Callers that share a connection across threads serialize access themselves.
+    """
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return sqlite3.connect(os.path.join(DATA_DIR, f"{database}.db"), check_same_thread=False)
+
+def ensure_table(conn, table, columns, sqlserver_ddl=None):
+    """
+    Makes sure `table` exists before a loader DELETEs from or reads it. SQLite gets an
+    untyped table with `columns`; on SQL Server the schema is managed by the DDL scripts,
+    so only `sqlserver_ddl` (if given) is run.
+    """
+    cursor = conn.cursor()
+    if isinstance(conn, sqlite3.Connection):
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(columns)})")
+    elif sqlserver_ddl:
+        cursor.execute(sqlserver_ddl)
+    cursor.close()
+
+# ----------- Bulk Loading -----------
+
+def _insert_sql(table, columns):
+    placeholders = ", ".join("?" for _ in columns)
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+def _plain_value(val):
+    # sqlite3 and csv only understand builtin types (no Timestamp / numpy scalars)
+    if isinstance(val, bool):
+        return int(val)
+    if isinstance(val, (datetime.date, datetime.datetime)):
+        return str(val)
+    if hasattr(val, "item"):
+        return _plain_value(val.item())
+    return val
+
+def load_executemany(cursor, table, columns, rows):
+    """
+    Plain parameterized executemany (one round trip per row on pyodbc).
+    """
+    cursor.executemany(_insert_sql(table, columns), rows)
+
+def load_fast_executemany(cursor, table, columns, rows):
+    """
+    pyodbc array binding: the whole batch is sent as one parameter array.
+    """
+    cursor.fast_executemany = True
+    cursor.executemany(_insert_sql(table, columns), rows)
+
+def load_bulk_insert(cursor, table, columns, rows):
+    """
+    Stages the batch as a CSV and loads it with BULK INSERT through a temp table,
+    so only the listed columns are written. The file must be readable by the
+    SQL Server service (true for the local SQLEXPRESS instance).
+    """
+    os.makedirs(BULK_STAGE_DIR, exist_ok=True)
+    stage_path = os.path.join(BULK_STAGE_DIR, f"{table}_{uuid.uuid4().hex}.csv")
+    cols = ", ".join(columns)
+
+    try:
+        with open(stage_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerows([_plain_value(v) for v in row] for row in rows)
+
+        cursor.execute(f"SELECT TOP 0 {cols} INTO #bulk_stage FROM {table}")
+        cursor.execute(f"""
+            BULK INSERT #bulk_stage FROM '{stage_path}'
+            WITH (FORMAT = 'CSV', CODEPAGE = '65001', KEEPNULLS, TABLOCK)
+        """)
+        cursor.execute(f"INSERT INTO {table} ({cols}) SELECT {cols} FROM #bulk_stage")
+    finally:
+        # #bulk_stage lives as long as the session; a failed batch must not leave it behind.
+        # Cleanup errors are only printed so they never mask the load error being raised.
+        try:
+            cursor.execute("IF OBJECT_ID('tempdb..#bulk_stage') IS NOT NULL DROP TABLE #bulk_stage")
+        except Exception as e:
+            print(f"⚠️ Could not drop #bulk_stage: {e}")
+        if os.path.exists(stage_path):
+            os.remove(stage_path)
+
+def load_sqlite(cursor, table, columns, rows):
+    """
+    Local SQLite target. Creates an untyped table on first use so loaders can
+    run without the SQL Server DDL.
+    """
+    ensure_table(cursor.connection, table, columns)
+    cursor.executemany(_insert_sql(table, columns), ([_plain_value(v) for v in row] for row in rows))
+
+BULK_STRATEGIES = {
+    "executemany": load_executemany,
+    "fast_executemany": load_fast_executemany,
+    "bulk_insert": load_bulk_insert,
+    "sqlite": load_sqlite,
+}
+
+def default_strategy():
+    return os.environ.get("NBA_BULK_STRATEGY") or ("sqlite" if DB_BACKEND == "sqlite" else "fast_executemany")
+
+def bulk_load(conn, table, columns, rows, strategy=None, batch_size=BULK_BATCH_SIZE, on_batch=None, commit=True):
+    """
+    Inserts rows (lists in `columns` order) into `table` with the chosen strategy.
+    commit=True commits after every batch (progress survives a later failure);
+    commit=False leaves the whole load in the caller's open transaction, so a
+    DELETE-and-reload can commit once or roll everything back.
+    on_batch(start, count) is called after each batch. Returns the number of rows written.
+    """
+    strategy = strategy or default_strategy()
+    if strategy not in BULK_STRATEGIES:
+        raise ValueError(f"❌ Unknown bulk strategy '{strategy}'. Options: {list(BULK_STRATEGIES)}")
+    if isinstance(conn, sqlite3.Connection) != (strategy == "sqlite"):
+        raise ValueError(f"❌ Bulk strategy '{strategy}' does not match connection type {type(conn).__name__}")
+
+    loader = BULK_STRATEGIES[strategy]
+    cursor = conn.cursor()
+    total = 0
+
+    for i in range(0, len(rows), batch_size):
+        batch = rows[i:i + batch_size]
+        loader(cursor, table, columns, batch)
+        if commit:
+            conn.commit()
+        total += len(batch)
+        if on_batch:
+            on_batch(i, len(batch))
+
+    cursor.close()
+    return total
+
+# ----------- Incremental Upsert -----------
+
+HASH_COLUMN = "ROW_HASH"
+
+def row_hash(row):
+    return hashlib.sha1("|".join(str(_plain_value(v)) for v in row).encode("utf-8")).hexdigest()
+
+def incremental_load(conn, table, columns, key_column, rows, strategy=None):
+    """
+    Syncs `table` to rows (lists in `columns` order) using the ROW_HASH column as
+    a stored key/hash index: only new keys are inserted, keys whose hash changed
+    are updated and keys missing from the source are deleted. An unchanged source
+    costs one SELECT. Updates, deletes and inserts share one transaction that is
+    committed only when all of them succeed. Returns churn counts.
+    """
+    strategy = strategy or default_strategy()
+    key_pos = columns.index(key_column)
+    if strategy == "sqlite":
+        ensure_table(conn, table, columns + [HASH_COLUMN])
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT {key_column}, {HASH_COLUMN} FROM {table}")
+    # Keys are compared as strings so INT columns match numpy/str source values
+    stored = {str(_plain_value(key)): (key, digest) for key, digest in cursor.fetchall()}
+
+    keys = [str(_plain_value(row[key_pos])) for row in rows]
+    if len(set(keys)) != len(keys):
+        repeated = sorted(k for k, n in Counter(keys).items() if n > 1)[:10]
+        cursor.close()
+        raise ValueError(f"❌ Repeated {key_column} values in source rows for {table}: {repeated}")
+
+    inserts, updates, seen = [], [], set()
+    for key, row in zip(keys, rows):
+        seen.add(key)
+        digest = row_hash(row)
+        if key not in stored:
+            inserts.append(list(row) + [digest])
+        elif stored[key][1] != digest:
+            values = [_plain_value(v) for i, v in enumerate(row) if i != key_pos]
+            updates.append(values + [digest, stored[key][0]])
+    deletes = [(original,) for key, (original, _) in stored.items() if key not in seen]
+
+    if updates:
+        assignments = ", ".join(f"{col} = ?" for col in columns if col != key_column)
+        cursor.executemany(f"UPDATE {table} SET {assignments}, {HASH_COLUMN} = ? WHERE {key_column} = ?", updates)
+    if deletes:
+        cursor.executemany(f"DELETE FROM {table} WHERE {key_column} = ?", deletes)
+    cursor.close()
+
+    if inserts:
+        bulk_load(conn, table, columns + [HASH_COLUMN], inserts, strategy=strategy, commit=False)
+    if inserts or updates or deletes:
+        conn.commit()
+
+    return {
+        "inserted": len(inserts),
+        "updated": len(updates),
+        "deleted": len(deletes),
+        "unchanged": len(rows) - len(inserts) - len(updates),
+    }
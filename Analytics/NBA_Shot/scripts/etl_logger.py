@@ -1,27 +1,58 @@
 # scripts/etl_logger.py
 
 import os
+import time
+import atexit
+import threading
 from datetime import datetime
 from scripts.db_connect import get_connection
 
+# ----------- Buffering Config -----------
+
+FLUSH_INTERVAL = 5        # seconds between background flushes
+DB_BATCH_SIZE = 200       # buffered DB events that trigger an immediate flush
+
+_lock = threading.RLock()
+_flush_lock = threading.Lock()
+_flusher = None
+
 # ----------- Terminal + File Logging -----------
 
 LOG_DIR = os.path.join(os.path.dirname(__file__), "..", "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 LOG_PATH = os.path.join(LOG_DIR, "etl.log")
 
+_log_file = None
+
 def log_message(message: str):
     """
     Logs a timestamped message to both the terminal and logs/etl.log file.
+    The file stays open for the life of the process and is flushed periodically.
     """
+    global _log_file
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     full_message = f"[{timestamp}] {message}"
     print(full_message)
-    with open(LOG_PATH, "a", encoding="utf-8") as log_file:
-        log_file.write(full_message + "\n")
+    with _lock:
+        if _log_file is None:
+            _log_file = open(LOG_PATH, "a", encoding="utf-8")
+        _log_file.write(full_message + "\n")
+    _start_flusher()
 
 # ----------- SQL Table Logging -----------
 
+INSERT_LOG_SQL = """
+    INSERT INTO etl_log_events (
+        table_name, column_name, change_type,
+        org_val, new_val, row_id,
+        log_status, error_level, log_timestamp, source_script
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_db_conn = None
+_db_buffer = []
+
 def log_to_db(
     table_name,
     change_type,
@@ -34,32 +65,94 @@ def log_to_db(
     source_script=None
 ):
     """
-    Inserts a row into the etl_log_events SQL table.
+    Queues a row for the etl_log_events SQL table. Rows are written in batches
+    over one reused connection; the timestamp is taken at call time.
     """
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO etl_log_events (
-                table_name, column_name, change_type,
-                org_val, new_val, row_id,
-                log_status, error_level, log_timestamp, source_script
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, GETDATE(), ?)
-        """, (
-            table_name, column_name, change_type,
-            str(org_val) if org_val is not None else None,
-            str(new_val) if new_val is not None else None,
-            str(row_id) if row_id is not None else None,
-            log_status, error_level, source_script
-        ))
-
-        conn.commit()
-        cursor.close()
-        conn.close()
-
-    except Exception as e:
-        log_message(f"❌ Failed to write log to DB: {e}")
+    event = (
+        table_name, column_name, change_type,
+        str(org_val) if org_val is not None else None,
+        str(new_val) if new_val is not None else None,
+        str(row_id) if row_id is not None else None,
+        log_status, error_level, datetime.now(), source_script
+    )
+    with _lock:
+        _db_buffer.append(event)
+        should_flush = len(_db_buffer) >= DB_BATCH_SIZE
+    if should_flush:
+        _flush_db()
+    _start_flusher()
+
+def _flush_db():
+    global _db_conn
+    # _flush_lock serializes writers; _lock is only held to swap the buffer,
+    # so log_to_db never waits on a slow database round trip
+    with _flush_lock:
+        with _lock:
+            if not _db_buffer:
+                return
+            events = list(_db_buffer)
+            _db_buffer.clear()
+
+        try:
+            if _db_conn is None:
+                _db_conn = get_connection()
+            cursor = _db_conn.cursor()
+            cursor.executemany(INSERT_LOG_SQL, events)
+            _db_conn.commit()
+            cursor.close()
+
+        except Exception as e:
+            # Drop the connection so the next flush reconnects
+            try:
+                _db_conn.close()
+            except Exception:
+                pass
+            _db_conn = None
+            log_message(f"❌ Failed to write {len(events)} log events to DB: {e}")
+
+# ----------- Flushing -----------
+
+def flush_logs():
+    """
+    Writes any buffered DB events and flushes logs/etl.log.
+    """
+    _flush_db()
+    with _lock:
+        if _log_file is not None:
+            _log_file.flush()
+
+def close_logs():
+    """
+    Final flush, then releases the log file and DB connection.
+    """
+    global _log_file, _db_conn
+    flush_logs()
+    with _lock:
+        if _log_file is not None:
+            _log_file.close()
+            _log_file = None
+    with _flush_lock:
+        if _db_conn is not None:
+            try:
+                _db_conn.close()
+            except Exception:
+                pass
+            _db_conn = None
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        try:
+            flush_logs()
+        except Exception as e:
+            print(f"❌ Background log flush failed: {e}")
 
+def _start_flusher():
+    global _flusher
+    if _flusher is None:
+        with _lock:
+            if _flusher is None:
+                _flusher = threading.Thread(target=_flush_loop, name="etl-log-flusher", daemon=True)
+                _flusher.start()
 
+atexit.register(close_logs)
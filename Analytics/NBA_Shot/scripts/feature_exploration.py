@@ -5,34 +5,35 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import sys
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.feature_selection import mutual_info_classif
 from statsmodels.stats.outliers_influence import variance_inflation_factor
 
+# Enable script imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scripts.feature_store import load_features, FLAG_COLUMNS
+
 # --- File Paths ---
-DATA_PATH = r"C:\Repos\NBA_Shot\data\cleaned_shots.csv"
 OUTPUT_DIR = r"C:\Repos\NBA_Shot\output\feature_relationships"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-# --- Load & Clean ---
-df = pd.read_csv(DATA_PATH)
-df = df[df["TOUCH_TIME"] >= 0]
-df = df[df["DRIBBLES"] <= 24]
-df = df[df["CLOSE_DEF_DIST"] <= 30]
-df["SHOT_MADE"] = df["SHOT_MADE"].astype(bool)
-
 # --- Feature List ---
 features = [
     "SHOT_DIST", "CLOSE_DEF_DIST", "TOUCH_TIME", "DRIBBLES",
     "SHOT_CLOCK", "SHOOTER_HEIGHT", "DEFENDER_HEIGHT", "HEIGHT_DIFFERENTIAL"
 ]
+binary_flags = FLAG_COLUMNS
+
+# --- Load & Clean ---
+df = load_features(features + binary_flags + ["SHOT_MADE"])
+df = df[df["TOUCH_TIME"] >= 0]
+df = df[df["DRIBBLES"] <= 24]
+df = df[df["CLOSE_DEF_DIST"] <= 30]
+df["SHOT_MADE"] = df["SHOT_MADE"].astype(bool)
 
-# --- Derived Flags ---
-df["HAS_HEIGHT_ADVANTAGE"] = df["HEIGHT_DIFFERENTIAL"] >= 5
-df["LOW_CLOCK"] = df["SHOT_CLOCK"] <= 5
-df["LONG_TOUCH"] = df["TOUCH_TIME"] >= 10
-df["HIGH_DRIBBLE"] = df["DRIBBLES"] >= 5
-binary_flags = ["HAS_HEIGHT_ADVANTAGE", "LOW_CLOCK", "LONG_TOUCH", "HIGH_DRIBBLE"]
+# --- Derived Flags (materialized by the feature store) ---
+df[binary_flags] = df[binary_flags].astype(bool)
 
 # --- Plotting: Logistic, Binned, Violin for Continuous Features ---
 for feature in features:
@@ -0,0 +1,132 @@
+# scripts/feature_store.py
+
+import os
+import json
+import time
+import argparse
+import pandas as pd
+
+# ----------- Store Config -----------
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SOURCE_PATH = os.path.join(BASE_DIR, "data", "cleaned_shots.csv")
+STORE_DIR = os.path.join(BASE_DIR, "data", "feature_store")
+
+# Bump whenever a derived feature definition changes so every consumer rebuilds
+STORE_VERSION = 1
+STORE_NAME = f"shots_v{STORE_VERSION}"
+
+FLAG_COLUMNS = ["HAS_HEIGHT_ADVANTAGE", "LOW_CLOCK", "LONG_TOUCH", "HIGH_DRIBBLE"]
+
+# ----------- Derived Features -----------
+
+def add_derived_flags(df):
+    """
+    The one definition of the binary shot-context flags (stored as 0/1 int8).
+    """
+    df["HAS_HEIGHT_ADVANTAGE"] = (df["HEIGHT_DIFFERENTIAL"] >= 5).astype("int8")
+    df["LOW_CLOCK"] = (df["SHOT_CLOCK"] <= 5).astype("int8")
+    df["LONG_TOUCH"] = (df["TOUCH_TIME"] >= 10).astype("int8")
+    df["HIGH_DRIBBLE"] = (df["DRIBBLES"] >= 5).astype("int8")
+    return df
+
+# ----------- Build + Freshness -----------
+
+def store_path(store_dir=STORE_DIR):
+    return os.path.join(store_dir, f"{STORE_NAME}.feather")
+
+def manifest_path(store_dir=STORE_DIR):
+    return os.path.join(store_dir, f"{STORE_NAME}.json")
+
+def _source_signature(source):
+    stat = os.stat(source)
+    return {"source_size": stat.st_size, "source_mtime_ns": stat.st_mtime_ns}
+
+def read_manifest(store_dir=STORE_DIR):
+    try:
+        with open(manifest_path(store_dir), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def is_fresh(source=SOURCE_PATH, store_dir=STORE_DIR):
+    """
+    True when the store exists, matches STORE_VERSION and was built from the current source file.
+    """
+    manifest = read_manifest(store_dir)
+    if manifest is None or not os.path.isfile(store_path(store_dir)):
+        return False
+    if manifest.get("version") != STORE_VERSION:
+        return False
+    signature = _source_signature(source)
+    return all(manifest.get(k) == v for k, v in signature.items())
+
+def build_store(source=SOURCE_PATH, store_dir=STORE_DIR):
+    """
+    Parses the CSV once, materializes the derived flags and writes an uncompressed Feather
+    file (memory-mappable) plus a JSON manifest describing it. Returns the manifest.
+    """
+    start = time.perf_counter()
+    df = add_derived_flags(pd.read_csv(source))
+
+    os.makedirs(store_dir, exist_ok=True)
+    path = store_path(store_dir)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    df.to_feather(tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+
+    manifest = {
+        "version": STORE_VERSION,
+        "source": os.path.basename(source),
+        **_source_signature(source),
+        "rows": len(df),
+        "columns": {col: str(dtype) for col, dtype in df.dtypes.items()},
+        "derived": FLAG_COLUMNS,
+        "built_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    tmp_manifest = f"{manifest_path(store_dir)}.{os.getpid()}.tmp"
+    with open(tmp_manifest, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_manifest, manifest_path(store_dir))
+
+    print(f"🧱 Built {STORE_NAME} ({len(df):,} rows, {len(df.columns)} columns) in {time.perf_counter() - start:.1f}s")
+    return manifest
+
+# ----------- Load -----------
+
+def load_features(columns=None, source=SOURCE_PATH, store_dir=STORE_DIR):
+    """
+    Returns cleaned shots with the derived flags, reading only `columns` (all if None).
+    The store is (re)built first if it is missing, from an older version, or older than the CSV.
+    """
+    if not is_fresh(source, store_dir):
+        build_store(source, store_dir)
+
+    import pyarrow.feather as feather
+    columns = list(dict.fromkeys(columns)) if columns is not None else None
+    table = feather.read_table(store_path(store_dir), columns=columns, memory_map=True)
+    return table.to_pandas()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the cleaned_shots feature store and compare read times against the CSV.")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild even if the store is up to date")
+    args = parser.parse_args()
+
+    if args.rebuild or not is_fresh():
+        build_store()
+    else:
+        print(f"✅ {STORE_NAME} is up to date")
+
+    start = time.perf_counter()
+    add_derived_flags(pd.read_csv(SOURCE_PATH))
+    csv_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    load_features()
+    full_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    load_features(["SHOT_DIST", "CLOSE_DEF_DIST", "SHOT_MADE"] + FLAG_COLUMNS)
+    projected_seconds = time.perf_counter() - start
+
+    print(f"⏱️ CSV + flags: {csv_seconds:.3f}s | store (all columns): {full_seconds:.3f}s | store (7 columns): {projected_seconds:.3f}s")
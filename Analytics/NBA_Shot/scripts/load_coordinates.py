@@ -1,8 +1,27 @@
 import pandas as pd
 import time
+import random
 import os
+import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from nba_api.stats.endpoints import ShotChartDetail, CommonAllPlayers
 
+# Enable script imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scripts.nba_cache import install_cache, CacheMiss
+from scripts.player_enrichment import RateLimiter
+
+install_cache()  # serve repeat nba_api calls from data/cache/nba_api
+
+# ----------- Download Config -----------
+
+STORE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "shotcharts"))
+MAX_WORKERS = 4
+RATE_PER_SEC = 1.0     # shared across workers (the old loop slept 1.2s per player)
+MAX_RETRIES = 3
+BACKOFF_BASE = 2.0
+
 def get_2014_15_player_ids():
     """Get all player IDs who played in the 2014-15 season."""
     df = CommonAllPlayers(is_only_current_season=0, season="2014-15").get_data_frames()[0]
@@ -10,43 +29,135 @@ def get_2014_15_player_ids():
     return df[['PERSON_ID', 'DISPLAY_FIRST_LAST']].values.tolist()
 
 def get_shotchart(player_id, season='2014-15'):
-    try:
-        response = ShotChartDetail(
-            team_id=0,
-            player_id=player_id,
-            season_type_all_star='Regular Season',
-            season_nullable=season,
-            context_measure_simple='FGA'
-        )
-        df = response.get_data_frames()[0]
-        return df
-    except Exception as e:
-        print(f"❌ Error fetching player {player_id}: {e}")
-        return pd.DataFrame()
+    response = ShotChartDetail(
+        team_id=0,
+        player_id=player_id,
+        season_type_all_star='Regular Season',
+        season_nullable=season,
+        context_measure_simple='FGA'
+    )
+    return response.get_data_frames()[0]
+
+# ----------- Partitioned Store -----------
+# One file per player under data/shotcharts/season=YYYY-YY/. A file only appears once the
+# player's download finished (written to .tmp, then renamed), so its presence means "done"
+# and a restart skips it. Players with no shots get an empty file.
+
+def partition_dir(season):
+    return os.path.join(STORE_DIR, f"season={season}")
+
+def partition_path(season, player_id):
+    return os.path.join(partition_dir(season), f"player_{player_id}.csv")
+
+def completed_players(season):
+    folder = partition_dir(season)
+    if not os.path.isdir(folder):
+        return set()
+    return {
+        int(name[len("player_"):-len(".csv")])
+        for name in os.listdir(folder)
+        if name.startswith("player_") and name.endswith(".csv")
+    }
+
+def write_partition(season, player_id, df):
+    path = partition_path(season, player_id)
+    tmp_path = path + ".tmp"
+    if df.empty:
+        open(tmp_path, "w").close()
+    else:
+        df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+def download_player(pid, name, season, limiter):
+    """
+    Fetches one player's shots with retry/backoff and writes the partition. Returns rows written.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.acquire()
+        try:
+            df = get_shotchart(pid, season)
+            break
+        except Exception as e:
+            if attempt == MAX_RETRIES or isinstance(e, CacheMiss):
+                raise
+            delay = BACKOFF_BASE * 2 ** attempt + random.uniform(0, BACKOFF_BASE)
+            print(f"🔁 {name} (ID: {pid}) failed ({e}); retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s")
+            time.sleep(delay)
+
+    if not df.empty:
+        df["PLAYER_ID"] = pid
+        df["PLAYER_NAME"] = name
+    write_partition(season, pid, df)
+    return len(df)
+
+def download_all(players, season, max_workers=MAX_WORKERS, rate=RATE_PER_SEC):
+    """
+    Downloads every player not already in the store. Shots go straight to disk,
+    so memory holds at most `max_workers` players at a time.
+    """
+    os.makedirs(partition_dir(season), exist_ok=True)
+    done = completed_players(season)
+    todo = [(pid, name) for pid, name in players if pid not in done]
+    print(f"⏭ {len(players) - len(todo)} players already downloaded, {len(todo)} remaining")
+
+    limiter = RateLimiter(rate)
+    failed = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(download_player, pid, name, season, limiter): (pid, name) for pid, name in todo}
+        for i, future in enumerate(as_completed(futures), start=1):
+            pid, name = futures[future]
+            try:
+                shots = future.result()
+                print(f"[{i}/{len(todo)}] ⛹️  {name} (ID: {pid}) | {shots} shots")
+            except Exception as e:
+                failed += 1
+                print(f"❌ Error fetching player {pid}: {e}")
+
+    print(f"⏱️ Downloaded {len(todo) - failed} players in {time.perf_counter() - start:.1f}s ({failed} failed, rerun to retry)")
+    return failed
+
+# ----------- Final Output -----------
+
+def merge_partitions(season, output_path):
+    """
+    Streams every player partition into one CSV, one player at a time. Returns rows written.
+    """
+    files = [partition_path(season, pid) for pid in sorted(completed_players(season))]
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    tmp_path = output_path + ".tmp"
+
+    columns, total = None, 0
+    with open(tmp_path, "w", newline="", encoding="utf-8") as out:
+        for path in files:
+            if os.path.getsize(path) == 0:
+                continue
+            df = pd.read_csv(path)
+            if columns is None:
+                columns = list(df.columns)
+                df.to_csv(out, index=False)
+            else:
+                df.reindex(columns=columns).to_csv(out, index=False, header=False)
+            total += len(df)
+    os.replace(tmp_path, output_path)
+    return total
 
 if __name__ == "__main__":
-    output_path = r"C:\Repos\NBA_Shot\data\corresponding_coordinates.csv"
+    parser = argparse.ArgumentParser(description="Download 2014-15 shot charts into a resumable per-player store.")
+    parser.add_argument("--output", default=r"C:\Repos\NBA_Shot\data\corresponding_coordinates.csv", help="Merged CSV path")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Concurrent requests")
+    parser.add_argument("--rate", type=float, default=RATE_PER_SEC, help="Requests per second across all workers")
+    parser.add_argument("--merge_only", action="store_true", help="Skip downloading; rebuild the output from the store")
+    args = parser.parse_args()
+
     season = "2014-15"
-    all_data = []
-    players = get_2014_15_player_ids()
-
-    print(f"🔁 Starting download for {len(players)} players...")
-
-    for i, (pid, name) in enumerate(players):
-        print(f"[{i+1}/{len(players)}] ⛹️  {name} (ID: {pid})")
-        df = get_shotchart(pid, season)
-        if not df.empty:
-            df["PLAYER_ID"] = pid
-            df["PLAYER_NAME"] = name
-            all_data.append(df)
-        time.sleep(1.2)  # Slow down to avoid rate limits
-
-    if all_data:
-        final_df = pd.concat(all_data, ignore_index=True)
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        final_df.to_csv(output_path, index=False)
-        print(f"✅ Saved {len(final_df)} total shots to {output_path}")
+    if not args.merge_only:
+        players = get_2014_15_player_ids()
+        print(f"🔁 Starting download for {len(players)} players...")
+        download_all(players, season, args.workers, args.rate)
+
+    total = merge_partitions(season, args.output)
+    if total:
+        print(f"✅ Saved {total} total shots to {args.output}")
     else:
         print("⚠️ No shot data collected.")
-
-
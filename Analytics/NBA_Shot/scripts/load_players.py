@@ -1,13 +1,23 @@
 import os
 import sys
 import pandas as pd
-import time
-from nba_api.stats.endpoints import CommonAllPlayers, CommonPlayerInfo
+import argparse
+from nba_api.stats.endpoints import CommonAllPlayers
 
 # Enable script imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from scripts.db_connect import get_connection
+from scripts.db_connect import get_connection, bulk_load, ensure_table, incremental_load, row_hash, HASH_COLUMN
 from scripts.etl_logger import log_message, log_to_db
+from scripts.nba_cache import install_cache
+
+install_cache()  # serve repeat nba_api calls from data/cache/nba_api
+from scripts.player_enrichment import enrich_players
+
+PLAYER_COLUMNS = [
+    "PLAYER_ID", "PLAYER_NAME", "BIRTHDATE", "HEIGHT_INCHES",
+    "COUNTRY", "DRAFT_YEAR", "DRAFT_ROUND", "DRAFT_NUMBER",
+    "POSITION", "TEAM_ID", "TEAM_NAME"
+]
 
 def parse_int(val):
     try:
@@ -15,18 +25,18 @@ def parse_int(val):
     except:
         return 0
 
-def load_players():
+def load_players(full=False):
     try:
         # Step 1: Extract current season players
         all_players = CommonAllPlayers(is_only_current_season=1, season="2023-24").get_data_frames()[0]
         player_ids = all_players['PERSON_ID'].tolist()
 
+        # Cached responses are reused; only new or stale players are fetched (concurrently, rate limited)
+        player_infos, _ = enrich_players(player_ids)
+
         rows = []
-        for pid in player_ids:
+        for pid, row in player_infos:
             try:
-                player_info = CommonPlayerInfo(player_id=pid).get_data_frames()[0]
-                row = player_info.iloc[0]
-
                 # Parse height
                 height_raw = row['HEIGHT']
                 if pd.notna(height_raw) and '-' in str(height_raw):
@@ -58,7 +68,6 @@ def load_players():
                 })
 
                 log_message(f"✅ Enriched PLAYER_ID {pid} | Team: {team_name}")
-                time.sleep(1.5)
 
             except Exception as e:
                 log_message(f"⚠️ Skipped PLAYER_ID {pid} due to error: {e}")
@@ -72,42 +81,47 @@ def load_players():
         log_message(f"📁 Exported player_info to {output_path}")
 
         # Step 3: Load into SQL
+        rows = df[PLAYER_COLUMNS].astype(object).where(pd.notnull(df[PLAYER_COLUMNS]), None).values.tolist()
+
         conn = get_connection()
+        if not full:
+            # Only touch players whose row hash changed since the last load
+            try:
+                churn = incremental_load(conn, "player_info", PLAYER_COLUMNS, "PLAYER_ID", rows)
+                log_to_db("player_info", "incremental_load", "success", error_level="info", new_val=churn, source_script="load_players.py")
+            except Exception as load_err:
+                conn.rollback()
+                log_message(f"❌ Incremental load into player_info failed: {load_err}")
+                raise
+            finally:
+                conn.close()
+
+            log_message(
+                f"✅ player_info synced | +{churn['inserted']} inserted, ~{churn['updated']} updated, "
+                f"-{churn['deleted']} deleted, {churn['unchanged']} unchanged"
+            )
+            return
+
+        ensure_table(conn, "player_info", PLAYER_COLUMNS + [HASH_COLUMN])
         cursor = conn.cursor()
         cursor.execute("DELETE FROM player_info;")
+        cursor.close()
         log_message("🧹 Cleared all rows from player_info table.")
 
-        inserted = 0
-        for _, row in df.iterrows():
-            try:
-                cursor.execute("""
-                    INSERT INTO player_info (
-                        PLAYER_ID, PLAYER_NAME, BIRTHDATE, HEIGHT_INCHES,
-                        COUNTRY, DRAFT_YEAR, DRAFT_ROUND, DRAFT_NUMBER,
-                        POSITION, TEAM_ID, TEAM_NAME
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    int(row['PLAYER_ID']), row['PLAYER_NAME'], row['BIRTHDATE'], row['HEIGHT_INCHES'],
-                    row['COUNTRY'], row['DRAFT_YEAR'], row['DRAFT_ROUND'], row['DRAFT_NUMBER'],
-                    row['POSITION'], row['TEAM_ID'], row['TEAM_NAME']
-                ))
-
-                log_to_db("player_info", "insert", "success", str(row['PLAYER_ID']), source_script="load_players.py")
-                inserted += 1
-
-            except Exception as row_err:
-                log_message(f"❌ Insert failed for PLAYER_ID {row['PLAYER_ID']}: {row_err}")
-                log_to_db(
-                    "player_info", "insert", "failure",
-                    row_id=str(row['PLAYER_ID']),
-                    error_level="critical",
-                    org_val=str(row.to_dict()),
-                    source_script="load_players.py"
-                )
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        try:
+            # Write hashes too so the next incremental run starts from a full index
+            hashed = [row + [row_hash(row)] for row in rows]
+            inserted = bulk_load(conn, "player_info", PLAYER_COLUMNS + [HASH_COLUMN], hashed, commit=False)
+            # DELETE + reload commit together, so a failed load leaves the old rows in place
+            conn.commit()
+            log_to_db("player_info", "bulk_insert", "success", error_level="info", new_val=inserted, source_script="load_players.py")
+        except Exception as load_err:
+            conn.rollback()
+            log_message(f"❌ Bulk insert into player_info failed: {load_err}")
+            raise
+        finally:
+            conn.close()
+
         log_message(f"✅ Inserted {inserted} players into player_info.")
 
     except Exception as e:
@@ -119,7 +133,11 @@ def load_players():
         )
 
 if __name__ == "__main__":
-    load_players()
+    parser = argparse.ArgumentParser(description="Enrich current-season players and load player_info.")
+    parser.add_argument("--full", action="store_true",
+                        help="DELETE and reload player_info instead of syncing only changed players")
+    args = parser.parse_args()
+    load_players(full=args.full)
 
 
 
@@ -1,13 +1,22 @@
 import os
 import sys
 import pandas as pd
-import time
-from nba_api.stats.endpoints import CommonAllPlayers, CommonPlayerInfo
+from nba_api.stats.endpoints import CommonAllPlayers
 
 # Enable script imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from scripts.db_connect import get_connection
+from scripts.db_connect import get_connection, bulk_load, ensure_table
 from scripts.etl_logger import log_message, log_to_db
+from scripts.nba_cache import install_cache
+
+install_cache()  # serve repeat nba_api calls from data/cache/nba_api
+from scripts.player_enrichment import enrich_players
+
+PLAYER_COLUMNS = [
+    "PLAYER_ID", "PLAYER_NAME", "BIRTHDATE", "HEIGHT_INCHES",
+    "COUNTRY", "DRAFT_YEAR", "DRAFT_ROUND", "DRAFT_NUMBER",
+    "POSITION", "TEAM_ID", "TEAM_NAME"
+]
 
 
 def parse_int(val):
@@ -42,12 +51,12 @@ def load_players_analysis():
         all_players = all_players[all_players['ROSTERSTATUS'] == 1]
         player_ids = all_players['PERSON_ID'].tolist()
 
+        # Cached responses are reused; only new or stale players are fetched (concurrently, rate limited)
+        player_infos, _ = enrich_players(player_ids, label="[2014-15] ")
+
         rows = []
-        for pid in player_ids:
+        for pid, row in player_infos:
             try:
-                player_info = CommonPlayerInfo(player_id=pid).get_data_frames()[0]
-                row = player_info.iloc[0]
-
                 height_in = parse_height(row['HEIGHT'])
                 birth_date = pd.to_datetime(row['BIRTHDATE'], errors='coerce')
                 birth_date_str = birth_date.strftime('%Y-%m-%d') if not pd.isna(birth_date) else None
@@ -70,7 +79,6 @@ def load_players_analysis():
                 })
 
                 log_message(f"✅ [2014-15] Enriched PLAYER_ID {pid} | Team: {team_name}")
-                time.sleep(1.5)
 
             except Exception as e:
                 log_message(f"⚠️ [2014-15] Skipped PLAYER_ID {pid} due to error: {e}")
@@ -85,9 +93,7 @@ def load_players_analysis():
 
         # Step 2: Insert into SQL Server
         conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        ensure_table(conn, "dbo_player_info_analysis", PLAYER_COLUMNS, sqlserver_ddl="""
         IF OBJECT_ID('dbo_player_info_analysis', 'U') IS NULL
         CREATE TABLE dbo_player_info_analysis (
             PLAYER_ID INT PRIMARY KEY,
@@ -103,41 +109,27 @@ def load_players_analysis():
             TEAM_NAME VARCHAR(100)
         );
         """)
+        cursor = conn.cursor()
 
         cursor.execute("DELETE FROM dbo_player_info_analysis;")
+        cursor.close()
         log_message("🧹 Cleared all rows from dbo_player_info_analysis table.")
 
-        inserted = 0
-        for _, row in df.iterrows():
-            try:
-                cursor.execute("""
-                    INSERT INTO dbo_player_info_analysis (
-                        PLAYER_ID, PLAYER_NAME, BIRTHDATE, HEIGHT_INCHES,
-                        COUNTRY, DRAFT_YEAR, DRAFT_ROUND, DRAFT_NUMBER,
-                        POSITION, TEAM_ID, TEAM_NAME
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    int(row['PLAYER_ID']), row['PLAYER_NAME'], row['BIRTHDATE'], safe_float(row['HEIGHT_INCHES']),
-                    row['COUNTRY'], row['DRAFT_YEAR'], row['DRAFT_ROUND'], row['DRAFT_NUMBER'],
-                    row['POSITION'], row['TEAM_ID'], row['TEAM_NAME']
-                ))
-
-                log_to_db("dbo_player_info_analysis", "insert", "success", str(row['PLAYER_ID']), source_script="load_players_analysis.py")
-                inserted += 1
-
-            except Exception as row_err:
-                log_message(f"❌ Insert failed for PLAYER_ID {row['PLAYER_ID']}: {row_err}")
-                log_to_db(
-                    "dbo_player_info_analysis", "insert", "failure",
-                    row_id=str(row['PLAYER_ID']),
-                    error_level="critical",
-                    org_val=str(row.to_dict()),
-                    source_script="load_players_analysis.py"
-                )
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        df["HEIGHT_INCHES"] = df["HEIGHT_INCHES"].apply(safe_float)
+        rows = df[PLAYER_COLUMNS].astype(object).where(pd.notnull(df[PLAYER_COLUMNS]), None).values.tolist()
+
+        try:
+            inserted = bulk_load(conn, "dbo_player_info_analysis", PLAYER_COLUMNS, rows, commit=False)
+            # DELETE + reload commit together, so a failed load leaves the old rows in place
+            conn.commit()
+            log_to_db("dbo_player_info_analysis", "bulk_insert", "success", error_level="info", new_val=inserted, source_script="load_players_analysis.py")
+        except Exception as load_err:
+            conn.rollback()
+            log_message(f"❌ Bulk insert into dbo_player_info_analysis failed: {load_err}")
+            raise
+        finally:
+            conn.close()
+
         log_message(f"✅ Inserted {inserted} players into dbo_player_info_analysis.")
 
     except Exception as e:
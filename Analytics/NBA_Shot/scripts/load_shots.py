@@ -1,5 +1,8 @@
 import os
 import sys
+import queue
+import argparse
+import threading
 import pandas as pd
 import hashlib
 from datetime import datetime
@@ -7,12 +10,29 @@ from datetime import datetime
 # Add project root to sys.path for absolute imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from scripts.db_connect import get_connection
+from scripts.db_connect import get_connection, bulk_load, BULK_STRATEGIES
 from scripts.etl_logger import log_message, log_to_db
 
 # --- Config
 INPUT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "shot_logs.csv"))
 BATCH_SIZE = 10000
+CHUNK_SIZE = 100000     # rows parsed per chunk in --stream mode
+PREFETCH_CHUNKS = 1     # transformed chunks allowed to wait for insert
+
+# Fixed dtypes for the ID/key and text columns, so a chunk that happens to hold a blank
+# doesn't turn its IDs into floats ("123.0") and change SHOT_EVENT_IDs vs a full-file read
+SHOT_LOG_DTYPES = {
+    "GAME_ID": "Int64",
+    "player_id": "Int64",
+    "CLOSEST_DEFENDER_PLAYER_ID": "Int64",
+    "MATCHUP": str,
+    "GAME_CLOCK": str,
+    "LOCATION": str,
+    "W": str,
+    "SHOT_RESULT": str,
+    "CLOSEST_DEFENDER": str,
+    "player_name": str,
+}
 
 def generate_id(row):
     # Includes row index to guarantee uniqueness
@@ -30,12 +50,62 @@ def compute_time_remaining(clock, period, is_ot):
     except:
         return 0
 
-def transform_data():
+# --- Columnar equivalents of the row-wise helpers above
+
+def parse_clock(clock):
+    """
+    (minutes, seconds) exactly as compute_time_remaining() reads them, or (NaN, NaN).
+    """
+    try:
+        minutes, seconds = map(int, str(clock).split(":"))
+        return minutes, seconds
+    except:
+        return float("nan"), float("nan")
+
+def generate_ids(df):
+    """
+    Same IDs as generate_id(), built from whole columns and hashed in one pass.
+    """
+    # str() per value, as the f-string does: "nan" for float blanks, "<NA>" for Int64 ones
+    keys = (
+        df.index.astype(str) + "_"
+        + df["PLAYER_ID"].astype(object).map(str) + "_"
+        + df["GAME_ID"].astype(object).map(str)
+    )
+    return pd.Series([hashlib.sha1(k.encode()).hexdigest()[:12] for k in keys], index=df.index)
+
+def compute_time_remaining_vectorized(clock, period, is_ot):
+    """
+    Same result as compute_time_remaining() for whole columns: OT rows and
+    unparseable clocks fall back to 0.
+    """
+    # A season only has ~720 distinct clock strings, so parse those once (with the row-wise
+    # int() rules, so "1_0:05" or " 5:07 " read the same) and broadcast
+    codes, uniques = pd.factorize(clock.astype(str), use_na_sentinel=False)
+    parts = pd.DataFrame([parse_clock(u) for u in uniques], columns=["minutes", "seconds"], dtype=float)
+    minutes = pd.Series(parts["minutes"].to_numpy()[codes], index=clock.index)
+    seconds = pd.Series(parts["seconds"].to_numpy()[codes], index=clock.index)
+    seconds_left_q = minutes * 60 + seconds
+    elapsed = (period - 1) * 720 + (720 - seconds_left_q)
+
+    parsed = minutes.notna() & seconds.notna()
+    remaining = (2880 - elapsed).where(parsed & ~is_ot.astype(bool), 0)
+    if remaining.notna().all():
+        remaining = remaining.astype("int64")
+    return remaining
+
+def transform_data(input_path=INPUT_PATH, vectorized=True):
     log_message("🛠️ Transforming shot logs...")
     log_to_db("player_shot_logs", "transform", "success", error_level="info", source_script="transform_and_load_shots.py")
 
-    df = pd.read_csv(INPUT_PATH)
+    df = pd.read_csv(input_path, dtype=SHOT_LOG_DTYPES)
+    return transform_frame(df, vectorized=vectorized)
 
+def transform_frame(df, vectorized=True):
+    """
+    Shapes raw shot_logs rows into the player_shot_logs layout.
+    vectorized=False keeps the original row-wise apply path for comparison.
+    """
     # --- Parse GAME_DATE and split MATCHUP
     df[["GAME_DATE", "MATCHUP"]] = df["MATCHUP"].str.split(" - ", expand=True)
     df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], format="%b %d, %Y", errors="coerce")
@@ -44,8 +114,12 @@ def transform_data():
     df["SHOT_CLOCK"] = pd.to_numeric(df["SHOT_CLOCK"], errors="coerce").fillna(0.0)
 
     # --- OT and TIME_REMAINING
-    df["OT"] = df["PERIOD"].apply(lambda x: 1 if x >= 5 else 0)
-    df["TIME_REMAINING"] = df.apply(lambda row: compute_time_remaining(row["GAME_CLOCK"], row["PERIOD"], row["OT"]), axis=1)
+    if vectorized:
+        df["OT"] = (df["PERIOD"] >= 5).astype("int64")
+        df["TIME_REMAINING"] = compute_time_remaining_vectorized(df["GAME_CLOCK"], df["PERIOD"], df["OT"])
+    else:
+        df["OT"] = df["PERIOD"].apply(lambda x: 1 if x >= 5 else 0)
+        df["TIME_REMAINING"] = df.apply(lambda row: compute_time_remaining(row["GAME_CLOCK"], row["PERIOD"], row["OT"]), axis=1)
 
     # --- SHOT_MADE
     df["SHOT_MADE"] = df["SHOT_RESULT"].str.lower().map({"made": 1, "missed": 0}).fillna(0).astype(bool)
@@ -64,47 +138,54 @@ def transform_data():
     df.columns = [col.upper() for col in df.columns]
 
     # --- Generate primary key
-    df["SHOT_EVENT_ID"] = df.apply(generate_id, axis=1)
+    if vectorized:
+        df["SHOT_EVENT_ID"] = generate_ids(df)
+    else:
+        df["SHOT_EVENT_ID"] = df.apply(generate_id, axis=1)
 
     # --- Final column order
     cols = ["SHOT_EVENT_ID"] + [col for col in df.columns if col != "SHOT_EVENT_ID"]
     return df[cols]
 
-def load_data(df):
-    try:
-        log_message("🚚 Inserting shot logs into SQL Server...")
+SHOT_COLUMNS = [
+    "SHOT_EVENT_ID", "PLAYER_NAME", "PLAYER_ID", "GAME_DATE", "GAME_ID", "MATCHUP", "TIME_REMAINING", "OT", "SHOT_MADE",
+    "FGM", "PTS", "PTS_TYPE", "CLOSEST_DEFENDER", "CLOSEST_DEFENDER_PLAYER_ID", "CLOSE_DEF_DIST",
+    "SHOT_DIST", "TOUCH_TIME", "DRIBBLES", "SHOT_CLOCK", "LOCATION", "W"
+]
+
+def to_rows(df, seen_ids=None):
+    """
+    seen_ids: SHOT_EVENT_IDs from earlier chunks of the same load; updated in place
+    so duplicates across chunks are caught too.
+    """
+    df["OT"] = df["OT"].astype(bool)
+    df["SHOT_MADE"] = df["SHOT_MADE"].astype(bool)
 
-        df["OT"] = df["OT"].astype(bool)
-        df["SHOT_MADE"] = df["SHOT_MADE"].astype(bool)
+    # Safety check before insert
+    if not df["SHOT_EVENT_ID"].is_unique:
+        raise ValueError("❌ SHOT_EVENT_IDs are not unique! Aborting insert.")
+    if seen_ids is not None:
+        ids = set(df["SHOT_EVENT_ID"])
+        if not seen_ids.isdisjoint(ids):
+            raise ValueError("❌ SHOT_EVENT_IDs repeat across chunks! Aborting insert.")
+        seen_ids.update(ids)
 
-        # Safety check before insert
-        if not df["SHOT_EVENT_ID"].is_unique:
-            raise ValueError("❌ SHOT_EVENT_IDs are not unique! Aborting insert.")
+    return df.where(pd.notnull(df), None).values.tolist()
 
-        rows = df.where(pd.notnull(df), None).values.tolist()
+def insert_rows(conn, rows, offset=0, strategy=None):
+    def log_batch(start, count):
+        log_message(f"✅ Inserted rows {offset + start} to {offset + start + count - 1}")
+
+    return bulk_load(conn, "player_shot_logs", SHOT_COLUMNS, rows, strategy=strategy, batch_size=BATCH_SIZE, on_batch=log_batch)
+
+def load_data(df, strategy=None):
+    try:
+        log_message("🚚 Inserting shot logs into SQL Server...")
+
+        rows = to_rows(df)
 
         conn = get_connection()
-        cursor = conn.cursor()
-
-        insert_stmt = """
-            INSERT INTO player_shot_logs (
-                SHOT_EVENT_ID, PLAYER_NAME, PLAYER_ID, GAME_DATE, GAME_ID, MATCHUP, TIME_REMAINING, OT, SHOT_MADE,
-                FGM, PTS, PTS_TYPE, CLOSEST_DEFENDER, CLOSEST_DEFENDER_PLAYER_ID, CLOSE_DEF_DIST,
-                SHOT_DIST, TOUCH_TIME, DRIBBLES, SHOT_CLOCK, LOCATION, W
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?
-            )
-        """
-
-        for i in range(0, len(rows), BATCH_SIZE):
-            batch = rows[i:i + BATCH_SIZE]
-            cursor.executemany(insert_stmt, batch)
-            conn.commit()
-            log_message(f"✅ Inserted rows {i} to {i + len(batch) - 1}")
-
-        cursor.close()
+        insert_rows(conn, rows, strategy=strategy)
         conn.close()
 
         log_message("🏁 Shot logs successfully loaded into player_shot_logs")
@@ -115,9 +196,87 @@ def load_data(df):
         log_to_db("player_shot_logs", "batch_insert", "failure", error_level="critical", source_script="transform_and_load_shots.py")
         raise
 
-if __name__ == "__main__":
-    df_transformed = transform_data()
-    load_data(df_transformed)
+# --- Streaming mode
 
+def produce_chunks(input_path, chunk_size, chunk_queue, stop=None):
+    """
+    Reads and transforms the CSV one chunk at a time, handing insert-ready rows
+    to the loader. read_csv keeps the row index running across chunks and the
+    dtypes are fixed, so SHOT_EVENT_IDs match a full-file transform.
+    Setting `stop` makes the producer give up, even while waiting on a full queue.
+    """
+    stop = stop or threading.Event()
 
+    def put(item):
+        while not stop.is_set():
+            try:
+                chunk_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    seen_ids = set()
+    try:
+        for chunk in pd.read_csv(input_path, chunksize=chunk_size, dtype=SHOT_LOG_DTYPES):
+            offset = int(chunk.index[0])
+            if not put((offset, to_rows(transform_frame(chunk), seen_ids))):
+                return
+    except Exception as e:
+        put(e)
+        return
+    put(None)
+
+def stream_load(input_path=INPUT_PATH, chunk_size=CHUNK_SIZE, prefetch=PREFETCH_CHUNKS, strategy=None):
+    """
+    Loads shot logs chunk by chunk, parsing the next chunk while the current one
+    is inserted. At most prefetch + 2 chunks are held in memory at once.
+    """
+    try:
+        log_message(f"🚚 Streaming shot logs into SQL Server in chunks of {chunk_size:,} rows...")
+        log_to_db("player_shot_logs", "transform", "success", error_level="info", source_script="transform_and_load_shots.py")
+
+        conn = get_connection()
+
+        stop = threading.Event()
+        chunk_queue = queue.Queue(maxsize=prefetch)
+        producer = threading.Thread(target=produce_chunks, args=(input_path, chunk_size, chunk_queue, stop), daemon=True)
+        producer.start()
+
+        total = 0
+        try:
+            while True:
+                item = chunk_queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+
+                offset, rows = item
+                total += insert_rows(conn, rows, offset=offset, strategy=strategy)
+        finally:
+            # After a failed insert the producer may be blocked on a full queue; release it first
+            stop.set()
+            producer.join()
+            conn.close()
+
+        log_message(f"🏁 Streamed {total:,} shot logs into player_shot_logs")
+        log_to_db("player_shot_logs", "batch_insert", "success", error_level="info", source_script="transform_and_load_shots.py")
+
+    except Exception as e:
+        log_message(f"🔥 Error streaming shot logs: {e}")
+        log_to_db("player_shot_logs", "batch_insert", "failure", error_level="critical", source_script="transform_and_load_shots.py")
+        raise
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Transform shot_logs.csv and load it into player_shot_logs.")
+    parser.add_argument("--stream", action="store_true", help="Read, transform and insert the CSV in chunks")
+    parser.add_argument("--chunk_size", type=int, default=CHUNK_SIZE, help="Rows per chunk in --stream mode")
+    parser.add_argument("--strategy", choices=list(BULK_STRATEGIES), default=None, help="Bulk load strategy (default depends on backend)")
+    args = parser.parse_args()
 
+    if args.stream:
+        stream_load(chunk_size=args.chunk_size, strategy=args.strategy)
+    else:
+        df_transformed = transform_data()
+        load_data(df_transformed, strategy=args.strategy)
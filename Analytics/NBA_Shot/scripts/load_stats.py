@@ -6,8 +6,23 @@ from nba_api.stats.endpoints import PlayerGameLogs
 
 # Allow absolute import from project root
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from scripts.db_connect import get_connection
+from scripts.db_connect import get_connection, bulk_load
 from scripts.etl_logger import log_message, log_to_db
+from scripts.nba_cache import install_cache
+
+install_cache()  # serve repeat nba_api calls from data/cache/nba_api
+
+GAME_LOG_COLUMNS = [
+    "SEASON_YEAR", "PLAYER_ID", "PLAYER_NAME", "NICKNAME", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME",
+    "GAME_ID", "GAME_DATE", "MATCHUP", "WL", "MIN", "FGM", "FGA", "FG_PCT", "FG3M", "FG3A", "FG3_PCT",
+    "FTM", "FTA", "FT_PCT", "OREB", "DREB", "REB", "AST", "TOV", "STL", "BLK", "BLKA", "PF", "PFD", "PTS",
+    "PLUS_MINUS", "NBA_FANTASY_PTS", "DD2", "TD3", "WNBA_FANTASY_PTS",
+    "GP_RANK", "W_RANK", "L_RANK", "W_PCT_RANK", "MIN_RANK", "FGM_RANK", "FGA_RANK", "FG_PCT_RANK",
+    "FG3M_RANK", "FG3A_RANK", "FG3_PCT_RANK", "FTM_RANK", "FTA_RANK", "FT_PCT_RANK",
+    "OREB_RANK", "DREB_RANK", "REB_RANK", "AST_RANK", "TOV_RANK", "STL_RANK", "BLK_RANK", "BLKA_RANK",
+    "PF_RANK", "PFD_RANK", "PTS_RANK", "PLUS_MINUS_RANK", "NBA_FANTASY_PTS_RANK",
+    "DD2_RANK", "TD3_RANK", "WNBA_FANTASY_PTS_RANK", "AVAILABLE_FLAG", "MIN_SEC"
+]
 
 def convert_min_sec(val):
     try:
@@ -45,42 +60,19 @@ def extract_and_load_game_logs(season="2023-24", batch_size=1000):
         actual_cols = df.shape[1]
         assert actual_cols == expected_cols, f"❌ DataFrame has {actual_cols} columns, expected {expected_cols}"
 
-        conn = get_connection()
-        cursor = conn.cursor()
-        log_message(f"🚚 Beginning batch insert of {len(df)} rows into [player_game_logs]...")
-
-        insert_stmt = """
-            INSERT INTO player_game_logs (
-                SEASON_YEAR, PLAYER_ID, PLAYER_NAME, NICKNAME, TEAM_ID, TEAM_ABBREVIATION, TEAM_NAME,
-                GAME_ID, GAME_DATE, MATCHUP, WL, MIN, FGM, FGA, FG_PCT, FG3M, FG3A, FG3_PCT,
-                FTM, FTA, FT_PCT, OREB, DREB, REB, AST, TOV, STL, BLK, BLKA, PF, PFD, PTS,
-                PLUS_MINUS, NBA_FANTASY_PTS, DD2, TD3, WNBA_FANTASY_PTS,
-                GP_RANK, W_RANK, L_RANK, W_PCT_RANK, MIN_RANK, FGM_RANK, FGA_RANK, FG_PCT_RANK,
-                FG3M_RANK, FG3A_RANK, FG3_PCT_RANK, FTM_RANK, FTA_RANK, FT_PCT_RANK,
-                OREB_RANK, DREB_RANK, REB_RANK, AST_RANK, TOV_RANK, STL_RANK, BLK_RANK, BLKA_RANK,
-                PF_RANK, PFD_RANK, PTS_RANK, PLUS_MINUS_RANK, NBA_FANTASY_PTS_RANK,
-                DD2_RANK, TD3_RANK, WNBA_FANTASY_PTS_RANK, AVAILABLE_FLAG, MIN_SEC
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?
-            )
-        """
-
         rows = df.where(pd.notnull(df), None).values.tolist()
 
-        for i in range(0, len(rows), batch_size):
-            batch = rows[i:i+batch_size]
+        for j, row in enumerate(rows):
+            if len(row) != expected_cols:
+                raise ValueError(f"❌ Row {j} has {len(row)} columns, expected {expected_cols}")
 
-            for j, row in enumerate(batch):
-                if len(row) != expected_cols:
-                    raise ValueError(f"❌ Row {i+j} has {len(row)} columns, expected {expected_cols}")
+        conn = get_connection()
+        log_message(f"🚚 Beginning batch insert of {len(df)} rows into [player_game_logs]...")
 
-            cursor.executemany(insert_stmt, batch)
-            conn.commit()
-            log_message(f"✅ Inserted rows {i} to {i+len(batch)-1}")
+        def log_batch(start, count):
+            log_message(f"✅ Inserted rows {start} to {start + count - 1}")
 
-        cursor.close()
+        bulk_load(conn, "player_game_logs", GAME_LOG_COLUMNS, rows, batch_size=batch_size, on_batch=log_batch)
         conn.close()
         log_message(f"🏁 Successfully inserted {len(df)} rows into [player_game_logs].")
 
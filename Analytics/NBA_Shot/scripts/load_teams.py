@@ -7,8 +7,16 @@ from nba_api.stats.endpoints import TeamInfoCommon
 # Make scripts importable
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from scripts.db_connect import get_connection
+from scripts.db_connect import get_connection, bulk_load, ensure_table
 from scripts.etl_logger import log_message, log_to_db
+from scripts.nba_cache import install_cache
+
+install_cache()  # serve repeat nba_api calls from data/cache/nba_api
+
+TEAM_COLUMNS = [
+    "TEAM_ID", "TEAM_NAME", "TEAM_ABBREVIATION", "TEAM_CITY",
+    "TEAM_CONFERENCE", "TEAM_DIVISION", "MIN_YEAR", "MAX_YEAR"
+]
 
 def extract_team_info_to_csv():
     try:
@@ -57,49 +65,34 @@ def load_teams_from_csv(csv_path):
     try:
         df = pd.read_csv(csv_path)
 
+        rows = df[TEAM_COLUMNS].astype(object).where(pd.notnull(df[TEAM_COLUMNS]), None).values.tolist()
+
         conn = get_connection()
+        ensure_table(conn, "team_info", TEAM_COLUMNS)
         cursor = conn.cursor()
 
         cursor.execute("DELETE FROM team_info;")
+        cursor.close()
         log_message("🧹 Deleted all rows from team_info table.")
 
-        inserted = 0
-
-        for _, row in df.iterrows():
-            try:
-                cursor.execute("""
-                    INSERT INTO team_info (
-                        TEAM_ID, TEAM_NAME, TEAM_ABBREVIATION, TEAM_CITY,
-                        TEAM_CONFERENCE, TEAM_DIVISION, MIN_YEAR, MAX_YEAR
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    int(row['TEAM_ID']), row['TEAM_NAME'], row['TEAM_ABBREVIATION'], row['TEAM_CITY'],
-                    row['TEAM_CONFERENCE'], row['TEAM_DIVISION'], int(row['MIN_YEAR']), int(row['MAX_YEAR'])
-                ))
-                log_to_db(
-                    table_name="team_info",
-                    change_type="insert",
-                    log_status="success",
-                    row_id=str(row['TEAM_ID']),
-                    source_script="load_teams.py"
-                )
-                inserted += 1
-
-            except Exception as row_err:
-                log_message(f"❌ Insert failed for TEAM_ID {row['TEAM_ID']}: {row_err}")
-                log_to_db(
-                    table_name="team_info",
-                    change_type="insert",
-                    log_status="failure",
-                    error_level="critical",
-                    row_id=str(row['TEAM_ID']),
-                    org_val=str(row.to_dict()),
-                    source_script="load_teams.py"
-                )
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        try:
+            inserted = bulk_load(conn, "team_info", TEAM_COLUMNS, rows, commit=False)
+            # DELETE + reload commit together, so a failed load leaves the old rows in place
+            conn.commit()
+            log_to_db(
+                table_name="team_info",
+                change_type="bulk_insert",
+                log_status="success",
+                error_level="info",
+                new_val=inserted,
+                source_script="load_teams.py"
+            )
+        except Exception as load_err:
+            conn.rollback()
+            log_message(f"❌ Bulk insert into team_info failed: {load_err}")
+            raise
+        finally:
+            conn.close()
 
         log_message(f"✅ Inserted {inserted} rows into team_info.")
 
@@ -0,0 +1,171 @@
+# scripts/nba_cache.py
+
+import os
+import json
+import time
+import hashlib
+import threading
+from contextlib import contextmanager
+
+# ----------- Cache Config -----------
+
+CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "cache", "nba_api"))
+TTL_HOURS = float(os.environ.get("NBA_CACHE_TTL_HOURS", 24 * 7))
+MAX_MB = float(os.environ.get("NBA_CACHE_MAX_MB", 2048))
+# "1" serves everything from the cache and never touches the network
+OFFLINE = os.environ.get("NBA_API_OFFLINE", "0") == "1"
+
+_lock = threading.Lock()
+_local = threading.local()  # per-thread cache_only() flag
+_installed = False
+_stats = {"hits": 0, "misses": 0, "evicted": 0}
+_cache_bytes = None  # running size estimate; None until the first write scans the folder
+
+class CacheMiss(RuntimeError):
+    """
+    Raised in offline mode when a request has no cached response.
+    """
+
+# ----------- Keys + Storage -----------
+
+def cache_key(endpoint, parameters):
+    """
+    Key = SHA-256 of the endpoint name plus its sorted request parameters.
+    """
+    params = sorted((str(k), "" if v is None else str(v)) for k, v in (parameters or {}).items())
+    payload = json.dumps([endpoint, params], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _entry_path(key):
+    return os.path.join(CACHE_DIR, key[:2], f"{key}.json")
+
+def read_entry(key, ttl_hours=None, offline=None):
+    """
+    Returns the cached response body, or None if missing or expired.
+    Expired entries are still served in offline mode.
+    """
+    ttl_hours = TTL_HOURS if ttl_hours is None else ttl_hours
+    offline = OFFLINE if offline is None else offline
+    path = _entry_path(key)
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not offline and time.time() - entry["fetched_at"] > ttl_hours * 3600:
+        return None
+    os.utime(path)  # mtime doubles as the LRU "last used" stamp
+    return entry["body"]
+
+def write_entry(key, endpoint, parameters, body):
+    path = _entry_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"endpoint": endpoint, "parameters": parameters, "fetched_at": time.time(), "body": body}, f, default=str)
+    os.replace(tmp_path, path)
+
+    global _cache_bytes
+    with _lock:
+        if _cache_bytes is not None:
+            _cache_bytes += os.path.getsize(path)
+        over = _cache_bytes is None or _cache_bytes > MAX_MB * 1024 * 1024
+    if over:
+        evict()
+
+def evict(max_mb=None):
+    """
+    Deletes least-recently-used entries until the cache fits in max_mb. Returns entries removed.
+    """
+    global _cache_bytes
+    max_mb = MAX_MB if max_mb is None else max_mb
+    with _lock:
+        entries = []
+        for root, _, files in os.walk(CACHE_DIR):
+            for name in files:
+                if name.endswith(".json"):
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        limit = max_mb * 1024 * 1024
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= limit:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        _stats["evicted"] += removed
+        _cache_bytes = total
+        return removed
+
+def cache_stats():
+    return dict(_stats)
+
+# ----------- Lookup -----------
+
+@contextmanager
+def cache_only():
+    """
+    On this thread, requests inside the block are answered from the cache or raise
+    CacheMiss, as in offline mode. Lets callers split cached requests from ones that
+    need a (rate-limited) network call.
+    """
+    previous = getattr(_local, "cache_only", False)
+    _local.cache_only = True
+    try:
+        yield
+    finally:
+        _local.cache_only = previous
+
+def lookup(endpoint, parameters):
+    """
+    Returns (key, cached body). The body is None when the caller should fetch and
+    write_entry() the response; raises CacheMiss when fetching is not allowed.
+    """
+    key = cache_key(endpoint, parameters)
+    body = read_entry(key)
+    if body is not None:
+        with _lock:
+            _stats["hits"] += 1
+        return key, body
+
+    if OFFLINE or getattr(_local, "cache_only", False):
+        raise CacheMiss(f"No cached response for {endpoint} {parameters} (offline or cache-only)")
+
+    with _lock:
+        _stats["misses"] += 1
+    return key, None
+
+# ----------- nba_api Hook -----------
+
+def install_cache():
+    """
+    Routes every nba_api stats endpoint through the on-disk cache.
+    Safe to call more than once.
+    """
+    global _installed
+    if _installed:
+        return
+    from nba_api.stats.library.http import NBAStatsHTTP
+
+    original = NBAStatsHTTP.send_api_request
+
+    def cached_send_api_request(self, endpoint, parameters, *args, **kwargs):
+        key, body = lookup(endpoint, parameters)
+        if body is not None:
+            return self.nba_response(response=body, status_code=200, url=f"cache://{endpoint}/{key}")
+
+        response = original(self, endpoint, parameters, *args, **kwargs)
+        body = response.get_response()
+        if response._status_code == 200 and response.valid_json():
+            write_entry(key, endpoint, parameters, body)
+        return response
+
+    NBAStatsHTTP.send_api_request = cached_send_api_request
+    _installed = True
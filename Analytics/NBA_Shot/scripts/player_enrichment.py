@@ -0,0 +1,175 @@
+# scripts/player_enrichment.py
+
+import os
+import sys
+import json
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Enable script imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scripts.etl_logger import log_message
+from scripts import nba_cache
+from scripts.nba_cache import CacheMiss, cache_only, install_cache
+
+# ----------- Enrichment Config -----------
+
+# Responses are cached by nba_cache (data/cache/nba_api, NBA_CACHE_TTL_HOURS, NBA_API_OFFLINE)
+MAX_WORKERS = 4           # requests in flight
+RATE_PER_SEC = 1.0        # global request rate across all workers
+MAX_RETRIES = 3
+BACKOFF_BASE = 2.0        # seconds; doubles per retry, plus jitter
+REQUEST_TIMEOUT = 30
+
+# ----------- Rate Limiting -----------
+
+class RateLimiter:
+    """
+    Token bucket shared by all workers: `rate` calls per second, bursts up to `burst`.
+    Replaces the fixed per-call sleep, so waiting only happens when workers are actually ahead.
+    """
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+# ----------- Endpoint -----------
+
+def fetch_common_player_info(player_id):
+    """
+    Calls CommonPlayerInfo through the nba_cache hook and returns its first row as a plain dict.
+    """
+    from nba_api.stats.endpoints import CommonPlayerInfo
+    install_cache()
+    result = CommonPlayerInfo(player_id=player_id, timeout=REQUEST_TIMEOUT).get_normalized_dict()
+    rows = result.get("CommonPlayerInfo") or []
+    if not rows:
+        raise ValueError(f"No CommonPlayerInfo rows for PLAYER_ID {player_id}")
+    return rows[0]
+
+def _fetch_with_retry(player_id, fetcher, limiter, label):
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.acquire()
+        try:
+            return fetcher(player_id)
+        except Exception as e:
+            if attempt == MAX_RETRIES or isinstance(e, CacheMiss):
+                raise
+            delay = BACKOFF_BASE * 2 ** attempt + random.uniform(0, BACKOFF_BASE)
+            log_message(f"🔁 {label}PLAYER_ID {player_id} failed ({e}); retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s")
+            time.sleep(delay)
+
+# ----------- Enrichment Engine -----------
+
+def enrich_players(player_ids, fetcher=fetch_common_player_info,
+                   max_workers=MAX_WORKERS, rate=RATE_PER_SEC, label=""):
+    """
+    Returns ([(player_id, info_row), ...] in player_ids order, stats).
+    `fetcher` must go through nba_cache, which owns the one cache, TTL and offline policy.
+    Players with a fresh cached response are answered first without the rate limit; only
+    new or stale players are fetched, with up to `max_workers` in flight under one
+    global rate limit. Players that still fail after retries are logged and left out.
+    """
+    start = time.perf_counter()
+    results = {}
+    to_fetch = []
+    for pid in player_ids:
+        try:
+            with cache_only():
+                results[pid] = fetcher(pid)
+        except Exception:
+            to_fetch.append(pid)
+
+    log_message(f"🗂️ {label}{len(results)} players from cache, {len(to_fetch)} to fetch")
+
+    failed = 0
+    if to_fetch:
+        limiter = RateLimiter(rate)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_fetch_with_retry, pid, fetcher, limiter, label): pid for pid in to_fetch}
+            for future in as_completed(futures):
+                pid = futures[future]
+                try:
+                    results[pid] = future.result()
+                except Exception as e:
+                    failed += 1
+                    log_message(f"⚠️ {label}Skipped PLAYER_ID {pid} due to error: {e}")
+
+    stats = {
+        "cached": len(player_ids) - len(to_fetch),
+        "fetched": len(to_fetch) - failed,
+        "failed": failed,
+        "seconds": time.perf_counter() - start,
+    }
+    log_message(
+        f"⏱️ {label}Enrichment done in {stats['seconds']:.1f}s | "
+        f"cached {stats['cached']}, fetched {stats['fetched']}, failed {stats['failed']}"
+    )
+    return [(pid, results[pid]) for pid in player_ids if pid in results], stats
+
+# ----------- Local Fake Endpoint -----------
+
+def fake_common_player_info(player_id, latency=0.2, failure_rate=0.05):
+    """
+    Stand-in for CommonPlayerInfo: same fields, simulated latency and transient failures.
+    Cached through nba_cache the same way the install_cache() hook caches the real endpoint.
+    """
+    parameters = {"PlayerID": player_id}
+    key, body = nba_cache.lookup("fakecommonplayerinfo", parameters)
+    if body is not None:
+        return json.loads(body)
+
+    time.sleep(latency)
+    if random.random() < failure_rate:
+        raise ConnectionError("simulated timeout")
+    row = {
+        "PERSON_ID": player_id,
+        "DISPLAY_FIRST_LAST": f"Player {player_id}",
+        "BIRTHDATE": "1995-01-01T00:00:00",
+        "HEIGHT": f"6-{player_id % 12}",
+        "COUNTRY": "USA",
+        "DRAFT_YEAR": "2016",
+        "DRAFT_ROUND": "1",
+        "DRAFT_NUMBER": str(player_id % 30 + 1),
+        "POSITION": "Guard",
+        "TEAM_ID": 1610612738,
+        "TEAM_NAME": "Celtics",
+    }
+    nba_cache.write_entry(key, "fakecommonplayerinfo", parameters, json.dumps(row))
+    return row
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Run the enrichment engine against the local fake endpoint.")
+    parser.add_argument("--players", type=int, default=60, help="Fake player IDs to enrich")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--rate", type=float, default=10.0, help="Requests/sec (the fake has no real limit)")
+    args = parser.parse_args()
+
+    ids = list(range(1, args.players + 1))
+    BACKOFF_BASE = 0.1
+    with tempfile.TemporaryDirectory() as cache:
+        nba_cache.CACHE_DIR = cache
+        first, stats = enrich_players(ids, fake_common_player_info, max_workers=args.workers, rate=args.rate)
+        print(f"🧪 Cold run: {stats}")
+        second, stats = enrich_players(ids, fake_common_player_info, max_workers=args.workers, rate=args.rate)
+        print(f"🧪 Warm run: {stats}")
+        assert [pid for pid, _ in second] == [pid for pid, _ in first]
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Same imports the scripts use: project root for scripts.*, models/ for model_config and friends
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_DIR)
+sys.path.insert(0, os.path.join(PROJECT_DIR, "models"))
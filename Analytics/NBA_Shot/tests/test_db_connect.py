@@ -0,0 +1,61 @@
+import sqlite3
+
+import pytest
+
+from scripts import db_connect
+from scripts.db_connect import bulk_load, ensure_table, incremental_load, load_bulk_insert
+
+COLUMNS = ["TEAM_ID", "TEAM_NAME"]
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    # As if run with NBA_DB_BACKEND=sqlite
+    monkeypatch.setattr(db_connect, "DB_BACKEND", "sqlite")
+    conn = sqlite3.connect(tmp_path / "NBA_Shots.db")
+    yield conn
+    conn.close()
+
+def test_delete_and_reload_on_fresh_database(conn):
+    # What load_teams does: ensure the table, DELETE, reload, one commit
+    ensure_table(conn, "team_info", COLUMNS)
+    conn.execute("DELETE FROM team_info;")
+    assert bulk_load(conn, "team_info", COLUMNS, [[1, "ATL"], [2, "BOS"]], commit=False) == 2
+    conn.commit()
+
+    ensure_table(conn, "team_info", COLUMNS)
+    conn.execute("DELETE FROM team_info;")
+    bulk_load(conn, "team_info", COLUMNS, [[3, "CHA"]], commit=False)
+    conn.rollback()
+    assert conn.execute("SELECT TEAM_ID FROM team_info ORDER BY TEAM_ID").fetchall() == [(1,), (2,)]
+
+def test_incremental_load_churn_and_repeated_keys(conn):
+    first = incremental_load(conn, "player_info", COLUMNS, "TEAM_ID", [[1, "a"], [2, "b"]])
+    assert first == {"inserted": 2, "updated": 0, "deleted": 0, "unchanged": 0}
+
+    second = incremental_load(conn, "player_info", COLUMNS, "TEAM_ID", [[1, "a"], [3, "c"], [2, "B"]])
+    assert second == {"inserted": 1, "updated": 1, "deleted": 0, "unchanged": 1}
+
+    with pytest.raises(ValueError, match="Repeated"):
+        incremental_load(conn, "player_info", COLUMNS, "TEAM_ID", [[1, "a"], [1, "b"]])
+
+class FailingCursor:
+    """
+    Stands in for a pyodbc cursor whose connection is broken after the first failure.
+    """
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, sql):
+        self.statements.append(sql)
+        raise RuntimeError("connection is in an error state" if len(self.statements) > 1 else "BULK INSERT failed")
+
+def test_bulk_insert_cleanup_does_not_mask_load_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_connect, "BULK_STAGE_DIR", str(tmp_path))
+    cursor = FailingCursor()
+
+    with pytest.raises(RuntimeError, match="BULK INSERT failed"):
+        load_bulk_insert(cursor, "team_info", COLUMNS, [[1, "ATL"]])
+
+    assert "DROP TABLE #bulk_stage" in cursor.statements[-1]
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from model_config import FEATURES
+from feature_pipeline import ShotFeaturePipeline, FEATURE_SETS, INTERACTIONS
+from scripts.feature_store import add_derived_flags
+
+def make_features(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "SHOT_DIST": rng.uniform(0, 40, n_rows).round(1),
+        "CLOSE_DEF_DIST": rng.uniform(0, 30, n_rows).round(1),
+        "TOUCH_TIME": rng.uniform(0, 20, n_rows).round(1),
+        "SHOT_CLOCK": rng.uniform(0, 24, n_rows).round(1),
+        "HEIGHT_DIFFERENTIAL": rng.integers(-12, 12, n_rows).astype(float),
+        "DRIBBLES": rng.integers(0, 20, n_rows),
+    })
+    # Bin edges, out-of-range distances and a missing one
+    df.loc[:7, "SHOT_DIST"] = [0.0, 5.0, 10.0, 25.0, 100.0, 100.5, -1.0, np.nan]
+    return add_derived_flags(df)[FEATURES]
+
+# --- Baseline feature engineering from train_xgbv2.py / train_log.py before the shared pipeline
+
+def baseline_xgb_v2(X):
+    X = X.copy()
+    bins = [0, 5, 10, 15, 20, 25, 100]
+    labels = ["0-5", "5-10", "10-15", "15-20", "20-25", "25+"]
+    X["DIST_BIN"] = pd.cut(X["SHOT_DIST"], bins=bins, labels=labels)
+    X["DIST_x_DEF"] = X["SHOT_DIST"] * X["CLOSE_DEF_DIST"]
+    return pd.get_dummies(X, columns=["DIST_BIN"], drop_first=True)
+
+def baseline_logreg(X):
+    X = X.copy()
+    X["SCxTT"] = X["SHOT_CLOCK"] * X["TOUCH_TIME"]
+    X["CDxHD"] = X["CLOSE_DEF_DIST"] * X["HEIGHT_DIFFERENTIAL"]
+    return X[["SHOT_DIST", "SHOT_CLOCK", "HEIGHT_DIFFERENTIAL", "SCxTT", "CDxHD"]]
+
+def test_xgb_v2_features_match_baseline():
+    X = make_features(1_000)
+    pipeline = ShotFeaturePipeline().fit(X)
+
+    expected = baseline_xgb_v2(X).astype(float)
+    result = pipeline.transform(X, columns=FEATURE_SETS["xgb_v2"])
+
+    assert list(expected.columns) == FEATURE_SETS["xgb_v2"]
+    pdt.assert_frame_equal(result, expected)
+
+def test_logreg_features_match_baseline():
+    X = make_features(300, seed=1)
+    pipeline = ShotFeaturePipeline().fit(X)
+
+    pdt.assert_frame_equal(pipeline.transform(X, columns=FEATURE_SETS["logreg"]), baseline_logreg(X).astype(float))
+
+def test_every_interaction_is_its_product():
+    X = make_features(300, seed=2)
+    out = ShotFeaturePipeline().fit(X).transform(X)
+
+    for name, (left, right) in INTERACTIONS.items():
+        np.testing.assert_array_equal(out[name].to_numpy(), (X[left] * X[right]).to_numpy(dtype=float))
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from scripts.feature_store import load_features, FLAG_COLUMNS
+
+def test_store_matches_csv_plus_flags(tmp_path):
+    rng = np.random.default_rng(3)
+    n_rows = 500
+    source = tmp_path / "cleaned_shots.csv"
+    pd.DataFrame({
+        "SHOT_EVENT_ID": [f"{i:012x}" for i in range(n_rows)],
+        "SHOT_DIST": rng.uniform(0, 40, n_rows).round(1),
+        "TOUCH_TIME": rng.choice([0.5, 9.9, 10.0, 12.0], n_rows),
+        "SHOT_CLOCK": rng.choice([0.0, 5.0, 5.1, 20.0], n_rows),
+        "HEIGHT_DIFFERENTIAL": rng.integers(-8, 9, n_rows).astype(float),
+        "DRIBBLES": rng.integers(0, 10, n_rows),
+        "SHOT_MADE": rng.integers(0, 2, n_rows).astype(bool),
+    }).to_csv(source, index=False)
+
+    # Flags as model_config.prepare_data derived them from the CSV before the store existed
+    expected = pd.read_csv(source)
+    expected["HAS_HEIGHT_ADVANTAGE"] = (expected["HEIGHT_DIFFERENTIAL"] >= 5).astype(int)
+    expected["LOW_CLOCK"] = (expected["SHOT_CLOCK"] <= 5).astype(int)
+    expected["LONG_TOUCH"] = (expected["TOUCH_TIME"] >= 10).astype(int)
+    expected["HIGH_DRIBBLE"] = (expected["DRIBBLES"] >= 5).astype(int)
+
+    store_dir = tmp_path / "feature_store"
+    result = load_features(source=str(source), store_dir=str(store_dir))
+    pdt.assert_frame_equal(result, expected, check_dtype=False)
+
+    # Second read comes from the store; a column subset reads only those columns
+    columns = ["SHOT_DIST", "SHOT_MADE"] + FLAG_COLUMNS
+    pdt.assert_frame_equal(load_features(columns, str(source), str(store_dir)), expected[columns], check_dtype=False)
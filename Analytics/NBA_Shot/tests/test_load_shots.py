@@ -0,0 +1,118 @@
+import queue
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+import pandas.testing as pdt
+
+from scripts import load_shots
+from scripts.load_shots import (
+    compute_time_remaining, compute_time_remaining_vectorized,
+    generate_id, generate_ids, transform_frame, to_rows, produce_chunks, SHOT_LOG_DTYPES,
+)
+from scripts.benchmark_transform import make_synthetic_shots
+
+# --- Vectorized helpers vs the row-wise originals
+
+def test_time_remaining_matches_row_wise():
+    clock = pd.Series(["11:59", "0:00", "5:07", " 3 : 4 ", "", None, "abc", "12:00", "7:30", "1:2:3"])
+    period = pd.Series([1, 2, 3, 4, 4, 1, 2, 5, 6, 3])
+    is_ot = (period >= 5).astype("int64")
+
+    expected = [compute_time_remaining(c, p, o) for c, p, o in zip(clock, period, is_ot)]
+    result = compute_time_remaining_vectorized(clock, period, is_ot)
+
+    assert result.tolist() == expected
+    assert result.dtype == "int64"
+
+def test_time_remaining_accepts_what_int_accepts():
+    # Anything int() parses counts as a clock on both paths
+    clock = pd.Series(["1_0:05", " 5:07 ", "\t3:04\n", "+1:-2", "\u0663:04", "1 0:05", "0x1:05", "5:"])
+    period = pd.Series([1, 2, 3, 4, 1, 2, 3, 4])
+    is_ot = pd.Series([0] * len(clock))
+
+    expected = [compute_time_remaining(c, p, o) for c, p, o in zip(clock, period, is_ot)]
+    assert compute_time_remaining_vectorized(clock, period, is_ot).tolist() == expected
+    assert expected[0] == 2765 and expected[-1] == 0
+
+def test_generate_ids_match_row_wise():
+    df = make_synthetic_shots(200)
+    df = df.rename(columns={"player_id": "PLAYER_ID"}).set_index(pd.RangeIndex(500, 700))
+
+    expected = df.apply(generate_id, axis=1)
+    pdt.assert_series_equal(generate_ids(df), expected, check_names=False)
+
+# --- Whole transform
+
+def test_transform_frame_matches_row_wise():
+    raw = make_synthetic_shots(5_000)
+
+    expected = transform_frame(raw.copy(), vectorized=False)
+    result = transform_frame(raw.copy(), vectorized=True)
+
+    pdt.assert_frame_equal(result, expected)
+
+def test_streamed_chunks_match_full_transform(tmp_path):
+    # --stream transforms read_csv chunks; IDs must come out the same as a full-file load
+    path = tmp_path / "shot_logs.csv"
+    make_synthetic_shots(2_500).to_csv(path, index=False)
+
+    chunk_queue = queue.Queue()
+    produce_chunks(str(path), 1_000, chunk_queue)
+    items = [chunk_queue.get() for _ in range(chunk_queue.qsize())]
+
+    assert items[-1] is None
+    assert [offset for offset, _ in items[:-1]] == [0, 1_000, 2_000]
+    streamed = [row for _, rows in items[:-1] for row in rows]
+    assert streamed == to_rows(transform_frame(pd.read_csv(path, dtype=SHOT_LOG_DTYPES)))
+
+def test_chunk_dtypes_do_not_change_ids(tmp_path):
+    # IDs blank only in the last chunk: untyped read_csv would make that chunk's IDs floats
+    path = tmp_path / "shot_logs.csv"
+    raw = make_synthetic_shots(2_500)
+    raw.loc[2_400, "player_id"] = np.nan
+    raw.loc[2_450, "GAME_ID"] = np.nan
+    raw.to_csv(path, index=False)
+
+    chunk_queue = queue.Queue()
+    produce_chunks(str(path), 1_000, chunk_queue)
+    items = [chunk_queue.get() for _ in range(chunk_queue.qsize())]
+    streamed = [row for _, rows in items[:-1] for row in rows]
+
+    full = transform_frame(pd.read_csv(path, dtype=SHOT_LOG_DTYPES))
+    assert streamed == to_rows(full.copy())
+    # Row-wise IDs on the same typed frame agree, and ints stay ints ("123", not "123.0")
+    row_wise = transform_frame(pd.read_csv(path, dtype=SHOT_LOG_DTYPES), vectorized=False)
+    assert full["SHOT_EVENT_ID"].tolist() == row_wise["SHOT_EVENT_ID"].tolist()
+    assert full["SHOT_EVENT_ID"].iloc[0] == generate_id(pd.Series({"PLAYER_ID": int(raw["player_id"][0]), "GAME_ID": int(raw["GAME_ID"][0])}, name=0))
+
+def test_repeated_ids_across_chunks_are_rejected():
+    frame = transform_frame(make_synthetic_shots(50))
+    seen = set()
+    to_rows(frame.copy(), seen)
+    with pytest.raises(ValueError, match="across chunks"):
+        to_rows(frame.iloc[40:].copy(), seen)
+
+def test_failed_insert_stops_producer_and_closes_connection(tmp_path, monkeypatch):
+    path = tmp_path / "shot_logs.csv"
+    make_synthetic_shots(5_000).to_csv(path, index=False)
+
+    conn = sqlite3.connect(tmp_path / "NBA_Shots.db", check_same_thread=False)
+    monkeypatch.setattr(load_shots, "get_connection", lambda: conn)
+    monkeypatch.setattr(load_shots, "log_message", lambda *a, **k: None)
+    monkeypatch.setattr(load_shots, "log_to_db", lambda *a, **k: None)
+
+    def failing_insert(conn, rows, offset=0, strategy=None):
+        raise RuntimeError("insert failed")
+    monkeypatch.setattr(load_shots, "insert_rows", failing_insert)
+
+    threads_before = threading.active_count()
+    with pytest.raises(RuntimeError, match="insert failed"):
+        load_shots.stream_load(str(path), chunk_size=500, prefetch=1)
+
+    # Producer was released from its full queue and joined; the connection is closed
+    assert threading.active_count() == threads_before
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+import model_config
+from model_config import FEATURES, META_COLS, TARGET, SPLITS, load_split_data
+
+def write_legacy_split_csvs(split_dir, seed=4):
+    """
+    X_/y_ CSVs in the layout prepare_data wrote before the split bundle.
+    """
+    rng = np.random.default_rng(seed)
+    offset = 0
+    for name, n_rows in zip(SPLITS, [120, 40, 50]):
+        df = pd.DataFrame({
+            "SHOT_DIST": rng.uniform(0, 40, n_rows).round(1),
+            "CLOSE_DEF_DIST": rng.uniform(0, 30, n_rows).round(1),
+            "TOUCH_TIME": rng.uniform(0, 20, n_rows).round(1),
+            "SHOT_CLOCK": rng.uniform(0, 24, n_rows).round(1),
+            "HEIGHT_DIFFERENTIAL": rng.integers(-12, 12, n_rows).astype(float),
+            "HAS_HEIGHT_ADVANTAGE": rng.integers(0, 2, n_rows),
+            "LOW_CLOCK": rng.integers(0, 2, n_rows),
+            "LONG_TOUCH": rng.integers(0, 2, n_rows),
+            "HIGH_DRIBBLE": rng.integers(0, 2, n_rows),
+            "SHOT_EVENT_ID": [f"{i:012x}" for i in range(offset, offset + n_rows)],
+            TARGET: rng.integers(0, 2, n_rows),
+        })
+        offset += n_rows
+        df[FEATURES + ["SHOT_EVENT_ID"]].to_csv(split_dir / f"X_{name}.csv", index=False)
+        df[[TARGET] + META_COLS].to_csv(split_dir / f"y_{name}.csv", index=False)
+
+def baseline_load_set(split_dir, name):
+    # load_split_data before the bundle: straight from the CSVs
+    X = pd.read_csv(split_dir / f"X_{name}.csv")
+    y_df = pd.read_csv(split_dir / f"y_{name}.csv")
+    return X.drop(columns=["SHOT_EVENT_ID"]), y_df[TARGET].values.ravel(), y_df[META_COLS]
+
+def test_bundle_matches_split_csvs(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_config, "SPLIT_DIR", str(tmp_path))
+    write_legacy_split_csvs(tmp_path)
+
+    loaded = load_split_data(bundle_dir=str(tmp_path / "splits"))
+    X_sets, y_sets, meta_sets = loaded[0:3], loaded[3:6], loaded[6:9]
+
+    for name, X, y, meta in zip(SPLITS, X_sets, y_sets, meta_sets):
+        X_csv, y_csv, meta_csv = baseline_load_set(tmp_path, name)
+        pdt.assert_frame_equal(X, X_csv, check_dtype=False)
+        np.testing.assert_array_equal(y, y_csv)
+        pdt.assert_frame_equal(meta, meta_csv, check_dtype=False)
+
+def test_bundle_reimports_edited_csvs(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_config, "SPLIT_DIR", str(tmp_path))
+    write_legacy_split_csvs(tmp_path)
+    bundle_dir = str(tmp_path / "splits")
+    load_split_data(bundle_dir=bundle_dir)
+
+    write_legacy_split_csvs(tmp_path, seed=5)
+    X_train = load_split_data(bundle_dir=bundle_dir)[0]
+    pdt.assert_frame_equal(X_train, baseline_load_set(tmp_path, "train")[0], check_dtype=False)
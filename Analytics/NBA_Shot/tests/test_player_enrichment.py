@@ -0,0 +1,39 @@
+import pytest
+
+from scripts import nba_cache, player_enrichment
+from scripts.player_enrichment import enrich_players, fake_common_player_info
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(nba_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(nba_cache, "OFFLINE", False)
+    monkeypatch.setattr(player_enrichment, "log_message", lambda *a, **k: None)
+    return tmp_path
+
+def fetcher(player_id):
+    return fake_common_player_info(player_id, latency=0, failure_rate=0)
+
+def test_second_run_is_served_by_nba_cache(cache_dir):
+    ids = [1, 2, 3]
+    first, stats = enrich_players(ids, fetcher, rate=1_000)
+    assert stats["fetched"] == 3 and stats["cached"] == 0
+
+    second, stats = enrich_players(ids, fetcher, rate=1_000)
+    assert (stats["cached"], stats["fetched"], stats["failed"]) == (3, 0, 0)
+    assert second == first
+    # nba_cache is the only store
+    assert len(list(cache_dir.rglob("*.json"))) == 3
+
+def test_nba_cache_ttl_and_offline_apply(cache_dir, monkeypatch):
+    enrich_players([1, 2], fetcher, rate=1_000)
+
+    # One TTL: expired entries are re-fetched
+    monkeypatch.setattr(nba_cache, "TTL_HOURS", 0)
+    _, stats = enrich_players([1, 2], fetcher, rate=1_000)
+    assert stats["fetched"] == 2
+
+    # One offline policy: expired entries are still served, unknown players fail without retries
+    monkeypatch.setattr(nba_cache, "OFFLINE", True)
+    rows, stats = enrich_players([1, 2, 99], fetcher, rate=1_000)
+    assert [pid for pid, _ in rows] == [1, 2]
+    assert stats["cached"] == 2 and stats["failed"] == 1
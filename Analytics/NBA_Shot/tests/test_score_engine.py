@@ -0,0 +1,69 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+import model_config
+import score_engine
+from model_config import FEATURES, META_COLS, TARGET, LOGREG_PARAMS
+from feature_pipeline import ShotFeaturePipeline, FEATURE_SETS
+from score_engine import ModelRegistry, score_frame
+from test_feature_pipeline import make_features
+
+SPECS = OrderedDict([
+    ("logreg_v1", ("Logistic Regression (v1)", "logreg_model.pkl", "logreg")),
+    ("rf_v3", ("Random Forest (v3)", "rf_model_v3.pkl", "rf_v3")),
+])
+
+def make_shots(n_rows, seed):
+    df = make_features(n_rows, seed).fillna({"SHOT_DIST": 0.0})
+    df["SHOT_EVENT_ID"] = [f"{i:012x}" for i in range(n_rows)]
+    df[TARGET] = np.random.default_rng(seed).random(n_rows) < 1 / (1 + np.exp(0.1 * (df["SHOT_DIST"] - 12)))
+    return df
+
+def train_models(model_dir):
+    train = make_shots(2_000, seed=10)
+    pipeline = ShotFeaturePipeline().fit(train[FEATURES])
+    features = pipeline.transform(train[FEATURES])
+
+    models = {
+        "logreg_v1": LogisticRegression(**LOGREG_PARAMS),
+        "rf_v3": RandomForestClassifier(n_estimators=20, max_depth=4, random_state=42),
+    }
+    for prefix, model in models.items():
+        model.fit(features[FEATURE_SETS[SPECS[prefix][2]]], train[TARGET].astype(int))
+        joblib.dump(model, model_dir / SPECS[prefix][1])
+    return pipeline, models
+
+def test_scores_match_per_model_predictions(tmp_path, monkeypatch):
+    # load_model reads model_config.MODEL_DIR; the registry sizes pickles from its own import
+    monkeypatch.setattr(model_config, "MODEL_DIR", str(tmp_path))
+    monkeypatch.setattr(score_engine, "MODEL_DIR", str(tmp_path))
+    pipeline, models = train_models(tmp_path)
+
+    shots = make_shots(700, seed=11)
+    features = pipeline.transform(shots[FEATURES])
+
+    # Scoring as model_eval did it: one predict_proba and one predict per model
+    expected = shots[META_COLS].copy()
+    expected["y_true"] = shots[TARGET].astype(int)
+    for prefix, model in models.items():
+        X = features[FEATURE_SETS[SPECS[prefix][2]]]
+        expected[f"{prefix}_prob"] = model.predict_proba(X)[:, 1]
+        expected[f"{prefix}_pred"] = model.predict(X)
+
+    serial = score_frame(shots, ModelRegistry(specs=SPECS), pipeline)
+    pdt.assert_frame_equal(serial, expected, check_dtype=False)
+
+    # Concurrent scoring with a budget that only fits one model gives the same frame
+    registry = ModelRegistry(budget_mb=0, specs=SPECS)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        for _ in range(2):
+            pdt.assert_frame_equal(score_frame(shots, registry, pipeline, pool=pool), expected, check_dtype=False)
+    assert len(registry.models) == 1
+    assert registry.stats["evictions"] > 0
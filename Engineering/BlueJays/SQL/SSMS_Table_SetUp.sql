@@ -45,6 +45,13 @@ CREATE TABLE Logs (
     log_message VARCHAR(MAX) NOT NULL
 );
 
+-- Per-date checkpoint ledger used by fetch_mlb_dataV2.py to resume backfills
+CREATE TABLE FetchProgress (
+    fetch_date DATE PRIMARY KEY,
+    games_inserted INT NOT NULL,
+    completed_at DATETIME NOT NULL
+);
+
 -- Index on Games table for team lookups
 CREATE NONCLUSTERED INDEX idx_games_home_team ON Games(home_team_id);
 CREATE NONCLUSTERED INDEX idx_games_away_team ON Games(away_team_id);
@@ -0,0 +1,102 @@
+import argparse #command line arguements
+import os # file paths and directory creation
+import random
+import shutil
+import tempfile
+import time
+import datetime
+import pandas as pd # reads both formats back the way analysts do
+
+from mlb_export import save_to_csv, save_to_parquet
+
+# ---------------------- #
+#  SYNTHETIC SEASON      #
+# ---------------------- #
+HEADERS = {
+    "Teams": ["team_id", "team_name", "team_abbr", "league", "division"],
+    "Venues": ["venue_id", "venue_name", "location"],
+    "Games": ["game_id", "game_date", "home_team_id", "away_team_id", "home_score", "away_score", "venue_id"],
+    "Linescore": ["game_id", "inning", "home_runs", "away_runs", "home_hits", "away_hits", "home_errors", "away_errors", "home_lob", "away_lob"],
+}
+
+def make_season(seasons, seed=42):
+    """Builds rows shaped like fetch_mlb_dataV2's export lists: 30 teams, ~15 games a day, ~9 innings a game."""
+    rng = random.Random(seed)
+    teams = [(100 + t, f"Team Name {t}", f"T{t:02d}", "American League" if t < 15 else "National League",
+              f"Division {t // 5}") for t in range(30)]
+    venues = [(1000 + t, f"Ballpark {t}", f"City {t}, State {t % 10}") for t in range(30)]
+
+    games, linescore = [], []
+    game_id = 700000
+    for season in range(seasons):
+        opening = datetime.date(2023 - season, 3, 30)
+        for day in range(186):
+            game_date = (opening + datetime.timedelta(day)).isoformat()
+            for _ in range(15):
+                game_id += 1
+                home, away = rng.sample(range(30), 2)
+                games.append((game_id, game_date, 100 + home, 100 + away, rng.randint(0, 12), rng.randint(0, 12), 1000 + home))
+                for inning in range(1, rng.choice([9, 9, 9, 10, 11]) + 1):
+                    linescore.append((game_id, inning, rng.randint(0, 3), rng.randint(0, 3), rng.randint(0, 4),
+                                      rng.randint(0, 4), rng.randint(0, 1), rng.randint(0, 1), rng.randint(0, 3), rng.randint(0, 3)))
+    return {"Teams": teams, "Venues": venues, "Games": games, "Linescore": linescore}
+
+# ---------------------- #
+#  BENCHMARK             #
+# ---------------------- #
+def folder_size(path):
+    return sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(path) for f in files)
+
+def write_csv(folder, data):
+    for table, rows in data.items():
+        save_to_csv(folder, f"{table}.csv", rows, HEADERS[table])
+
+def write_parquet(folder, data):
+    game_dates = {game[0]: game[1] for game in data["Games"]}
+    save_to_parquet(folder, "Teams", data["Teams"])
+    save_to_parquet(folder, "Venues", data["Venues"])
+    save_to_parquet(folder, "Games", data["Games"], partition_by="game_date")
+    save_to_parquet(folder, "Linescore", [(row[0], game_dates[row[0]]) + row[1:] for row in data["Linescore"]],
+                    partition_by="game_date")
+
+def read_csv(folder):
+    return {table: pd.read_csv(os.path.join(folder, f"{table}.csv")) for table in HEADERS}
+
+def read_parquet(folder):
+    return {table: pd.read_parquet(os.path.join(folder, table)) for table in HEADERS}
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare CSV and Parquet exports: bytes on disk, write time, read time.")
+    parser.add_argument("--seasons", type=int, default=3, help="Synthetic seasons to export")
+    parser.add_argument("--repeats", type=int, default=3, help="Read repetitions (best time is reported)")
+    args = parser.parse_args()
+
+    data = make_season(args.seasons)
+    print(f"Synthetic export: {len(data['Games']):,} games, {len(data['Linescore']):,} linescore rows")
+
+    workdir = tempfile.mkdtemp(prefix="mlb_export_bench_")
+    try:
+        csv_dir, parquet_dir = os.path.join(workdir, "csv"), os.path.join(workdir, "parquet")
+        os.makedirs(csv_dir)
+
+        _, csv_write = timed(write_csv, csv_dir, data)
+        _, parquet_write = timed(write_parquet, parquet_dir, data)
+        csv_read = min(timed(read_csv, csv_dir)[1] for _ in range(args.repeats))
+        parquet_read = min(timed(read_parquet, parquet_dir)[1] for _ in range(args.repeats))
+
+        # Same games come back from both formats
+        games_csv, games_parquet = read_csv(csv_dir)["Games"], read_parquet(parquet_dir)["Games"]
+        assert sorted(games_csv["game_id"]) == sorted(games_parquet["game_id"])
+
+        csv_bytes, parquet_bytes = folder_size(csv_dir), folder_size(parquet_dir)
+        print(f"{'format':<8} {'size (KB)':>10} {'write (s)':>10} {'read (s)':>10}")
+        print(f"{'CSV':<8} {csv_bytes / 1024:>10,.0f} {csv_write:>10.2f} {csv_read:>10.3f}")
+        print(f"{'Parquet':<8} {parquet_bytes / 1024:>10,.0f} {parquet_write:>10.2f} {parquet_read:>10.3f}")
+        print(f"Parquet is {csv_bytes / parquet_bytes:.1f}x smaller; full read is {csv_read / parquet_read:.1f}x faster")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
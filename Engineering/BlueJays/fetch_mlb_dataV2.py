@@ -1,10 +1,18 @@
 import argparse #command line arguements 
 import requests #fetches data from StatsAPI
-import csv # writes fetched data into CSV files
 import os # file paths and directory creation
 import datetime 
+import json # reads/writes recorded schedule fixtures
+import time
+import queue
+import atexit
+import random
+import threading
 import pyodbc # connects to SQL server for DB operations
+from collections import deque
 from datetime import timedelta # deals with date and time operations
+from concurrent.futures import ThreadPoolExecutor # overlaps schedule requests
+from mlb_export import save_to_csv, save_to_parquet # CSV / Parquet exports
 
 # ---------------------- #
 #  COMMAND LINE ARGUMENTS #
@@ -13,16 +21,38 @@ parser = argparse.ArgumentParser(description="Fetch MLB game data and store in S
 parser.add_argument("--start_date", required=True, help="Start date in YYYY-MM-DD format")
 parser.add_argument("--end_date", required=False, help="End date in YYYY-MM-DD format (optional)")
 parser.add_argument("--csv", action="store_true", help="Enable CSV export")
+parser.add_argument("--parquet", action="store_true", help="Enable Parquet export (partitioned by game date, needs pyarrow)")
+parser.add_argument("--concurrency", type=int, default=8, help="Max schedule requests in flight")
+parser.add_argument("--rate", type=float, default=10.0, help="Max schedule requests per second (token bucket)")
+parser.add_argument("--retries", type=int, default=3, help="Retries per date before skipping it")
+parser.add_argument("--record", help="Save every fetched schedule as a JSON fixture in this folder")
+parser.add_argument("--replay", help="Serve schedules from JSON fixtures in this folder instead of the API")
+parser.add_argument("--replay_latency", type=float, default=0.0, help="Simulated seconds per request in --replay mode")
+parser.add_argument("--fetch_only", action="store_true", help="Fetch and time schedules without touching the database")
+parser.add_argument("--resume", action="store_true", help="Report dates already committed (skipped) and dates remaining before fetching")
+parser.add_argument("--refetch", action="store_true", help="Ignore the FetchProgress ledger and process every date in the range")
 args = parser.parse_args()
 
 START_DATE = datetime.datetime.strptime(args.start_date, "%Y-%m-%d")
 END_DATE = datetime.datetime.strptime(args.end_date, "%Y-%m-%d") if args.end_date else START_DATE
 EXPORT_CSV = args.csv
+EXPORT_PARQUET = args.parquet
+CONCURRENCY = max(1, args.concurrency)
+RATE_LIMIT = args.rate
+MAX_RETRIES = args.retries
+RECORD_DIR = args.record
+REPLAY_DIR = args.replay
+REPLAY_LATENCY = args.replay_latency
+FETCH_ONLY = args.fetch_only
+RESUME_REPORT = args.resume
+REFETCH = args.refetch
 
 # Allows us to define a start and end date in our cmd line
 # Allows us to add a --csv flag to trigger CSV export
 # Converts input dates into datetime objects; if --end date is missing, defaults to start date
-# Exports to CSV if --csv is provided in cmd line
+# Exports to CSV if --csv is provided in cmd line; --parquet writes typed, date-partitioned Parquet as well
+# --concurrency/--rate/--retries tune the schedule fetcher; --record/--replay capture and serve offline fixtures
+# Dates already in the FetchProgress ledger are skipped unless --refetch is given; --resume reports what is left
 
 BASE_EXPORT_DIR = r"C:\Users\denos\OneDrive\Projects\BlueJays\data_exports" ## Change to your own path if testing
 
@@ -35,24 +65,111 @@ DB_CONN_STRING = f"DRIVER={{SQL Server}};SERVER={DB_SERVER};DATABASE={DB_NAME};T
 # ---------------------- #
 #  LOGGING FUNCTION      #
 # ---------------------- #
+LOG_QUEUE_SIZE = 10000      # log rows held in memory before spilling to the fallback file
+LOG_BATCH_SIZE = 200        # rows per executemany
+LOG_FLUSH_INTERVAL = 2.0    # seconds the writer waits for more rows before flushing
+LOG_RETRY_INTERVAL = 30     # seconds before reconnecting after a database failure
+LOG_FALLBACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fetch_mlb_fallback.log")
+LOG_INSERT_SQL = "INSERT INTO Logs (log_timestamp, log_category, log_message) VALUES (?, ?, ?)"
+
+_log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+_log_writer = None
+_log_lock = threading.Lock()
+
 def log_message(category, message):
-    """Logs messages to console and database."""
-    timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    log_entry = f"[{timestamp}] {category}: {message}"
+    """Logs messages to console and queues them for the database; never blocks on the database."""
+    now = datetime.datetime.now()
+    log_entry = f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] {category}: {message}"
     print(log_entry)
 
+    start_log_writer()
     try:
-        conn = pyodbc.connect(DB_CONN_STRING)
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO Logs (log_timestamp, log_category, log_message) VALUES (?, ?, ?)",
-                       datetime.datetime.now(), category, message)
-        conn.commit()
-        cursor.close()
+        _log_queue.put_nowait((now, category, message))
+    except queue.Full:
+        write_log_fallback([(now, category, message)])
+
+def write_log_fallback(rows):
+    """Appends log rows to the local fallback file."""
+    with _log_lock:
+        with open(LOG_FALLBACK_PATH, "a", encoding="utf-8") as f:
+            for ts, category, message in rows:
+                f.write(f"[{ts.strftime('%Y-%m-%d %H:%M:%S')}] {category}: {message}\n")
+
+def _log_writer_loop():
+    conn = None
+    retry_at = 0
+    running = True
+
+    while running:
+        rows = []
+        try:
+            item = _log_queue.get(timeout=LOG_FLUSH_INTERVAL)
+            while True:
+                if item is None:
+                    running = False
+                    break
+                rows.append(item)
+                if len(rows) >= LOG_BATCH_SIZE:
+                    break
+                item = _log_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if not rows:
+            continue
+
+        if conn is None and time.monotonic() >= retry_at:
+            try:
+                conn = pyodbc.connect(DB_CONN_STRING)
+            except Exception as e:
+                print(f"Failed to log to database: {e}")
+                retry_at = time.monotonic() + LOG_RETRY_INTERVAL
+        if conn is None:
+            write_log_fallback(rows)
+            continue
+
+        try:
+            cursor = conn.cursor()
+            cursor.executemany(LOG_INSERT_SQL, rows)
+            conn.commit()
+            cursor.close()
+        except Exception as e:
+            print(f"Failed to log to database: {e}")
+            write_log_fallback(rows)
+            try:
+                conn.close()
+            except Exception:
+                pass
+            conn = None
+            retry_at = time.monotonic() + LOG_RETRY_INTERVAL
+
+    if conn is not None:
         conn.close()
-    except Exception as e:
-        print(f"Failed to log to database: {e}")
+
+def start_log_writer():
+    global _log_writer
+    if _log_writer is None:
+        with _log_lock:
+            if _log_writer is None:
+                _log_writer = threading.Thread(target=_log_writer_loop, name="mlb-log-writer", daemon=True)
+                _log_writer.start()
+
+def close_log_writer(timeout=30):
+    """Drains queued log rows to the database (or fallback file) and stops the writer."""
+    global _log_writer
+    if _log_writer is None:
+        return
+    try:
+        _log_queue.put(None, timeout=timeout)
+    except queue.Full:
+        pass
+    _log_writer.join(timeout)
+    _log_writer = None
+
+atexit.register(close_log_writer)
 
 # Logs messages with timestamps, stores logs in LOGS table in MSS
+# A single writer thread owns one dedicated connection and inserts queued rows in batches
+# If the queue is full or the database is unreachable, rows go to fetch_mlb_fallback.log instead
 # Handles logging failures gracefully
 
 # ---------------------- #
@@ -68,27 +185,50 @@ def safe_int(value):
 # Converts API values to INT, handling missing or invalid inputs. Upon initial review of API content, no decimals will be needed for this exercise... upon further review I was wrong (SQL Q2 math requires a float)
 
 # ---------------------- #
-#  SAVE TO CSV FUNCTION  #
+#  KNOWN-KEY CACHE       #
 # ---------------------- #
-def save_to_csv(base_folder, filename, data, headers):
-    """Writes data to a CSV file within the specified folder."""
-    filepath = os.path.join(base_folder, filename)
-    file_exists = os.path.isfile(filepath)
-
-    with open(filepath, mode="a", newline="") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(headers)  # Write headers only if file does not exist
-        writer.writerows(data)
-        
-# Ensures CSV files are saved in the correct directory
-# Appends data to an existing CSV or writes a new one with headers
+TABLE_COLUMNS = {
+    "Teams": ["team_id", "team_name", "team_abbr", "league", "division"],
+    "Venues": ["venue_id", "venue_name", "location"],
+    "Games": ["game_id", "game_date", "home_team_id", "away_team_id", "home_score", "away_score", "venue_id"],
+    "Linescore": ["game_id", "inning", "home_runs", "away_runs", "home_hits", "away_hits", "home_errors", "away_errors", "home_lob", "away_lob"],
+}
+MAX_PARAMS = 2000  # SQL Server caps a statement at 2100 parameters
+MAX_ROWS_PER_INSERT = 1000  # ...and a VALUES list at 1000 rows
+
+def load_known_keys(cursor):
+    """Reads every existing team, venue and game ID once, so per-game existence probes become set lookups."""
+    known = {}
+    for table, key in (("Teams", "team_id"), ("Venues", "venue_id"), ("Games", "game_id")):
+        cursor.execute(f"SELECT {key} FROM {table}")
+        known[table] = {row[0] for row in cursor.fetchall()}
+    return known
+
+def new_batch():
+    return {table: [] for table in TABLE_COLUMNS}
+
+def write_batch(cursor, batch):
+    """Writes staged rows with multi-row INSERTs, parents before children. Returns rows written per table."""
+    written = {}
+    for table, columns in TABLE_COLUMNS.items():
+        rows = batch[table]
+        chunk = max(1, min(MAX_ROWS_PER_INSERT, MAX_PARAMS // len(columns)))
+        placeholders = "(" + ", ".join("?" for _ in columns) + ")"
+        for i in range(0, len(rows), chunk):
+            part = rows[i:i + chunk]
+            cursor.execute(f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([placeholders] * len(part))}",
+                           [val for row in part for val in row])
+        written[table] = len(rows)
+    return written
+
+# Keys are added to the cache as rows are staged, so doubleheaders and repeat opponents are only inserted once
+# One INSERT per table per date (chunked under the parameter limit) replaces a probe + insert per entity
 
 # ---------------------- #
-#  DATA INSERT FUNCTIONS #
+#  DATA STAGING FUNCTIONS #
 # ---------------------- #
-def insert_team(cursor, team, inserted_teams, teams_data):
-    """Insert team if it doesn't already exist. Track inserted teams for summary logging and CSV export."""
+def stage_team(team, known, batch, inserted_teams, teams_data):
+    """Stage team if it isn't already known. Track inserted teams for summary logging and CSV export."""
     team_id = safe_int(team.get("id"))
     team_name = team.get("name", "UNKNOWN").strip()
     team_abbr = team.get("abbreviation", team_name[:3].upper())
@@ -96,10 +236,9 @@ def insert_team(cursor, team, inserted_teams, teams_data):
     league = team.get("league", {}).get("name") or "Unknown League"
     division = team.get("division", {}).get("name") or "Unknown Division"
 
-    cursor.execute("SELECT COUNT(1) FROM Teams WHERE team_id = ?", (team_id,))
-    if cursor.fetchone()[0] == 0:
-        cursor.execute("INSERT INTO Teams (team_id, team_name, team_abbr, league, division) VALUES (?, ?, ?, ?, ?)",
-                       (team_id, team_name, team_abbr, league, division))
+    if team_id not in known["Teams"]:
+        known["Teams"].add(team_id)
+        batch["Teams"].append((team_id, team_name, team_abbr, league, division))
         inserted_teams.add(team_id)
         teams_data.add((team_id, team_name, team_abbr, league, division))
 
@@ -107,16 +246,15 @@ def insert_team(cursor, team, inserted_teams, teams_data):
 # If missing, assigns default values 
 # Prevents duplicate team inserts
 
-def insert_venue(cursor, venue, inserted_venues, venues_data):
-    """Insert venue if it doesn't already exist. Track inserted venues for summary logging and CSV export."""
+def stage_venue(venue, known, batch, inserted_venues, venues_data):
+    """Stage venue if it isn't already known. Track inserted venues for summary logging and CSV export."""
     venue_id = safe_int(venue.get("id"))
     venue_name = venue.get("name", "UNKNOWN").strip()
     location = venue.get("location", {}).get("city", "Unknown City") + ", " + venue.get("location", {}).get("state", "Unknown State")
 
-    cursor.execute("SELECT COUNT(1) FROM Venues WHERE venue_id = ?", (venue_id,))
-    if cursor.fetchone()[0] == 0:
-        cursor.execute("INSERT INTO Venues (venue_id, venue_name, location) VALUES (?, ?, ?)",
-                       (venue_id, venue_name, location))
+    if venue_id not in known["Venues"]:
+        known["Venues"].add(venue_id)
+        batch["Venues"].append((venue_id, venue_name, location))
         inserted_venues.add(venue_id)
         venues_data.add((venue_id, venue_name, location))
 
@@ -124,8 +262,8 @@ def insert_venue(cursor, venue, inserted_venues, venues_data):
 # If missing, assigns default values
 # Prevents duplicate venue inserts        
 
-def insert_game(cursor, game, games_data):
-    """Insert game into the database if it doesn't already exist, and track for CSV export."""
+def stage_game(game, known, batch, games_data):
+    """Stage game if it isn't already known, and track for CSV export. Returns True if the game is new."""
     game_id = safe_int(game.get("gamePk"))
     game_date = game.get("officialDate")
     home_team_id = safe_int(game["teams"]["home"]["team"].get("id"))
@@ -136,28 +274,24 @@ def insert_game(cursor, game, games_data):
 
     if home_score is None and away_score is None:
         log_message("WARNING", f"Skipping Game ID {game_id} - No valid scores.")
-        return
+        return False
+
+    if game_id in known["Games"]:
+        return False
 
-    cursor.execute("SELECT COUNT(1) FROM Games WHERE game_id = ?", (game_id,))
-    if cursor.fetchone()[0] == 0:
-        cursor.execute("INSERT INTO Games (game_id, game_date, home_team_id, away_team_id, home_score, away_score, venue_id) "
-                       "VALUES (?, ?, ?, ?, ?, ?, ?)", 
-                       (game_id, game_date, home_team_id, away_team_id, home_score, away_score, venue_id))
-        games_data.append((game_id, game_date, home_team_id, away_team_id, home_score, away_score, venue_id))
+    known["Games"].add(game_id)
+    batch["Games"].append((game_id, game_date, home_team_id, away_team_id, home_score, away_score, venue_id))
+    games_data.append((game_id, game_date, home_team_id, away_team_id, home_score, away_score, venue_id))
+    return True
 
 # Extracts game ID, game_date, team ID's, and scores
 # If a game's scores are missing (NULL), it is skipped - to avoid logging rainouts
 # Ensures the game is not a duplicate
 
-def insert_linescore(cursor, game, linescore_data):
-    """Insert linescore into the database and track for CSV export."""
+def stage_linescore(game, batch, linescore_data):
+    """Stage linescore rows for a newly staged game and track for CSV export."""
     game_id = safe_int(game.get("gamePk"))
 
-    cursor.execute("SELECT COUNT(1) FROM Games WHERE game_id = ?", (game_id,))
-    if cursor.fetchone()[0] == 0:
-        log_message("WARNING", f"Skipping Linescore for Game {game_id} - Game not found in Games table.")
-        return
-
     sorted_innings = sorted(game.get("linescore", {}).get("innings", []), key=lambda x: safe_int(x.get("num")))
 
     for inning in sorted_innings:
@@ -171,22 +305,202 @@ def insert_linescore(cursor, game, linescore_data):
         home_lob = safe_int(inning["home"].get("leftOnBase"))
         away_lob = safe_int(inning["away"].get("leftOnBase"))
 
-        cursor.execute("INSERT INTO Linescore (game_id, inning, home_runs, away_runs, home_hits, away_hits, home_errors, away_errors, home_lob, away_lob) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (game_id, inning_num, home_runs, away_runs, home_hits, away_hits, home_errors, away_errors, home_lob, away_lob))
-        
-        linescore_data.append((game_id, inning_num, home_runs, away_runs, home_hits, away_hits, home_errors, away_errors, home_lob, away_lob))
+        row = (game_id, inning_num, home_runs, away_runs, home_hits, away_hits, home_errors, away_errors, home_lob, away_lob)
+        batch["Linescore"].append(row)
+        linescore_data.append(row)
 
-# Extracts game ID and verifies it exists
 # Loops through each inning, capturing RUNS, HITS, ERRORS, LOB Stats
-# Logs a warning if game ID does not exist in games
+# Only called for games staged in this run, so re-running a date never duplicates innings
 # Defaults missing numerical values to NULL 
 
+# ---------------------- #
+#  SCHEDULE FETCHER      #
+# ---------------------- #
+SCHEDULE_URL = "https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={date}&hydrate=linescore,team,venue"
+RETRY_STATUS = {429, 500, 502, 503, 504}
+REQUEST_TIMEOUT = 30
+BACKOFF_BASE = 1.0
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second, bursts up to `capacity`."""
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+# Spreads requests evenly so a burst of workers can't hammer the API
+# A rate of 0 (or less) disables the limit
+
+def fixture_path(folder, date_str):
+    return os.path.join(folder, f"schedule_{date_str}.json")
+
+def load_fixture(date_str):
+    """Serves a recorded schedule. --record saves every date, game-free ones included, so a missing file is an error."""
+    if REPLAY_LATENCY:
+        time.sleep(REPLAY_LATENCY)
+    path = fixture_path(REPLAY_DIR, date_str)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No recorded fixture for {date_str} in {REPLAY_DIR}")
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def fetch_schedule(session, bucket, date_str):
+    """Fetches one day's schedule, retrying timeouts, 429s and 5xx with exponential backoff."""
+    for attempt in range(MAX_RETRIES + 1):
+        if bucket:
+            bucket.acquire()
+        if REPLAY_DIR:
+            return load_fixture(date_str)
+
+        try:
+            response = session.get(SCHEDULE_URL.format(date=date_str), timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            error = e
+        else:
+            if response.status_code not in RETRY_STATUS:
+                response.raise_for_status()
+                data = response.json()
+                if RECORD_DIR:
+                    with open(fixture_path(RECORD_DIR, date_str), "w", encoding="utf-8") as f:
+                        json.dump(data, f)
+                return data
+            error = f"HTTP {response.status_code}"
+
+        if attempt < MAX_RETRIES:
+            delay = BACKOFF_BASE * 2 ** attempt + random.uniform(0, BACKOFF_BASE)
+            print(f"Fetch for {date_str} failed ({error}); retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s")
+            time.sleep(delay)
+
+    raise RuntimeError(f"Giving up on {date_str} after {MAX_RETRIES + 1} attempts: {error}")
+
+def iter_schedules(dates):
+    """Yields (date_str, schedule or exception) in date order while up to CONCURRENCY requests run ahead."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=CONCURRENCY)
+    session.mount("https://", adapter)
+    bucket = TokenBucket(RATE_LIMIT) if RATE_LIMIT > 0 else None
+    if RECORD_DIR:
+        os.makedirs(RECORD_DIR, exist_ok=True)
+
+    pending = deque()
+    remaining = iter(dates)
+    with session, ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        try:
+            for date_str in remaining:
+                pending.append((date_str, pool.submit(fetch_schedule, session, bucket, date_str)))
+                if len(pending) >= CONCURRENCY * 2:
+                    break
+            while pending:
+                date_str, future = pending.popleft()
+                next_date = next(remaining, None)
+                if next_date:
+                    pending.append((next_date, pool.submit(fetch_schedule, session, bucket, next_date)))
+                try:
+                    yield date_str, future.result()
+                except Exception as e:
+                    yield date_str, e
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+# One keep-alive session (connection pool sized to the worker count) is shared by all workers
+# Results come back strictly in date order, so inserts stay chronological; at most 2x CONCURRENCY days are buffered
+# A date that still fails after retries is handed back as the exception so main() can log and skip it
+
+# ---------------------- #
+#  CHECKPOINT LEDGER     #
+# ---------------------- #
+def ensure_ledger(cursor):
+    """Creates the FetchProgress ledger on first use."""
+    cursor.execute("""
+        IF OBJECT_ID('FetchProgress', 'U') IS NULL
+        CREATE TABLE FetchProgress (
+            fetch_date DATE PRIMARY KEY,
+            games_inserted INT NOT NULL,
+            completed_at DATETIME NOT NULL
+        )
+    """)
+
+def load_completed_dates(cursor, start_str, end_str):
+    """Returns the dates in range that were already committed."""
+    cursor.execute("SELECT fetch_date FROM FetchProgress WHERE fetch_date BETWEEN ? AND ?", (start_str, end_str))
+    return {str(row[0])[:10] for row in cursor.fetchall()}
+
+def mark_date_complete(cursor, date_str, games_inserted):
+    """Records a processed date. Runs inside the same transaction as that date's inserts."""
+    if date_str >= datetime.date.today().isoformat():
+        return  # games today or later may not be final yet
+    if REPLAY_DIR:
+        return  # fixtures aren't the live API; a replay must not make later live runs skip real dates
+    cursor.execute("DELETE FROM FetchProgress WHERE fetch_date = ?", (date_str,))  # --refetch re-records dates
+    cursor.execute("INSERT INTO FetchProgress (fetch_date, games_inserted, completed_at) VALUES (?, ?, ?)",
+                   (date_str, games_inserted, datetime.datetime.now()))
+
+def summarize_dates(dates):
+    if len(dates) <= 6:
+        return ", ".join(dates) or "none"
+    return f"{dates[0]} ... {dates[-1]}"
+
+# A date is checkpointed in the same commit as its Teams/Venues/Games/Linescore rows, so the ledger can't run ahead of the data
+# Dates that failed to fetch are never checkpointed and are picked up by the next run
+# Today and future dates are never checkpointed because their games may still change
+# --replay runs never checkpoint, and a date with no fixture file is reported as a fetch failure rather than "no games"
+
 # ---------------------- #
 #  MAIN SCRIPT          #
 # ---------------------- #
+def benchmark_fetch(dates):
+    """Fetches every date without touching the database and reports throughput."""
+    start = time.perf_counter()
+    games = failed = 0
+    for date_str, response in iter_schedules(dates):
+        if isinstance(response, Exception):
+            failed += 1
+            print(f"Failed {date_str}: {response}")
+            continue
+        games += sum(len(d.get("games", [])) for d in response.get("dates", []))
+    elapsed = time.perf_counter() - start
+    print(f"Fetched {len(dates)} dates ({games} games, {failed} failed) in {elapsed:.2f}s "
+          f"| concurrency={CONCURRENCY}, rate={RATE_LIMIT}/s, {len(dates) / elapsed:.1f} dates/s")
+
 def main():
+    dates = [(START_DATE + timedelta(n)).strftime("%Y-%m-%d") for n in range((END_DATE - START_DATE).days + 1)]
+    if FETCH_ONLY:
+        benchmark_fetch(dates)
+        return
+
     conn = pyodbc.connect(DB_CONN_STRING)
     cursor = conn.cursor()
+    ensure_ledger(cursor)
+    conn.commit()
+
+    completed = set() if REFETCH else load_completed_dates(cursor, dates[0], dates[-1])
+    skipped = [d for d in dates if d in completed]
+    dates = [d for d in dates if d not in completed]
+    if RESUME_REPORT or skipped:
+        log_message("SUMMARY", f"Resume: {len(skipped)} dates already committed, skipping ({summarize_dates(skipped)})")
+        log_message("SUMMARY", f"Resume: {len(dates)} dates remaining ({summarize_dates(dates)})")
+    if not dates:
+        cursor.close()
+        conn.close()
+        close_log_writer()
+        return
+
+    known = load_known_keys(cursor)
 
     inserted_teams = set()
     inserted_venues = set()
@@ -201,34 +515,39 @@ def main():
 
 # Create a single folder for the entire date range instead of per-day folders
 
-    for date in (START_DATE + timedelta(n) for n in range((END_DATE - START_DATE).days + 1)):
-        date_str = date.strftime("%Y-%m-%d")
-        url = f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={date_str}&hydrate=linescore,team,venue"
-        response = requests.get(url).json()
+    for date_str, response in iter_schedules(dates):
+        if isinstance(response, Exception):
+            log_message("ERROR", f"Could not fetch {date_str}: {response}. Skipping.")
+            continue
 
         if not response.get("dates") or not response["dates"][0].get("games"):
             log_message("WARNING", f"No games found for {date_str}. Skipping.")
+            mark_date_complete(cursor, date_str, 0)
+            conn.commit()
             continue
 
 # Creates an export folder for all dates in the range
-# Iterates through each day, requests MLB data, and processes it
+# Iterates through each day in order while later days are fetched in the background
 
         games_data_api = response["dates"][0]["games"]
+        batch = new_batch()
 
-        # First pass: Insert Teams & Venues
+        # First pass: Stage Teams & Venues
         for game in games_data_api:
-            insert_team(cursor, game["teams"]["home"]["team"], inserted_teams, teams_data)
-            insert_team(cursor, game["teams"]["away"]["team"], inserted_teams, teams_data)
-            insert_venue(cursor, game["venue"], inserted_venues, venues_data)
+            stage_team(game["teams"]["home"]["team"], known, batch, inserted_teams, teams_data)
+            stage_team(game["teams"]["away"]["team"], known, batch, inserted_teams, teams_data)
+            stage_venue(game["venue"], known, batch, inserted_venues, venues_data)
 
-        conn.commit()  # Commit Teams & Venues before inserting Games
-
-        # Second pass: Insert Games & Linescore
+        # Second pass: Stage Games & Linescore
         for game in games_data_api:
-            insert_game(cursor, game, games_data)
-            insert_linescore(cursor, game, linescore_data)
+            if stage_game(game, known, batch, games_data):
+                stage_linescore(game, batch, linescore_data)
 
+        # Write the whole day in FK order: Teams, Venues, Games, Linescore
+        written = write_batch(cursor, batch)
+        mark_date_complete(cursor, date_str, written["Games"])
         conn.commit()
+        log_message("INFO", f"{date_str}: inserted {written['Games']} games, {written['Linescore']} linescore rows")
 
     # Save CSVs if required
     if EXPORT_CSV:
@@ -238,6 +557,17 @@ def main():
         save_to_csv(export_folder, "Linescore.csv", linescore_data, ["game_id", "inning", "home_runs", "away_runs", "home_hits", "away_hits", "home_errors", "away_errors", "home_lob", "away_lob"])
         log_message("SUMMARY", f"CSV files saved in {export_folder}")
 
+    # Save Parquet datasets if required
+    if EXPORT_PARQUET:
+        parquet_folder = os.path.join(export_folder, "parquet")
+        game_dates = {game[0]: game[1] for game in games_data}
+        save_to_parquet(parquet_folder, "Teams", teams_data)
+        save_to_parquet(parquet_folder, "Venues", venues_data)
+        save_to_parquet(parquet_folder, "Games", games_data, partition_by="game_date")
+        save_to_parquet(parquet_folder, "Linescore", [(row[0], game_dates[row[0]]) + row[1:] for row in linescore_data],
+                        partition_by="game_date")
+        log_message("SUMMARY", f"Parquet datasets saved in {parquet_folder}")
+
     # Log summary
     if inserted_teams:
         log_message("SUMMARY", f"Inserted {len(inserted_teams)} new teams.")
@@ -246,6 +576,7 @@ def main():
 
     cursor.close()
     conn.close()
+    close_log_writer()
 
 if __name__ == "__main__":
     main()
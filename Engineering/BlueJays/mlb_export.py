@@ -0,0 +1,88 @@
+import csv # writes fetched data into CSV files
+import os # file paths and directory creation
+import uuid # unique part-file names so repeated exports append instead of overwrite
+import datetime
+
+# ---------------------- #
+#  SAVE TO CSV FUNCTION  #
+# ---------------------- #
+def save_to_csv(base_folder, filename, data, headers):
+    """Writes data to a CSV file within the specified folder."""
+    filepath = os.path.join(base_folder, filename)
+    file_exists = os.path.isfile(filepath)
+
+    with open(filepath, mode="a", newline="") as f:
+        writer = csv.writer(f)
+        if not file_exists:
+            writer.writerow(headers)  # Write headers only if file does not exist
+        writer.writerows(data)
+
+# Ensures CSV files are saved in the correct directory
+# Appends data to an existing CSV or writes a new one with headers
+
+# ---------------------- #
+#  PARQUET EXPORT        #
+# ---------------------- #
+def parquet_schema(table_name):
+    """Typed Arrow schema per table; repeated text (team names, leagues, divisions) is dictionary-encoded."""
+    import pyarrow as pa
+
+    label = pa.dictionary(pa.int32(), pa.string())
+    schemas = {
+        "Teams": [("team_id", pa.int32()), ("team_name", label), ("team_abbr", label),
+                  ("league", label), ("division", label)],
+        "Venues": [("venue_id", pa.int32()), ("venue_name", pa.string()), ("location", pa.string())],
+        "Games": [("game_id", pa.int32()), ("game_date", pa.date32()), ("home_team_id", pa.int32()),
+                  ("away_team_id", pa.int32()), ("home_score", pa.int16()), ("away_score", pa.int16()),
+                  ("venue_id", pa.int32())],
+        "Linescore": [("game_id", pa.int32()), ("game_date", pa.date32()), ("inning", pa.int16()),
+                      ("home_runs", pa.int16()), ("away_runs", pa.int16()), ("home_hits", pa.int16()),
+                      ("away_hits", pa.int16()), ("home_errors", pa.int16()), ("away_errors", pa.int16()),
+                      ("home_lob", pa.int16()), ("away_lob", pa.int16())],
+    }
+    return pa.schema(schemas[table_name])
+
+def save_to_parquet(base_folder, table_name, data, partition_by=None):
+    """
+    Writes rows (tuples in schema order) as a Parquet dataset in base_folder/table_name.
+    partition_by names a date column; files are hive-partitioned by its month (game_month=YYYY-MM).
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+
+    schema = parquet_schema(table_name)
+    rows = list(data)
+    columns = list(zip(*rows)) if rows else [()] * len(schema)
+
+    arrays = []
+    for field, values in zip(schema, columns):
+        if pa.types.is_date32(field.type):
+            values = [datetime.date.fromisoformat(v) if isinstance(v, str) else v for v in values]
+        arrays.append(pa.array(values, type=field.type))
+    table = pa.Table.from_arrays(arrays, schema=schema)
+
+    partitioning = None
+    if partition_by:
+        # Month folders keep files large enough to read efficiently; daily folders hold ~15 games each
+        month_field = partition_by.replace("_date", "_month")
+        months = pa.array([d.strftime("%Y-%m") if d else None for d in table.column(partition_by).to_pylist()], pa.string())
+        table = table.append_column(month_field, months)
+        partitioning = ds.partitioning(pa.schema([(month_field, pa.string())]), flavor="hive")
+
+    ds.write_dataset(
+        table,
+        os.path.join(base_folder, table_name),
+        format="parquet",
+        partitioning=partitioning,
+        basename_template=f"part-{uuid.uuid4().hex[:8]}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    return table.num_rows
+
+# Each table becomes a folder of Parquet files; Games and Linescore get one game_month=YYYY-MM folder per month
+# game_date stays a typed column inside the files, so date filters still skip row groups
+# Every export writes new part files, so re-running a range appends like the CSV export does
+# Integer columns keep their types (no re-parsing text), and dates are real DATE values
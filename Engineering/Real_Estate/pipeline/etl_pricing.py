@@ -4,6 +4,7 @@
 import pandas as pd
 import numpy as np
 import pyodbc
+import argparse
 import sys
 import os
 
@@ -19,8 +20,19 @@ from pipeline.observability import (
     log_row_insertion,
     log_row_count_check,
     log_error,
-    log_event
+    log_event,
+    log_observability_time,
+    flush_events,
+    get_observability_seconds,
+    log_churn
 )
+from pipeline.fanout import fan_out, fan_out_reload
+from pipeline.incremental import row_keys, sync_target
+
+parser = argparse.ArgumentParser(description="Load housing.csv into the local and Azure pricing tables.")
+parser.add_argument("--full", action="store_true",
+                    help="DELETE and reload every row instead of syncing only changed rows")
+args = parser.parse_args()
 
 # ----------------------------------------
 # 2. SQL Connections (Local + Azure)
@@ -31,8 +43,6 @@ conn_local = pyodbc.connect(
     "DATABASE=RealEstate;"
     "Trusted_Connection=yes;"
 )
-cursor_local = conn_local.cursor()
-cursor_local.fast_executemany = True
 
 conn_cloud = pyodbc.connect(
     "DRIVER={ODBC Driver 17 for SQL Server};"
@@ -41,8 +51,6 @@ conn_cloud = pyodbc.connect(
     "UID=azure-admin;"
     "PWD=Slowhall123!;"
 )
-cursor_cloud = conn_cloud.cursor()
-cursor_cloud.fast_executemany = True
 
 try:
     # ----------------------------------------
@@ -53,6 +61,7 @@ try:
     df.columns = df.columns.str.lower().str.replace(" ", "_")
     log_source_load(conn_local, df, file_path, "pricing")
     log_source_load(conn_cloud, df, file_path, "pricing")
+    flush_events()
 
     # ----------------------------------------
     # 4. Null Check
@@ -60,6 +69,7 @@ try:
     required_cols = ['price', 'area', 'bedrooms', 'bathrooms', 'stories', 'parking']
     log_null_check(conn_local, df, required_cols, "pricing")
     log_null_check(conn_cloud, df, required_cols, "pricing")
+    flush_events()
 
     # ----------------------------------------
     # 5. Transform Data
@@ -71,6 +81,7 @@ try:
     transformed_cols = yes_no_cols + ["price_per_sqft", "has_aircon_and_heat"]
     log_transformation(conn_local, transformed_cols, "pricing")
     log_transformation(conn_cloud, transformed_cols, "pricing")
+    flush_events()
 
     final_cols = [
         'price', 'area', 'bedrooms', 'bathrooms', 'stories',
@@ -104,6 +115,7 @@ try:
     if valid:
         log_schema_validation(conn_local, message, "pricing")
         log_schema_validation(conn_cloud, message, "pricing")
+        flush_events()
     else:
         raise ValueError(message)
 
@@ -111,56 +123,59 @@ try:
     # 7. Insert into Both SQL Servers
     # ----------------------------------------
 
-    # Clear existing rows in both tables before inserting new ones
-    cursor_local.execute("DELETE FROM pricing")
-    conn_local.commit()
-    log_event(conn_local, "pricing", "truncate", "Cleared existing rows before insert")
-
-    cursor_cloud.execute("DELETE FROM pricing")
-    conn_cloud.commit()
-    log_event(conn_cloud, "pricing", "truncate", "Cleared existing rows before insert")
-
     # Prepare insert statement
     insert_sql = """
         INSERT INTO pricing (
             price, area, bedrooms, bathrooms, stories,
             mainroad, guestroom, basement, hotwaterheating, airconditioning,
-            parking, prefarea, furnishingstatus, price_per_sqft, has_aircon_and_heat
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            parking, prefarea, furnishingstatus, price_per_sqft, has_aircon_and_heat,
+            row_key
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     """
 
-    # Count rows before insert
-    cursor_local.execute("SELECT COUNT(*) FROM pricing")
-    before_local = cursor_local.fetchone()[0]
-    cursor_cloud.execute("SELECT COUNT(*) FROM pricing")
-    before_cloud = cursor_cloud.fetchone()[0]
-
-    # Insert
-    cursor_local.executemany(insert_sql, df.values.tolist())
-    conn_local.commit()
+    targets = {"local": conn_local, "cloud": conn_cloud}
+    rows = df.values.tolist()
+    keys = row_keys(df)
 
-    cursor_cloud.executemany(insert_sql, df.values.tolist())
-    conn_cloud.commit()
-
-    # Count rows after insert
-    cursor_local.execute("SELECT COUNT(*) FROM pricing")
-    after_local = cursor_local.fetchone()[0]
-    cursor_cloud.execute("SELECT COUNT(*) FROM pricing")
-    after_cloud = cursor_cloud.fetchone()[0]
-
-    # Log insert counts
-    log_row_insertion(conn_local, after_local - before_local, "pricing")
-    log_row_insertion(conn_cloud, after_cloud - before_cloud, "pricing")
-    log_row_count_check(conn_local, before_local, after_local, "pricing")
-    log_row_count_check(conn_cloud, before_cloud, after_cloud, "pricing")
+    if args.full:
+        # Clear + reload both targets concurrently; commits only if both succeed
+        keyed_rows = [row + [key] for row, key in zip(rows, keys)]
+        results = fan_out_reload(targets, "pricing", insert_sql, keyed_rows)
+    else:
+        # Only insert/delete rows whose row_key changed since the last run
+        results = fan_out(targets, sync_target, "pricing", final_cols, rows, keys)
+
+    # Log insert counts and per-target timing
+    for name, conn in targets.items():
+        stats = results[name]
+        if args.full:
+            log_event(conn, "pricing", "truncate", "Cleared existing rows before insert")
+            log_row_insertion(conn, stats["after"] - stats["before"], "pricing")
+        else:
+            log_row_insertion(conn, stats["inserted"], "pricing")
+            log_churn(conn, stats, "pricing")
+        log_row_count_check(conn, stats["before"], stats["after"], "pricing")
+        log_event(
+            conn, "pricing", "load_timing",
+            f"{name}: insert {stats['insert_seconds']:.2f}s, commit {stats['commit_seconds']:.2f}s, "
+            f"total {stats['total_seconds'] + stats['commit_seconds']:.2f}s"
+        )
+
+    # Report how long logging itself took this run
+    log_observability_time(conn_local, "pricing")
+    log_observability_time(conn_cloud, "pricing")
+    flush_events()
+    print(f"Observability overhead: {get_observability_seconds():.3f}s")
 
 except Exception as e:
     log_error(conn_local, "pricing", "etl_pricing", str(e))
     log_error(conn_cloud, "pricing", "etl_pricing", str(e))
+    try:
+        flush_events()
+    except Exception as flush_err:
+        print(f"Failed to flush error events: {flush_err}")
     raise
 
 finally:
-    cursor_local.close()
     conn_local.close()
-    cursor_cloud.close()
     conn_cloud.close()
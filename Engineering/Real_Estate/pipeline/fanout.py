@@ -0,0 +1,162 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# -------------------------------
+# Fan-out Writer
+# -------------------------------
+# Runs the same reload against several target databases at once, so total
+# load time is bounded by the slowest target instead of the sum of all targets.
+# Commit policy: nothing is committed until every target has finished its writes;
+# if any target fails, every target is rolled back. The commits themselves are
+# best-effort (there is no two-phase commit across databases): if one target's
+# commit fails, targets not yet committed are rolled back and the error names the
+# targets that did commit, since those can no longer be undone.
+
+def _progress(name, message):
+    print(f"[{name}] {message}")
+
+def reload_target(name, conn, table_name, insert_sql, rows):
+    """
+    Clears and reloads one target inside an open transaction (no commit).
+    Returns row counts and per-step timings for that target.
+    """
+    start = time.perf_counter()
+    cursor = conn.cursor()
+    if hasattr(cursor, "fast_executemany"):
+        cursor.fast_executemany = True
+
+    cursor.execute(f"DELETE FROM {table_name}")
+    _progress(name, f"cleared {table_name}")
+
+    cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+    before = cursor.fetchone()[0]
+
+    insert_start = time.perf_counter()
+    cursor.executemany(insert_sql, rows)
+    insert_seconds = time.perf_counter() - insert_start
+    _progress(name, f"inserted {len(rows)} rows in {insert_seconds:.2f}s")
+
+    cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+    after = cursor.fetchone()[0]
+    cursor.close()
+
+    return {
+        "before": before,
+        "after": after,
+        "insert_seconds": insert_seconds,
+        "total_seconds": time.perf_counter() - start,
+    }
+
+def fan_out(targets, task, *args):
+    """
+    Runs task(name, conn, *args) on every connection in `targets` ({name: conn})
+    concurrently. Returns {name: stats} once all targets are committed; raises
+    after rolling every target back if any of them fails. If a commit fails, the
+    remaining targets are rolled back and the RuntimeError lists which targets
+    had already committed.
+    """
+    results, errors = {}, {}
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        futures = {
+            name: pool.submit(task, name, conn, *args)
+            for name, conn in targets.items()
+        }
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+                _progress(name, f"failed: {e}")
+
+    if errors:
+        for name, conn in targets.items():
+            try:
+                conn.rollback()
+                _progress(name, "rolled back")
+            except Exception as rollback_err:
+                _progress(name, f"rollback failed: {rollback_err}")
+        failed = ", ".join(f"{name}: {err}" for name, err in errors.items())
+        raise RuntimeError(f"Fan-out load failed, all targets rolled back ({failed})")
+
+    committed = []
+    for name, conn in targets.items():
+        commit_start = time.perf_counter()
+        try:
+            conn.commit()
+        except Exception as commit_err:
+            _progress(name, f"commit failed: {commit_err}")
+            for other, other_conn in targets.items():
+                if other in committed:
+                    continue
+                try:
+                    other_conn.rollback()
+                    _progress(other, "rolled back")
+                except Exception as rollback_err:
+                    _progress(other, f"rollback failed: {rollback_err}")
+            raise RuntimeError(
+                f"Fan-out commit failed on {name} ({commit_err}); "
+                f"already committed: {', '.join(committed) or 'none'}; all other targets rolled back"
+            ) from commit_err
+        committed.append(name)
+        results[name]["commit_seconds"] = time.perf_counter() - commit_start
+        _progress(name, f"committed | total {results[name]['total_seconds']:.2f}s")
+
+    return results
+
+def fan_out_reload(targets, table_name, insert_sql, rows):
+    """
+    Clears and reloads `table_name` on every target (see fan_out).
+    """
+    return fan_out(targets, reload_target, table_name, insert_sql, rows)
+
+# -------------------------------
+# Local Check (two SQLite stand-ins)
+# -------------------------------
+if __name__ == "__main__":
+    import sqlite3
+
+    insert_sql = "INSERT INTO pricing (price, area) VALUES (?, ?)"
+    rows = [(1000 + i, 50 + i) for i in range(10000)]
+
+    def make_target():
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute("CREATE TABLE pricing (price INT, area INT)")
+        conn.execute("INSERT INTO pricing VALUES (1, 1)")
+        conn.commit()
+        return conn
+
+    targets = {"local": make_target(), "cloud": make_target()}
+    stats = fan_out_reload(targets, "pricing", insert_sql, rows)
+    assert all(s["after"] == len(rows) for s in stats.values())
+    print("✅ Both targets reloaded:", {k: v["after"] for k, v in stats.items()})
+
+    # A failing target must leave every target untouched
+    broken = {"local": make_target(), "cloud": make_target()}
+    broken["cloud"].execute("DROP TABLE pricing")
+    try:
+        fan_out_reload(broken, "pricing", insert_sql, rows)
+    except RuntimeError as e:
+        print(f"✅ {e}")
+    assert broken["local"].execute("SELECT COUNT(*) FROM pricing").fetchone()[0] == 1
+    print("✅ Local target unchanged after cloud failure")
+
+    # A commit failure after the first target committed is reported, and the rest are rolled back
+    class CommitFails:
+        def __init__(self, conn):
+            self.conn = conn
+        def cursor(self):
+            return self.conn.cursor()
+        def rollback(self):
+            self.conn.rollback()
+        def commit(self):
+            raise sqlite3.OperationalError("connection lost")
+
+    local, cloud, backup = make_target(), make_target(), make_target()
+    try:
+        fan_out_reload({"local": local, "cloud": CommitFails(cloud), "backup": backup}, "pricing", insert_sql, rows)
+    except RuntimeError as e:
+        print(f"✅ {e}")
+    assert local.execute("SELECT COUNT(*) FROM pricing").fetchone()[0] == len(rows)
+    assert backup.execute("SELECT COUNT(*) FROM pricing").fetchone()[0] == 1
+    print("✅ Partial commit reported; uncommitted targets rolled back")
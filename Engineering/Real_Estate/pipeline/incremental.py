@@ -0,0 +1,79 @@
+import time
+import hashlib
+
+# -------------------------------
+# Incremental Sync
+# -------------------------------
+# housing.csv has no business key, so each row is keyed by a hash of its
+# content plus an occurrence number (identical rows stay distinct). The key is
+# stored in pricing.row_key under a unique index, which doubles as the
+# key/hash index: a changed row shows up as one delete plus one insert, and a
+# run against an unchanged source only reads the key column.
+
+KEY_COLUMN = "row_key"
+DELETE_BATCH_SIZE = 500
+
+def row_keys(df):
+    """
+    Returns one SHA-1 key per row of df (order preserved).
+    """
+    content = df.astype(str).apply("|".join, axis=1)
+    occurrence = content.groupby(content).cumcount().astype(str)
+    return [hashlib.sha1(f"{c}#{n}".encode("utf-8")).hexdigest() for c, n in zip(content, occurrence)]
+
+def diff_keys(source_keys, stored_keys):
+    """
+    Splits keys into (to_insert, to_delete, unchanged_count).
+    """
+    source, stored = set(source_keys), set(stored_keys)
+    return source - stored, stored - source, len(source & stored)
+
+def sync_target(name, conn, table_name, columns, rows, keys):
+    """
+    Brings one target in line with the source inside an open transaction (no commit).
+    rows are lists in `columns` order, keys the matching row_keys().
+    Returns churn counts and timings, shaped like fanout.reload_target().
+    """
+    start = time.perf_counter()
+    cursor = conn.cursor()
+    if hasattr(cursor, "fast_executemany"):
+        cursor.fast_executemany = True
+
+    cursor.execute(f"SELECT {KEY_COLUMN} FROM {table_name}")
+    stored_keys = [r[0] for r in cursor.fetchall()]
+    before = len(stored_keys)
+    # Rows loaded before row_key existed have NULL keys and are always replaced
+    legacy = sum(k is None for k in stored_keys)
+    to_insert, to_delete, unchanged = diff_keys(keys, [k for k in stored_keys if k is not None])
+
+    insert_start = time.perf_counter()
+    if legacy:
+        cursor.execute(f"DELETE FROM {table_name} WHERE {KEY_COLUMN} IS NULL")
+
+    doomed = list(to_delete)
+    for i in range(0, len(doomed), DELETE_BATCH_SIZE):
+        batch = doomed[i:i + DELETE_BATCH_SIZE]
+        placeholders = ", ".join("?" for _ in batch)
+        cursor.execute(f"DELETE FROM {table_name} WHERE {KEY_COLUMN} IN ({placeholders})", batch)
+
+    if to_insert:
+        new_rows = [list(row) + [key] for row, key in zip(rows, keys) if key in to_insert]
+        placeholders = ", ".join("?" for _ in range(len(columns) + 1))
+        insert_sql = f"INSERT INTO {table_name} ({', '.join(columns)}, {KEY_COLUMN}) VALUES ({placeholders})"
+        cursor.executemany(insert_sql, new_rows)
+    insert_seconds = time.perf_counter() - insert_start
+    cursor.close()
+
+    deleted = len(to_delete) + legacy
+    after = before - deleted + len(to_insert)
+
+    print(f"[{name}] +{len(to_insert)} inserted, -{deleted} deleted, {unchanged} unchanged")
+    return {
+        "before": before,
+        "after": after,
+        "inserted": len(to_insert),
+        "deleted": deleted,
+        "unchanged": unchanged,
+        "insert_seconds": insert_seconds,
+        "total_seconds": time.perf_counter() - start,
+    }
@@ -1,33 +1,105 @@
 import pandas as pd
-import inspect
 import os
+import sys
+import time
 import traceback
-from datetime import datetime
 import pyodbc
 
 # -------------------------------
-# Log Helper
+# Event Buffer
 # -------------------------------
+# Events are queued per connection and written by flush_events() as one
+# multi-row INSERT, instead of an INSERT + commit per event.
+# Timestamps stay on the server clock (GETDATE(), as when each event was its
+# own INSERT): a buffered event is written as GETDATE() minus its age, so the
+# Azure target keeps its own time zone and every event keeps its real time.
+EVENT_COLUMNS = "(table_name, type, timestamp, description, source_script)"
+EVENT_VALUES = "(?, ?, DATEADD(millisecond, -?, GETDATE()), ?, ?)"
+MAX_ROWS_PER_INSERT = 400  # 5 params per row, SQL Server allows 2100 per statement
+
+_event_buffers = {}        # id(conn) -> (conn, [rows])
+_obs_seconds = 0.0         # time spent inside observability this run
+
 def log_event(conn, table_name, event_type, description, source_script=None):
+    global _obs_seconds
+    start = time.perf_counter()
     if source_script is None:
         source_script = get_caller_filename()
 
+    _, rows = _event_buffers.setdefault(id(conn), (conn, []))
+    rows.append((table_name, event_type, time.monotonic(), description, source_script))
+    _obs_seconds += time.perf_counter() - start
+
+def _write_events(conn, rows):
     cursor = conn.cursor()
-    cursor.execute("""
-    INSERT INTO event_log (table_name, type, timestamp, description, source_script)
-    VALUES (?, ?, GETDATE(), ?, ?)
-""", (table_name, event_type, description, source_script))
-    conn.commit()
-    cursor.close()
+    try:
+        now = time.monotonic()
+        for i in range(0, len(rows), MAX_ROWS_PER_INSERT):
+            batch = rows[i:i + MAX_ROWS_PER_INSERT]
+            values = ", ".join([EVENT_VALUES] * len(batch))
+            params = []
+            for table_name, event_type, logged_at, description, source_script in batch:
+                age_ms = int((now - logged_at) * 1000)
+                params += [table_name, event_type, age_ms, description, source_script]
+            cursor.execute(f"INSERT INTO event_log {EVENT_COLUMNS} VALUES {values}", params)
+        conn.commit()
+    finally:
+        cursor.close()
+
+def flush_events(conn=None):
+    """
+    Writes buffered events for one connection (or all of them), committing each
+    target on its own. A target that fails is rolled back and keeps its events
+    buffered for the next flush; the other targets are still written. Raises
+    after all targets were tried if any failed. Returns the number of events written.
+    """
+    global _obs_seconds
+    start = time.perf_counter()
+    targets = [_event_buffers.pop(id(conn), (conn, []))] if conn is not None else list(_event_buffers.values())
+    if conn is None:
+        _event_buffers.clear()
+
+    written, errors = 0, []
+    for target, rows in targets:
+        if not rows:
+            continue
+        try:
+            _write_events(target, rows)
+            written += len(rows)
+        except Exception as e:
+            try:
+                target.rollback()
+            except Exception:
+                pass
+            # Put the events back ahead of any logged since
+            _, pending = _event_buffers.setdefault(id(target), (target, []))
+            pending[:0] = rows
+            errors.append(e)
+
+    _obs_seconds += time.perf_counter() - start
+    if errors:
+        raise RuntimeError(
+            f"Failed to flush events to {len(errors)} target(s); their events stay buffered: {errors}"
+        ) from errors[0]
+    return written
+
+def get_observability_seconds():
+    return _obs_seconds
+
+def reset_observability_timer():
+    global _obs_seconds
+    _obs_seconds = 0.0
 
 # -------------------------------
 # Utility: Caller File
 # -------------------------------
 def get_caller_filename():
+    # Walk back to the first frame outside this module (cheap vs. inspect.stack())
     try:
-        frame = inspect.stack()[2]
-        path = frame.filename
-        return os.path.basename(path)
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        return os.path.basename(frame.f_code.co_filename) if frame is not None else "unknown"
     except Exception:
         return "unknown"
 
@@ -97,3 +169,20 @@ def log_row_count_check(conn, before, after, table_name):
 def log_error(conn, table_name, stage, err):
     desc = f"Error in stage {stage}: {str(err)}"
     log_event(conn, table_name, "error", desc)
+
+# -------------------------------
+# 8. Observability Overhead
+# -------------------------------
+def log_observability_time(conn, table_name):
+    desc = f"Time spent in observability this run: {get_observability_seconds():.3f}s"
+    log_event(conn, table_name, "observability", desc)
+
+# -------------------------------
+# 9. Churn Report (incremental loads)
+# -------------------------------
+def log_churn(conn, stats, table_name):
+    desc = (
+        f"Inserted: {stats['inserted']}, Deleted: {stats['deleted']}, "
+        f"Unchanged: {stats['unchanged']}"
+    )
+    log_event(conn, table_name, "churn", desc)
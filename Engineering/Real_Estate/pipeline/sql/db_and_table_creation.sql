@@ -24,7 +24,8 @@ CREATE TABLE pricing (
     prefarea BIT,
     furnishingstatus VARCHAR(50),
     price_per_sqft FLOAT,
-    has_aircon_and_heat BIT
+    has_aircon_and_heat BIT,
+    row_key CHAR(40)
 );
 GO
 
@@ -45,3 +46,8 @@ CREATE NONCLUSTERED INDEX idx_furnishingstatus ON pricing (furnishingstatus);
 CREATE NONCLUSTERED INDEX idx_mainroad_guestroom ON pricing (mainroad, guestroom);
 CREATE NONCLUSTERED INDEX idx_prefarea_parking ON pricing (prefarea, parking);
 
+-- Step 6: Row key index used by incremental loads (etl_pricing.py without --full)
+IF COL_LENGTH('pricing', 'row_key') IS NULL
+ALTER TABLE pricing ADD row_key CHAR(40);
+GO
+CREATE UNIQUE NONCLUSTERED INDEX ux_pricing_row_key ON pricing (row_key) WHERE row_key IS NOT NULL;